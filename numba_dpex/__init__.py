@@ -104,6 +104,9 @@ from numba_dpex.core.kernel_interface.indexers import (  # noqa E402
     NdRange,
     Range,
 )
+from numba_dpex.core.kernel_interface.local_accessor import (  # noqa E402
+    LocalAccessor,
+)
 
 # Re-export all type names
 from numba_dpex.core.types import *  # noqa E402
@@ -126,10 +129,17 @@ if config.HAS_NON_HOST_DEVICE:
         get_local_size,
         get_num_groups,
         get_work_dim,
+        group,
         local,
         mem_fence,
+        memory_order,
+        memory_scope,
         private,
+        sub_group,
         sub_group_barrier,
+        unroll,
+        vload,
+        vstore,
     )
 
     DEFAULT_LOCAL_SIZE = []
@@ -145,4 +155,4 @@ from numba_dpex._version import get_versions  # noqa E402
 __version__ = get_versions()["version"]
 del get_versions
 
-__all__ = types.__all__ + ["Range", "NdRange"]
+__all__ = types.__all__ + ["Range", "NdRange", "LocalAccessor"]
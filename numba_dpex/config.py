@@ -66,7 +66,7 @@ DUMP_KERNEL_LLVM = _readenv("NUMBA_DPEX_DUMP_KERNEL_LLVM", int, 0)
 DUMP_KERNEL_LAUNCHER = _readenv("NUMBA_DPEX_DUMP_KERNEL_LAUNCHER", int, 0)
 
 # Enables debug printf messages inside the kernel launcher module generated for
-# a kernel decorated function
+# a kernel decorated function and inside the code that launches a parfor
 DEBUG_KERNEL_LAUNCHER = _readenv("NUMBA_DPEX_DEBUG_KERNEL_LAUNCHER", int, 0)
 
 # configs for caching
@@ -83,6 +83,13 @@ ENABLE_CACHE = _readenv("NUMBA_DPEX_ENABLE_CACHE", int, 1)
 # Capacity of the cache, execute it like:
 #   NUMBA_DPEX_CACHE_SIZE=20 python <code>
 CACHE_SIZE = _readenv("NUMBA_DPEX_CACHE_SIZE", int, 128)
+# Maximum number of variants of a kernel that are compiled for distinct values
+# of its compile-time constant arguments and, if requested, array shapes.
+# Further variants are dispatched to the generic kernel, execute it like:
+#   NUMBA_DPEX_KERNEL_MAX_SPECIALIZATIONS=4 python <code>
+KERNEL_MAX_SPECIALIZATIONS = _readenv(
+    "NUMBA_DPEX_KERNEL_MAX_SPECIALIZATIONS", int, 16
+)
 
 TESTING_SKIP_NO_DPNP = _readenv("NUMBA_DPEX_TESTING_SKIP_NO_DPNP", int, 0)
 TESTING_SKIP_NO_DEBUGGING = _readenv(
@@ -98,3 +105,19 @@ DPEX_OPT = _readenv("NUMBA_DPEX_OPT", int, 2)
 INLINE_THRESHOLD = _readenv("NUMBA_DPEX_INLINE_THRESHOLD", int, None)
 
 USE_MLIR = _readenv("NUMBA_DPEX_USE_MLIR", int, 0)
+
+# Number of worker threads used to translate the kernels generated for the
+# parfors of a dpjit function to SPIR-V and to build them for the device.
+# Setting the variable to 0 builds every kernel synchronously.
+#   NUMBA_DPEX_NUM_KERNEL_BUILD_THREADS=0 python <code>
+NUM_KERNEL_BUILD_THREADS = _readenv(
+    "NUMBA_DPEX_NUM_KERNEL_BUILD_THREADS", int, min(8, os.cpu_count() or 1)
+)
+
+# Parfors of a dpjit function whose arrays are all allocated in host-accessible
+# USM, i.e., with the "shared" or "host" usm_type, are executed on the host
+# with Numba's parallel backend instead of being offloaded if their trip count
+# is below the threshold. The trip count is checked at run time. Setting the
+# variable to 0 always offloads the parfors.
+#   NUMBA_DPEX_PARFOR_HOST_THRESHOLD=4096 python <code>
+PARFOR_HOST_THRESHOLD = _readenv("NUMBA_DPEX_PARFOR_HOST_THRESHOLD", int, 0)
@@ -26,6 +26,10 @@ SPIR_DATA_LAYOUT = {
 
 
 class SPIRVCodeLibrary(CPUCodeLibrary):
+    # The optimization level of the library, set per kernel. If None, the
+    # NUMBA_DPEX_OPT config variable is used.
+    opt_level = None
+
     def _optimize_functions(self, ll_module):
         pass
 
@@ -34,10 +38,13 @@ class SPIRVCodeLibrary(CPUCodeLibrary):
         pmb = ll.PassManagerBuilder()
 
         # Make optimization level depending on config.DPEX_OPT variable
-        pmb.opt_level = config.DPEX_OPT
-        if config.DPEX_OPT > 2:
+        opt_level = (
+            config.DPEX_OPT if self.opt_level is None else self.opt_level
+        )
+        pmb.opt_level = opt_level
+        if opt_level > 2:
             logging.warning(
-                "Setting NUMBA_DPEX_OPT greater than 2 known to cause issues "
+                "Setting the opt level greater than 2 known to cause issues "
                 + "related to very aggressive optimizations that leads to "
                 + "broken code."
             )
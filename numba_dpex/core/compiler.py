@@ -2,11 +2,13 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import namedtuple
 from types import FunctionType
 
 from numba.core import compiler, ir
 from numba.core import types as numba_types
 from numba.core.compiler_lock import global_compiler_lock
+from numba.core.cpu import FastMathOptions
 
 from numba_dpex import config
 from numba_dpex.core.exceptions import (
@@ -15,6 +17,117 @@ from numba_dpex.core.exceptions import (
 )
 from numba_dpex.core.pipelines.kernel_compiler import KernelCompiler
 
+# The code generation options of a kernel or a device function. The options
+# are hashable so that they can be a part of the cache keys.
+DpexCompileFlags = namedtuple(
+    "DpexCompileFlags", ["fastmath", "math_builtins", "opt_level"]
+)
+
+# Prefixes of the OpenCL builtins that math functions can be mapped to.
+_math_builtins = ("native", "half")
+
+
+def make_compile_flags(fastmath=False, math_builtins=None, opt_level=None):
+    """Validates the code generation options of a kernel or a device function.
+
+    Args:
+        fastmath: Either a bool to enable all LLVM fast-math flags, or a set
+            of the flags, e.g., ``{"nnan", "contract"}``, that are added to the
+            floating point instructions.
+        math_builtins (str): If set to ``"native"`` or ``"half"``, the single
+            precision math functions that have a ``native_*`` or ``half_*``
+            OpenCL builtin are mapped to it.
+        opt_level (int): The LLVM optimization level. Defaults to
+            ``numba_dpex.config.DPEX_OPT``.
+
+    Raises:
+        ValueError: If an option has an unsupported value.
+
+    Returns: A DpexCompileFlags object.
+    """
+    fastmath = tuple(sorted(FastMathOptions(fastmath).flags))
+
+    if math_builtins is not None and math_builtins not in _math_builtins:
+        raise ValueError(
+            f'Unsupported math_builtins "{math_builtins}", expected one of '
+            + ", ".join(_math_builtins)
+            + "."
+        )
+
+    if opt_level is not None and opt_level not in range(4):
+        raise ValueError(
+            f'Unsupported opt_level "{opt_level}", expected 0, 1, 2 or 3.'
+        )
+
+    return DpexCompileFlags(fastmath, math_builtins, opt_level)
+
+
+# The attributes of a kernel that are emitted as metadata of the spir_kernel
+# function and translated to SPIR-V execution modes.
+DpexKernelAttributes = namedtuple(
+    "DpexKernelAttributes",
+    ["reqd_work_group_size", "work_group_size_hint", "reqd_sub_group_size"],
+)
+
+
+def _normalize_work_group_size(name, size):
+    if size is None:
+        return None
+    if isinstance(size, int):
+        size = (size,)
+    size = tuple(size)
+    if not (
+        1 <= len(size) <= 3 and all(isinstance(v, int) and v > 0 for v in size)
+    ):
+        raise ValueError(
+            f'Unsupported {name} "{size}", expected one to three positive '
+            "integers."
+        )
+    return size
+
+
+def make_kernel_attributes(
+    reqd_work_group_size=None,
+    work_group_size_hint=None,
+    reqd_sub_group_size=None,
+):
+    """Validates the attributes of a kernel.
+
+    The work-group sizes are given in the order of the dimensions of the
+    ``numba_dpex.Range`` that the kernel is launched with.
+
+    Args:
+        reqd_work_group_size: An int or a tuple of up to three ints. The
+            kernel can only be launched with this local range.
+        work_group_size_hint: An int or a tuple of up to three ints. The
+            local range that the kernel is most likely launched with.
+        reqd_sub_group_size (int): The sub-group size the kernel has to be
+            compiled for.
+
+    Raises:
+        ValueError: If an attribute has an unsupported value.
+
+    Returns: A DpexKernelAttributes object.
+    """
+    reqd_work_group_size = _normalize_work_group_size(
+        "reqd_work_group_size", reqd_work_group_size
+    )
+    work_group_size_hint = _normalize_work_group_size(
+        "work_group_size_hint", work_group_size_hint
+    )
+
+    if reqd_sub_group_size is not None and not (
+        isinstance(reqd_sub_group_size, int) and reqd_sub_group_size > 0
+    ):
+        raise ValueError(
+            f'Unsupported reqd_sub_group_size "{reqd_sub_group_size}", '
+            "expected a positive integer."
+        )
+
+    return DpexKernelAttributes(
+        reqd_work_group_size, work_group_size_hint, reqd_sub_group_size
+    )
+
 
 @global_compiler_lock
 def compile_with_dpex(
@@ -35,7 +148,8 @@ def compile_with_dpex(
     Args:
         args: The list of arguments passed to the kernel.
         debug (bool): Optional flag to turn on debug mode compilation.
-        extra_compile_flags: Extra flags passed to the compiler.
+        extra_compile_flags (DpexCompileFlags): Optional code generation
+            options for the function.
 
     Returns:
         cres: Compiled result.
@@ -59,6 +173,15 @@ def compile_with_dpex(
     if debug:
         flags.debuginfo = debug
 
+    if extra_compile_flags is None:
+        extra_compile_flags = make_compile_flags()
+    if extra_compile_flags.fastmath:
+        flags.fastmath = set(extra_compile_flags.fastmath)
+    if extra_compile_flags.math_builtins:
+        targetctx = targetctx.subtarget(
+            math_builtins=extra_compile_flags.math_builtins
+        )
+
     # Run compilation pipeline
     if isinstance(pyfunc, FunctionType):
         cres = compiler.compile_extra(
@@ -96,6 +219,7 @@ def compile_with_dpex(
         )
     # Linking depending libraries
     library = cres.library
+    library.opt_level = extra_compile_flags.opt_level
     library.finalize()
 
     return cres
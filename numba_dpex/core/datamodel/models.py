@@ -14,6 +14,7 @@ from ..types import (
     DpctlSyclEvent,
     DpctlSyclQueue,
     DpnpNdArray,
+    LocalAccessorType,
     NdRangeType,
     RangeType,
     USMNdArray,
@@ -95,6 +96,51 @@ class USMArrayModel(StructModel):
         return _get_flattened_member_count(self)
 
 
+class LocalAccessorModel(StructModel):
+    """The data model of a local accessor kernel argument.
+
+    The model has the same members as the USMArrayModel, so that a local
+    accessor can be used as any other array inside a kernel. Only the data
+    pointer is in the local address space. A local pointer kernel argument
+    is allocated by the SYCL runtime at kernel launch and the other pointer
+    members, which are never dereferenced, stay in the global address space,
+    so that they can be passed as regular kernel arguments.
+    """
+
+    def __init__(self, dmm, fe_type):
+        ndim = fe_type.ndim
+        members = [
+            (
+                "meminfo",
+                types.CPointer(fe_type.dtype, addrspace=address_space.GLOBAL),
+            ),
+            (
+                "parent",
+                types.CPointer(types.pyobject, addrspace=address_space.GLOBAL),
+            ),
+            ("nitems", types.intp),
+            ("itemsize", types.intp),
+            (
+                "data",
+                types.CPointer(fe_type.dtype, addrspace=fe_type.addrspace),
+            ),
+            (
+                "sycl_queue",
+                types.CPointer(types.void, addrspace=address_space.GLOBAL),
+            ),
+            ("shape", types.UniTuple(types.intp, ndim)),
+            ("strides", types.UniTuple(types.intp, ndim)),
+        ]
+        super(LocalAccessorModel, self).__init__(dmm, fe_type, members)
+
+    @property
+    def flattened_field_count(self):
+        """Return the number of fields in an instance of a
+        LocalAccessorModel.
+        """
+        return _get_flattened_member_count(self)
+
+
 class DpnpNdArrayModel(StructModel):
     """Data model for the DpnpNdArray type.
 
@@ -265,6 +311,11 @@ def _init_data_model_manager() -> datamodel.DataModelManager:
     # manager. The dpex_data_model_manager is used by the DpexKernelTarget
     dmm.register(DpnpNdArray, USMArrayModel)
 
+    # Register the LocalAccessorType type to LocalAccessorModel in numba_dpex's
+    # data model manager. The dpex_data_model_manager is used by the
+    # DpexKernelTarget
+    dmm.register(LocalAccessorType, LocalAccessorModel)
+
     # Register the DpctlSyclQueue type to SyclQueueModel in numba_dpex's data
     # model manager. The dpex_data_model_manager is used by the DpexKernelTarget
     dmm.register(DpctlSyclQueue, SyclQueueModel)
@@ -386,3 +386,66 @@ class UnsupportedParforError(Exception):
         if extra_msg:
             self.message += " due to " + extra_msg
         super().__init__(self.message)
+
+
+class InvalidKernelConstantError(Exception):
+    """Exception raised when a kernel argument that was declared as a
+    compile-time constant is passed a value that cannot be specialized on.
+
+    A constant kernel argument has to be a Python scalar, i.e., a bool, an int
+    or a float, and if the argument is annotated with ``typing.Literal`` the
+    value has to be one of the values listed in the annotation.
+
+    Args:
+        kernel_name (str): Name of kernel where the error was raised.
+        arg_name (str): Name of the constant kernel argument.
+        value: The value passed for the argument.
+    """
+
+    def __init__(self, kernel_name, arg_name, value) -> None:
+        self.message = (
+            f'Kernel "{kernel_name}" cannot be specialized on the value '
+            f'"{value}" of the constant argument "{arg_name}".'
+        )
+        super().__init__(self.message)
+
+
+class UnmatchedRequiredWorkGroupSizeError(Exception):
+    """Exception raised when a kernel that has a required work-group size is
+    launched with a different local range.
+
+    Args:
+        kernel_name (str): Name of kernel where the error was raised.
+        local_range (list): The local range of the launch.
+        reqd_work_group_size (tuple): The required work-group size.
+    """
+
+    def __init__(self, kernel_name, local_range, reqd_work_group_size) -> None:
+        self.message = (
+            f'Kernel "{kernel_name}" requires a work-group size of '
+            f"{reqd_work_group_size}, but it is launched with a local range "
+            f"of {local_range}."
+        )
+        super().__init__(self.message)
+
+
+class UnsupportedSubGroupSizeError(Exception):
+    """Exception raised when a kernel that requires a sub-group size is
+    launched on a device that does not support it.
+
+    Args:
+        kernel_name (str): Name of kernel where the error was raised.
+        sub_group_size (int): The required sub-group size.
+        supported_sub_group_sizes (list): The sub-group sizes supported by the
+            device.
+    """
+
+    def __init__(
+        self, kernel_name, sub_group_size, supported_sub_group_sizes
+    ) -> None:
+        self.message = (
+            f'Kernel "{kernel_name}" requires a sub-group size of '
+            f"{sub_group_size}, which is not supported by the device. The "
+            f"supported sub-group sizes are {supported_sub_group_sizes}."
+        )
+        super().__init__(self.message)
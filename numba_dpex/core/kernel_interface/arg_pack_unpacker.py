@@ -5,13 +5,14 @@
 import ctypes
 import logging
 
+import dpctl
 import dpctl.memory as dpctl_mem
 import numpy as np
 from numba.core import types
 
 import numba_dpex.utils as utils
 from numba_dpex.core.exceptions import UnsupportedKernelArgumentError
-from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.types import LocalAccessorType, USMNdArray
 from numba_dpex.core.utils import get_info_from_suai
 
 
@@ -63,6 +64,59 @@ class Packer:
 
         return unpacked_array_attrs
 
+    def _unpack_local_accessor(self, val):
+        """Flattens a LocalAccessor into ctypes objects to be passed as
+        kernel arguments.
+
+        The data pointer of the accessor is passed as a dpctl.LocalAccessor
+        so that the SYCL runtime allocates the local memory of every
+        work-group at kernel launch.
+
+        Args:
+            val : An object of numba_dpex.LocalAccessor type.
+
+        Raises:
+            UnsupportedKernelArgumentError: If dpctl does not support local
+            accessor kernel arguments.
+
+        Returns:
+            list: A list of ctype objects representing the flattened local
+            accessor
+        """
+        if not hasattr(dpctl, "LocalAccessor"):
+            raise UnsupportedKernelArgumentError(
+                "LocalAccessor (requires a newer dpctl)",
+                val,
+                self._pyfunc_name,
+            )
+
+        unpacked_accessor_attrs = []
+        itemsize = val.dtype.itemsize
+
+        # meminfo
+        unpacked_accessor_attrs.append(ctypes.c_size_t(0))
+        # parent
+        unpacked_accessor_attrs.append(ctypes.c_size_t(0))
+        unpacked_accessor_attrs.append(ctypes.c_longlong(val.size))
+        unpacked_accessor_attrs.append(ctypes.c_longlong(itemsize))
+        unpacked_accessor_attrs.append(
+            dpctl.LocalAccessor(val.dtype.str[1:], val.shape)
+        )
+        # queue: unused and passed as void*
+        unpacked_accessor_attrs.append(ctypes.c_size_t(0))
+        for dim in val.shape:
+            unpacked_accessor_attrs.append(ctypes.c_longlong(dim))
+        # The accessor is C-contiguous
+        stride = itemsize
+        strides = []
+        for dim in reversed(val.shape):
+            strides.append(stride)
+            stride *= dim
+        for stride in reversed(strides):
+            unpacked_accessor_attrs.append(ctypes.c_longlong(stride))
+
+        return unpacked_accessor_attrs
+
     def _unpack_argument(self, ty, val):
         """
         Unpack a Python object into one or more ctype values using Numba's
@@ -81,6 +135,12 @@ class Packer:
 
         if isinstance(ty, USMNdArray):
             return self._unpack_usm_array(val)
+        elif isinstance(ty, LocalAccessorType):
+            return self._unpack_local_accessor(val)
+        elif isinstance(ty, types.Omitted):
+            # Compile-time constant arguments are folded into the kernel and
+            # are not passed to it.
+            return []
         elif ty == types.int64:
             return ctypes.c_longlong(val)
         elif ty == types.uint64:
@@ -2,35 +2,42 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import numbers
+import typing
 from collections.abc import Iterable
 from inspect import signature
 from warnings import warn
 
 import dpctl
 import dpctl.program as dpctl_prog
-from numba.core import sigutils
+from numba.core import sigutils, types
+from numba.core.errors import NumbaPerformanceWarning
 from numba.core.types import Array as NpArrayType
 from numba.core.types import void
 
 from numba_dpex import NdRange, Range, config
 from numba_dpex.core.caching import LRUCache, NullCache
+from numba_dpex.core.compiler import make_compile_flags, make_kernel_attributes
 from numba_dpex.core.descriptor import dpex_kernel_target
 from numba_dpex.core.exceptions import (
     IllegalRangeValueError,
+    InvalidKernelConstantError,
     InvalidKernelLaunchArgsError,
     InvalidKernelSpecializationError,
     KernelHasReturnValueError,
     MissingSpecializationError,
     UnknownGlobalRangeError,
     UnmatchedNumberOfRangeDimsError,
+    UnmatchedRequiredWorkGroupSizeError,
     UnsupportedBackendError,
     UnsupportedGroupWorkItemSizeError,
     UnsupportedNumberOfRangeDimsError,
+    UnsupportedSubGroupSizeError,
     UnsupportedWorkItemSizeError,
 )
 from numba_dpex.core.kernel_interface.arg_pack_unpacker import Packer
 from numba_dpex.core.kernel_interface.spirv_kernel import SpirvKernel
-from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.types import LocalAccessorType, USMNdArray
 from numba_dpex.core.utils import (
     build_key,
     create_func_hash,
@@ -50,6 +57,24 @@ class JitKernel:
     SPIR-V binary format device functions for level-zero and opencl backends
     are supported.
 
+    Arguments that are listed in ``constants`` or annotated with
+    ``typing.Literal`` are compile-time constants: the kernel is compiled for
+    every distinct value of these arguments with the value folded into it,
+    and the arguments are not passed to the device. If ``specialize_shapes``
+    is set, the kernel is also compiled for every distinct shape of its array
+    arguments. At most ``max_specializations`` such variants are compiled,
+    further calls use a generic kernel that reads the values at run time.
+
+    The ``fastmath``, ``math_builtins`` and ``opt_level`` options control the
+    code generation of the kernel and ``build_options`` are passed to the
+    driver when the SPIR-V module is built for a device. All of them are a
+    part of the cache keys.
+
+    The ``reqd_work_group_size``, ``work_group_size_hint`` and
+    ``reqd_sub_group_size`` attributes are emitted into the kernel for the
+    backend to allocate registers and pick the SIMD width. A kernel with a
+    required work-group or sub-group size is checked to be launched with a
+    matching local range on a device that supports the sub-group size.
     """
 
     # The list of SYCL backends supported by the Dispatcher
@@ -62,11 +87,28 @@ class JitKernel:
         compile_flags=None,
         specialization_sigs=None,
         enable_cache=True,
+        constants=None,
+        specialize_shapes=False,
+        max_specializations=None,
+        fastmath=False,
+        math_builtins=None,
+        opt_level=None,
+        build_options=None,
+        reqd_work_group_size=None,
+        work_group_size_hint=None,
+        reqd_sub_group_size=None,
     ):
         self.typingctx = dpex_kernel_target.typing_context
         self.pyfunc = pyfunc
         self.debug_flags = debug_flags
-        self.compile_flags = compile_flags
+        self.compile_flags = compile_flags or make_compile_flags(
+            fastmath=fastmath, math_builtins=math_builtins, opt_level=opt_level
+        )
+        self.kernel_attributes = make_kernel_attributes(
+            reqd_work_group_size=reqd_work_group_size,
+            work_group_size_hint=work_group_size_hint,
+            reqd_sub_group_size=reqd_sub_group_size,
+        )
         self.kernel_name = pyfunc.__name__
 
         self._global_range = None
@@ -74,6 +116,14 @@ class JitKernel:
 
         self._func_hash = create_func_hash(pyfunc)
 
+        # compile-time constant arguments and array shapes
+        self._constant_args = self._get_constant_args(constants)
+        self._specialize_shapes = specialize_shapes
+        if max_specializations is None:
+            max_specializations = config.KERNEL_MAX_SPECIALIZATIONS
+        self._max_specializations = max_specializations
+        self._specialized_variants = set()
+
         # caching related attributes
         if not config.ENABLE_CACHE:
             self._cache = NullCache()
@@ -94,12 +144,27 @@ class JitKernel:
             self._kernel_bundle_cache = NullCache()
         self._cache_hits = 0
 
-        if debug_flags or config.DPEX_OPT == 0:
+        if self.compile_flags.opt_level is None:
+            opt_level = config.DPEX_OPT
+        else:
+            opt_level = self.compile_flags.opt_level
+        if debug_flags or opt_level == 0:
             # if debug is ON we need to pass additional
             # flags to igc.
             self._create_sycl_kernel_bundle_flags = ["-g", "-cl-opt-disable"]
         else:
             self._create_sycl_kernel_bundle_flags = []
+        if isinstance(build_options, str):
+            build_options = build_options.split()
+        self._create_sycl_kernel_bundle_flags.extend(build_options or [])
+
+        # The code generation and build options, and the kernel attributes are
+        # a part of every cache key.
+        self._build_options_key = (
+            self.compile_flags,
+            tuple(self._create_sycl_kernel_bundle_flags),
+            self.kernel_attributes,
+        )
 
         # Specialization of kernel based on signatures. If specialization
         # signatures are found, they are compiled ahead of time and cached.
@@ -129,7 +194,96 @@ class JitKernel:
     def cache_hits(self):
         return self._cache_hits
 
-    def _compile_and_cache(self, argtypes, cache, key=None):
+    def _get_constant_args(self, constants):
+        """Returns a dict mapping the index of every compile-time constant
+        argument of the kernel to its name and the values or types allowed by
+        its ``typing.Literal`` annotation, if any.
+        """
+        params = signature(self.pyfunc).parameters
+        constants = set(constants or ())
+        unknown = constants.difference(params)
+        if unknown:
+            raise ValueError(
+                f'Kernel "{self.kernel_name}" has no arguments named '
+                + ", ".join(sorted(unknown))
+                + " that can be declared as constants."
+            )
+
+        constant_args = {}
+        for i, (name, param) in enumerate(params.items()):
+            if typing.get_origin(param.annotation) is typing.Literal:
+                constant_args[i] = (name, typing.get_args(param.annotation))
+            elif name in constants:
+                constant_args[i] = (name, ())
+
+        return constant_args
+
+    def _check_constant(self, name, allowed, val):
+        """Checks that val can be used as the value of the constant argument
+        name.
+        """
+        if isinstance(val, numbers.Real) and (
+            not allowed
+            or any(
+                isinstance(val, a) if isinstance(a, type) else val == a
+                for a in allowed
+            )
+        ):
+            return
+
+        raise InvalidKernelConstantError(self.kernel_name, name, val)
+
+    def _specialize_argtypes(self, args, argtypes):
+        """Specializes the argument types of a kernel call on the values of its
+        constant arguments and optionally on the shapes of its arrays.
+
+        The type of a constant argument is replaced by a ``types.Omitted``
+        type so that the value is lowered as a constant and the argument is
+        removed from the kernel signature.
+
+        Returns:
+            A tuple of the specialized argument types, a dict mapping the
+            index of every array argument to its shape, and a hashable
+            description of the variant that is added to the cache keys. If the
+            number of variants reached ``max_specializations``, the argument
+            types are returned as they are.
+        """
+        if self._has_specializations or not (
+            self._constant_args or self._specialize_shapes
+        ):
+            return argtypes, None, None
+
+        specialized_argtypes = list(argtypes)
+        constant_values = []
+        for i, (name, allowed) in self._constant_args.items():
+            val = args[i]
+            self._check_constant(name, allowed, val)
+            specialized_argtypes[i] = types.Omitted(val)
+            # The type is part of the key, as Omitted(1) == Omitted(1.0).
+            constant_values.append((i, type(val), val))
+
+        arg_shapes = {}
+        if self._specialize_shapes:
+            for i, argty in enumerate(argtypes):
+                if isinstance(argty, USMNdArray):
+                    arg_shapes[i] = tuple(args[i].shape)
+
+        variant = (tuple(constant_values), tuple(arg_shapes.items()))
+        if variant not in self._specialized_variants:
+            if len(self._specialized_variants) >= self._max_specializations:
+                warn(
+                    f'Kernel "{self.kernel_name}" reached the maximum number '
+                    f"of {self._max_specializations} specialized variants. "
+                    "The generic kernel is launched instead.",
+                    NumbaPerformanceWarning,
+                    stacklevel=3,
+                )
+                return argtypes, None, None
+            self._specialized_variants.add(variant)
+
+        return specialized_argtypes, arg_shapes, variant
+
+    def _compile_and_cache(self, argtypes, cache, key=None, arg_shapes=None):
         """Helper function to compile the Python function or Numba FunctionIR
         object passed to a JitKernel and store it in an internal cache.
         """
@@ -144,6 +298,8 @@ class JitKernel:
             target_ctx=targetctx,
             debug=self.debug_flags,
             compile_flags=self.compile_flags,
+            arg_shapes=arg_shapes,
+            kernel_attributes=self.kernel_attributes,
         )
 
         device_driver_ir_module = kernel.device_driver_ir_module
@@ -152,8 +308,14 @@ class JitKernel:
         if not key:
             stripped_argtypes = strip_usm_metadata(argtypes)
             codegen_magic_tuple = kernel.target_context.codegen().magic_tuple()
+            # Kernels specialized on signatures are never specialized on
+            # constant arguments, i.e., the variant part of the key is None.
             key = build_key(
-                stripped_argtypes, codegen_magic_tuple, self._func_hash
+                stripped_argtypes,
+                codegen_magic_tuple,
+                self._func_hash,
+                self._build_options_key,
+                None,
             )
 
         cache.put(key, (device_driver_ir_module, kernel_module_name))
@@ -186,7 +348,7 @@ class JitKernel:
 
             # Check if a non-USMNdArray Array type is passed to the kernel
             if isinstance(argtype, NpArrayType) and not isinstance(
-                argtype, USMNdArray
+                argtype, (USMNdArray, LocalAccessorType)
             ):
                 unsupported_argnum_list.append(i)
             elif isinstance(argtype, USMNdArray):
@@ -265,6 +427,50 @@ class JitKernel:
                     work_items=local_range[i],
                 )
 
+    def _check_kernel_attributes(self, device):
+        """Checks if the kernel can be launched with the requested range on a
+        device given its required work-group and sub-group size.
+        """
+        reqd_work_group_size = self.kernel_attributes.reqd_work_group_size
+        if reqd_work_group_size:
+            # The range values are stored inverted, see github issue #889.
+            ndims = max(len(self._global_range), len(reqd_work_group_size))
+            reqd_size = list(reqd_work_group_size) + [1] * (
+                ndims - len(reqd_work_group_size)
+            )
+            if self._local_range:
+                local_range = list(self._local_range)[::-1]
+                local_range += [1] * (ndims - len(local_range))
+                if local_range != reqd_size:
+                    raise UnmatchedRequiredWorkGroupSizeError(
+                        kernel_name=self.kernel_name,
+                        local_range=list(self._local_range)[::-1],
+                        reqd_work_group_size=reqd_work_group_size,
+                    )
+            else:
+                # The runtime has to pick the required work-group size.
+                global_range = list(self._global_range)[::-1]
+                global_range += [1] * (ndims - len(global_range))
+                for i in range(ndims):
+                    if global_range[i] % reqd_size[i] != 0:
+                        raise UnsupportedGroupWorkItemSizeError(
+                            kernel_name=self.kernel_name,
+                            dim=i,
+                            work_groups=global_range[i],
+                            work_items=reqd_size[i],
+                        )
+
+        reqd_sub_group_size = self.kernel_attributes.reqd_sub_group_size
+        if (
+            reqd_sub_group_size is not None
+            and reqd_sub_group_size not in device.sub_group_sizes
+        ):
+            raise UnsupportedSubGroupSizeError(
+                kernel_name=self.kernel_name,
+                sub_group_size=reqd_sub_group_size,
+                supported_sub_group_sizes=list(device.sub_group_sizes),
+            )
+
     def __getitem__(self, args):
         """Mimic's ``numba.cuda`` square-bracket notation for configuring the
         global_range and local_range settings when launching a kernel on a
@@ -401,6 +607,7 @@ class JitKernel:
                 local_range=self._local_range,
                 device=device,
             )
+        self._check_kernel_attributes(device)
 
     def __call__(self, *args):
         """Functor to launch a kernel."""
@@ -427,12 +634,22 @@ class JitKernel:
                 self.kernel_name, backend, JitKernel._supported_backends
             )
 
+        argtypes, arg_shapes, variant = self._specialize_argtypes(
+            args, argtypes
+        )
+
         # Generate key used for cache lookup
         stripped_argtypes = strip_usm_metadata(argtypes)
         codegen_magic_tuple = (
             dpex_kernel_target.target_context.codegen().magic_tuple()
         )
-        key = build_key(stripped_argtypes, codegen_magic_tuple, self._func_hash)
+        key = build_key(
+            stripped_argtypes,
+            codegen_magic_tuple,
+            self._func_hash,
+            self._build_options_key,
+            variant,
+        )
 
         # If the JitKernel was specialized then raise exception if argtypes
         # do not match one of the specialized versions.
@@ -453,11 +670,19 @@ class JitKernel:
                     device_driver_ir_module,
                     kernel_module_name,
                 ) = self._compile_and_cache(
-                    argtypes=argtypes, cache=self._cache, key=key
+                    argtypes=argtypes,
+                    cache=self._cache,
+                    key=key,
+                    arg_shapes=arg_shapes,
                 )
 
         kernel_bundle_key = build_key(
-            stripped_argtypes, codegen_magic_tuple, exec_queue, self._func_hash
+            stripped_argtypes,
+            codegen_magic_tuple,
+            exec_queue,
+            self._func_hash,
+            self._build_options_key,
+            variant,
         )
 
         artifact = self._kernel_bundle_cache.get(kernel_bundle_key)
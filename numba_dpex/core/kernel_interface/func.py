@@ -8,7 +8,7 @@ from numba.core.typing.templates import AbstractTemplate, ConcreteTemplate
 
 from numba_dpex import config
 from numba_dpex.core.caching import LRUCache, NullCache
-from numba_dpex.core.compiler import compile_with_dpex
+from numba_dpex.core.compiler import compile_with_dpex, make_compile_flags
 from numba_dpex.core.descriptor import dpex_kernel_target
 from numba_dpex.core.utils import (
     build_key,
@@ -31,16 +31,19 @@ class DpexFunction(object):
     the function is invoked.
     """
 
-    def __init__(self, pyfunc, debug=False):
+    def __init__(self, pyfunc, debug=False, compile_flags=None):
         """Constructor for `DpexFunction`
 
         Args:
             pyfunc (`function`): A python function to be compiled.
             debug (`bool`, optional): Debug option for compilation.
                 Defaults to `False`.
+            compile_flags (`DpexCompileFlags`, optional): Code generation
+                options for compilation. Defaults to `None`.
         """
         self._pyfunc = pyfunc
         self._debug = debug
+        self._compile_flags = compile_flags
 
     def compile(self, arg_types, return_types):
         """The actual compilation function.
@@ -63,6 +66,7 @@ class DpexFunction(object):
             args=arg_types,
             is_kernel=False,
             debug=self._debug,
+            extra_compile_flags=self._compile_flags,
         )
         func = cres.library.get_function(cres.fndesc.llvm_func_name)
         cres.target_context.set_spir_func_calling_conv(func)
@@ -78,7 +82,9 @@ class DpexFunctionTemplate(object):
     calling convention.
     """
 
-    def __init__(self, pyfunc, debug=False, enable_cache=True):
+    def __init__(
+        self, pyfunc, debug=False, enable_cache=True, compile_flags=None
+    ):
         """Constructor for `DpexFunctionTemplate`
 
         Args:
@@ -87,10 +93,13 @@ class DpexFunctionTemplate(object):
                 Defaults to `False`.
             enable_cache (bool, optional): Flag to turn on/off caching.
                 Defaults to `True`.
+            compile_flags (DpexCompileFlags, optional): Code generation
+                options for compilation. Defaults to `None`.
         """
         self._pyfunc = pyfunc
         self._debug = debug
         self._enable_cache = enable_cache
+        self._compile_flags = compile_flags or make_compile_flags()
 
         self._func_hash = create_func_hash(pyfunc)
 
@@ -141,7 +150,12 @@ class DpexFunctionTemplate(object):
         codegen_magic_tuple = (
             dpex_kernel_target.target_context.codegen().magic_tuple()
         )
-        key = build_key(stripped_argtypes, codegen_magic_tuple, self._func_hash)
+        key = build_key(
+            stripped_argtypes,
+            codegen_magic_tuple,
+            self._func_hash,
+            self._compile_flags,
+        )
 
         cres = self._cache.get(key)
         if cres is None:
@@ -155,6 +169,7 @@ class DpexFunctionTemplate(object):
                 args=args,
                 is_kernel=False,
                 debug=self._debug,
+                extra_compile_flags=self._compile_flags,
             )
             func = cres.library.get_function(cres.fndesc.llvm_func_name)
             cres.target_context.set_spir_func_calling_conv(func)
@@ -165,7 +180,7 @@ class DpexFunctionTemplate(object):
         return cres.signature
 
 
-def compile_func(pyfunc, signature, debug=False):
+def compile_func(pyfunc, signature, debug=False, compile_flags=None):
     """Compiles a specialized `numba_dpex.func`
 
     Compiles a specialized `numba_dpex.func` decorated function to native binary
@@ -176,13 +191,15 @@ def compile_func(pyfunc, signature, debug=False):
         pyfunc (`function`): A python function to be compiled.
         signature (`list`): A list of `numba.core.typing.templates.Signature`'s
         debug (`bool`, optional): Debug options. Defaults to `False`.
+        compile_flags (`DpexCompileFlags`, optional): Code generation options.
+            Defaults to `None`.
 
     Returns:
         `numba_dpex.core.kernel_interface.func.DpexFunction`: A `DpexFunction`
          object
     """
 
-    devfn = DpexFunction(pyfunc, debug=debug)
+    devfn = DpexFunction(pyfunc, debug=debug, compile_flags=compile_flags)
 
     cres = []
     for sig in signature:
@@ -204,7 +221,9 @@ def compile_func(pyfunc, signature, debug=False):
     return devfn
 
 
-def compile_func_template(pyfunc, debug=False, enable_cache=True):
+def compile_func_template(
+    pyfunc, debug=False, enable_cache=True, compile_flags=None
+):
     """Converts a `numba_dpex.func` function to an `AbstractTemplate`
 
     Converts a `numba_dpex.func` decorated function to a Numba
@@ -219,6 +238,8 @@ def compile_func_template(pyfunc, debug=False, enable_cache=True):
     Args:
         pyfunc (`function`): A python function to be compiled.
         debug (`bool`, optional): Debug options. Defaults to `False`.
+        compile_flags (`DpexCompileFlags`, optional): Code generation options.
+            Defaults to `None`.
 
     Raises:
         `AssertionError`: Raised if keyword arguments are supplied in
@@ -229,7 +250,12 @@ def compile_func_template(pyfunc, debug=False, enable_cache=True):
             A `DpexFunctionTemplate` object.
     """
 
-    dft = DpexFunctionTemplate(pyfunc, debug=debug, enable_cache=enable_cache)
+    dft = DpexFunctionTemplate(
+        pyfunc,
+        debug=debug,
+        enable_cache=enable_cache,
+        compile_flags=compile_flags,
+    )
 
     class _function_template(AbstractTemplate):
         unsafe_casting = False
@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Iterable
+
+import numpy as np
+
+
+class LocalAccessor:
+    """A kernel argument that allocates work-group local memory at kernel
+    launch.
+
+    A LocalAccessor mimics the behavior of ``sycl::local_accessor``. Every
+    work-group of a kernel launch gets its own allocation of ``shape``
+    elements of ``dtype`` that is shared by the work-items of the
+    work-group. Inside the kernel, the argument is a C-contiguous array in
+    the local address space. Unlike ``numba_dpex.local.array``, the shape is
+    not part of the compiled kernel, so a kernel can be launched with
+    different local memory sizes, e.g., for tuned work-group sizes, without
+    being recompiled.
+    """
+
+    # The element types of local accessors supported by dpctl
+    _supported_dtypes = frozenset(
+        np.dtype(dt)
+        for dt in (
+            np.int8,
+            np.uint8,
+            np.int16,
+            np.uint16,
+            np.int32,
+            np.uint32,
+            np.int64,
+            np.uint64,
+            np.float32,
+            np.float64,
+        )
+    )
+
+    def __init__(self, shape, dtype):
+        """Constructs a 1, 2, or 3 dimensional local accessor.
+
+        Args:
+            shape (int or tuple of int): The number of elements in every
+                dimension.
+            dtype: The element type, a NumPy dtype or anything convertible to
+                one.
+
+        Raises:
+            TypeError: If the shape is not a tuple of 1 to 3 positive ints.
+            TypeError: If the dtype is not supported.
+        """
+        if not isinstance(shape, Iterable):
+            shape = (shape,)
+        shape = tuple(shape)
+        if not (
+            1 <= len(shape) <= 3
+            and all(isinstance(dim, int) and dim > 0 for dim in shape)
+        ):
+            raise TypeError(
+                "The shape of a LocalAccessor must be 1 to 3 positive ints."
+            )
+
+        dtype = np.dtype(dtype)
+        if dtype not in LocalAccessor._supported_dtypes:
+            raise TypeError(f"Unsupported LocalAccessor dtype {dtype}.")
+
+        self._shape = shape
+        self._dtype = dtype
+
+    @property
+    def shape(self):
+        return self._shape
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def ndim(self):
+        return len(self._shape)
+
+    @property
+    def size(self):
+        """Returns the number of elements of the local accessor."""
+        size = 1
+        for dim in self._shape:
+            size *= dim
+        return size
+
+    def __repr__(self):
+        return f"LocalAccessor(shape={self._shape}, dtype={self._dtype})"
@@ -28,6 +28,8 @@ class SpirvKernel(KernelInterface):
             path was executed.
         """
         self._llvm_module = None
+        self._llvm_bitcode = None
+        self._llvm_spirv_args = None
         self._device_driver_ir_module = None
         self._module_name = None
         self._pyfunc_name = func_name
@@ -106,6 +108,9 @@ class SpirvKernel(KernelInterface):
         args,
         debug,
         compile_flags,
+        generate_device_driver_ir=True,
+        arg_shapes=None,
+        kernel_attributes=None,
     ):
         """Compiles a kernel using numba_dpex.core.compiler.Compiler.
 
@@ -113,6 +118,13 @@ class SpirvKernel(KernelInterface):
             args (_type_): _description_
             debug (_type_): _description_
             compile_flags (_type_): _description_
+            generate_device_driver_ir (bool): If False, the translation of
+                the LLVM IR module to SPIR-V is deferred until
+                ``generate_device_driver_ir`` is called.
+            arg_shapes (dict): Optional mapping of the indices of array
+                arguments to the shapes on which the kernel is specialized.
+            kernel_attributes (DpexKernelAttributes): Optional work-group and
+                sub-group size attributes of the kernel.
         """
 
         logging.debug("compiling SpirvKernel with arg types", args)
@@ -134,10 +146,11 @@ class SpirvKernel(KernelInterface):
 
         func = cres.library.get_function(cres.fndesc.llvm_func_name)
         kernel = cres.target_context.prepare_spir_kernel(
-            func, cres.signature.args
+            func, cres.signature.args, arg_shapes, kernel_attributes
         )
         cres.library._optimize_final_module()
         self._llvm_module = kernel.module.__str__()
+        self._llvm_bitcode = kernel.module.as_bitcode()
         self._module_name = kernel.name
 
         # Dump LLVM IR if DEBUG flag is set.
@@ -154,11 +167,33 @@ class SpirvKernel(KernelInterface):
             ) as f:
                 f.write(self._llvm_module)
 
+        # The extra llvm-spirv arguments are set on the shared target context
+        # for the kernel being compiled, so they have to be read now even if
+        # the translation to SPIR-V is deferred.
+        self._llvm_spirv_args = spirv_generator.consume_llvm_spirv_args(
+            self._target_context
+        )
+
+        if generate_device_driver_ir:
+            self.generate_device_driver_ir()
+
+    def generate_device_driver_ir(self):
+        """Translates the compiled LLVM IR module of the kernel to SPIR-V.
+
+        The translation does not depend on any Numba state and can be run
+        outside of the compiler lock, e.g., on a worker thread.
+        """
+        if not self._llvm_module:
+            raise UncompiledKernelError(self._pyfunc_name)
+
         # FIXME: There is no need to serialize the bitcode. It can be passed to
         # llvm-spirv directly via stdin.
 
         # FIXME: There is no need for spirv-dis. We cause use --to-text
         # (or --spirv-text) to convert SPIRV to text
         self._device_driver_ir_module = spirv_generator.llvm_to_spirv(
-            self._target_context, self._llvm_module, kernel.module.as_bitcode()
+            self._target_context,
+            self._llvm_module,
+            self._llvm_bitcode,
+            self._llvm_spirv_args,
         )
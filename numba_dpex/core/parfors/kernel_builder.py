@@ -3,8 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import ctypes
 import sys
+import threading
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import dpctl
 import dpctl.program as dpctl_prog
@@ -62,6 +65,94 @@ def _print_body(body_dict):
         _print_block(block)
 
 
+class SyclKernelBuild:
+    """A SYCL kernel whose translation to SPIR-V and device build may still be
+    running on a worker thread.
+
+    The host function that launches the kernel does not embed the address of
+    the SYCL kernel, but loads it from a slot owned by the SyclKernelBuild
+    instance. The slot is filled by :meth:`wait` once the build has finished,
+    which has to happen before the host function is executed.
+
+    The kernel is launched on the queue it was built with, so the kernel
+    bundle and the launch queue always share the same SYCL context. The
+    SyclKernelBuild keeps the queue alive for as long as the kernel is used.
+    """
+
+    def __init__(self, future, sycl_queue):
+        self._future = future
+        self._sycl_queue = sycl_queue
+        self._sycl_kernel = None
+        self._kernel_ref_slot = ctypes.c_void_p(0)
+
+    @property
+    def queue_ref_address(self):
+        """The address of the DPCTLSyclQueueRef of the queue the kernel is
+        built with and launched on.
+        """
+        return self._sycl_queue.addressof_ref()
+
+    @property
+    def kernel_ref_slot_address(self):
+        """The address of the slot storing the DPCTLSyclKernelRef."""
+        return ctypes.addressof(self._kernel_ref_slot)
+
+    def wait(self):
+        """Waits for the build to finish and stores the address of the built
+        SYCL kernel in the kernel reference slot.
+
+        Returns: The built dpctl.program.SyclKernel object
+        """
+        if self._sycl_kernel is None:
+            self._sycl_kernel = self._future.result()
+            self._kernel_ref_slot.value = self._sycl_kernel.addressof_ref()
+
+        return self._sycl_kernel
+
+
+_kernel_build_pool = None
+_kernel_build_pool_size = 0
+_kernel_build_pool_lock = threading.Lock()
+
+
+def _get_kernel_build_pool():
+    """Returns the thread pool used to build the parfor kernels.
+
+    The pool is re-created if ``config.NUM_KERNEL_BUILD_THREADS`` changed since
+    it was created. The builds submitted to the previous pool still complete.
+    """
+    global _kernel_build_pool, _kernel_build_pool_size
+
+    num_threads = config.NUM_KERNEL_BUILD_THREADS
+    with _kernel_build_pool_lock:
+        if _kernel_build_pool is None or _kernel_build_pool_size != num_threads:
+            if _kernel_build_pool is not None:
+                _kernel_build_pool.shutdown(wait=False)
+            _kernel_build_pool = ThreadPoolExecutor(
+                max_workers=num_threads,
+                thread_name_prefix="dpex_kernel_build",
+            )
+            _kernel_build_pool_size = num_threads
+
+    return _kernel_build_pool
+
+
+def _build_sycl_kernel(sycl_queue, kernel, build_flags):
+    """Translates a compiled kernel to SPIR-V and builds it for the device of
+    the queue. The function does not depend on any Numba state.
+    """
+    kernel.generate_device_driver_ir()
+
+    # create a program
+    kernel_bundle = dpctl_prog.create_program_from_spirv(
+        sycl_queue,
+        kernel.device_driver_ir_module,
+        " ".join(build_flags),
+    )
+    #  create a kernel
+    return kernel_bundle.get_sycl_kernel(kernel.module_name)
+
+
 def _compile_kernel_parfor(
     sycl_queue, kernel_name, func_ir, argtypes, debug=False
 ):
@@ -70,13 +161,15 @@ def _compile_kernel_parfor(
         func_ir, kernel_name
     )
 
-    # compile the kernel
+    # compile the kernel, the translation to SPIR-V is done as part of the
+    # device build
     kernel.compile(
         args=argtypes,
         typing_ctx=dpex_kernel_target.typing_context,
         target_ctx=dpex_kernel_target.target_context,
         debug=debug,
         compile_flags=None,
+        generate_device_driver_ir=False,
     )
 
     dpctl_create_program_from_spirv_flags = []
@@ -84,16 +177,78 @@ def _compile_kernel_parfor(
         # if debug is ON we need to pass additional flags to igc.
         dpctl_create_program_from_spirv_flags = ["-g", "-cl-opt-disable"]
 
-    # create a program
-    kernel_bundle = dpctl_prog.create_program_from_spirv(
-        sycl_queue,
-        kernel.device_driver_ir_module,
-        " ".join(dpctl_create_program_from_spirv_flags),
-    )
-    #  create a kernel
-    sycl_kernel = kernel_bundle.get_sycl_kernel(kernel.module_name)
+    # The SPIR-V translation and the device build are offloaded to a worker
+    # thread so that the kernels of all the parfors of a function are built
+    # concurrently.
+    if config.NUM_KERNEL_BUILD_THREADS > 0:
+        future = _get_kernel_build_pool().submit(
+            _build_sycl_kernel,
+            sycl_queue,
+            kernel,
+            dpctl_create_program_from_spirv_flags,
+        )
+    else:
+        future = Future()
+        future.set_result(
+            _build_sycl_kernel(
+                sycl_queue, kernel, dpctl_create_program_from_spirv_flags
+            )
+        )
+
+    return SyclKernelBuild(future, sycl_queue)
+
+
+def wait_for_kernel_builds(metadata):
+    """Waits for all the kernel builds started while lowering a function.
+
+    Args:
+        metadata (dict): The compiler state metadata of the function.
+    """
+    for kernel_build in metadata.pop("dpex_kernel_builds", []):
+        kernel_build.wait()
+
+
+def _get_loop_start_vars(parfor_node, params):
+    """Returns the names of the variables used as the start of a loop nest of
+    a parfor that are not in ``params``.
+
+    A non-zero start of a loop nest is added to the loop index inside the
+    kernel, so the start variables have to be passed to the kernel as extra
+    arguments.
+    """
+    start_vars = []
+    for loop_nest in parfor_node.loop_nests:
+        start = loop_nest.start
+        if (
+            isinstance(start, ir.Var)
+            and start.name not in params
+            and start.name not in start_vars
+        ):
+            start_vars.append(start.name)
+
+    return start_vars
+
+
+def _get_collapsed_loop_stop_vars(parfor_node, params):
+    """Returns the names of the variables used as the stop of the loop nests
+    of a parfor that are collapsed into the last dimension of the kernel range
+    and that are not in ``params``.
+
+    SYCL ranges have at most three dimensions. The loop nests from the third
+    one onwards are collapsed into the last dimension of the range and their
+    extents are needed inside the kernel to recover the loop indices.
+    """
+    stop_vars = []
+    for loop_nest in parfor_node.loop_nests[3:]:
+        stop = loop_nest.stop
+        if (
+            isinstance(stop, ir.Var)
+            and stop.name not in params
+            and stop.name not in stop_vars
+        ):
+            stop_vars.append(stop.name)
 
-    return sycl_kernel
+    return stop_vars
 
 
 def _legalize_names_with_typemap(names, typemap):
@@ -293,8 +448,12 @@ def create_kernel_for_parfor(
 
     _replace_var_with_array(races, loop_body, typemap, lowerer.fndesc.calltypes)
 
-    # Reorder all the params so that inputs go first then outputs.
+    # Reorder all the params so that inputs go first then outputs. The start
+    # variables of the loop nests and the stop variables of the collapsed
+    # loop nests are passed last.
     parfor_params = parfor_inputs + parfor_outputs
+    parfor_params += _get_loop_start_vars(parfor_node, parfor_params)
+    parfor_params += _get_collapsed_loop_stop_vars(parfor_node, parfor_params)
 
     # Some Var and loop_indices may not have legal parameter names so create a
     # dict of potentially illegal param name to guaranteed legal name.
@@ -306,7 +465,7 @@ def create_kernel_for_parfor(
     # Get the types of each parameter.
     param_types = [_to_scalar_from_0d(typemap[v]) for v in parfor_params]
     # Calculate types of args passed to the kernel function.
-    func_arg_types = [typemap[v] for v in (parfor_inputs + parfor_outputs)]
+    func_arg_types = [typemap[v] for v in parfor_params]
 
     # Replace illegal parameter names in the loop body with legal ones.
     replace_var_names(loop_body, param_dict)
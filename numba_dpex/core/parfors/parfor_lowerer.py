@@ -3,10 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import warnings
 from collections import namedtuple
 
 from llvmlite import ir as llvmir
 from numba.core import cgutils, ir, types
+from numba.core.errors import NumbaPerformanceWarning
+from numba.parfors import parfor_lowering
 from numba.parfors.parfor import (
     find_potential_aliases_parfor,
     get_parfor_outputs,
@@ -18,25 +21,38 @@ from numba_dpex.core.parfors.reduction_helper import (
     ReductionHelper,
     ReductionKernelVariables,
 )
+from numba_dpex.core.runtime.context import DpexRTContext
 from numba_dpex.core.utils.kernel_launcher import KernelLaunchIRBuilder
 
 from ..exceptions import UnsupportedParforError
-from ..types.dpnp_ndarray_type import DpnpNdArray
+from ..types import DpnpNdArray, USMNdArray
 from .kernel_builder import create_kernel_for_parfor
 from .reduction_kernel_builder import (
+    create_reduction_final_kernel_for_parfor,
     create_reduction_main_kernel_for_parfor,
-    create_reduction_remainder_kernel_for_parfor,
 )
 
 _KernelArgs = namedtuple(
     "_KernelArgs",
-    ["num_flattened_args", "arg_vals", "arg_types"],
+    ["num_flattened_args", "arg_vals", "arg_types", "dep_events"],
 )
 
 
 # A global list of kernels to keep the objects alive indefinitely.
 keep_alive_kernels = []
 
+# Executing a parfor on the host relies on private parts of Numba: the
+# function that lowers a parfor with Numba's parallel backend and the members
+# of the Lower class that keep the block-local values of the variables. They
+# are checked for before a parfor is lowered for the host, so that a Numba
+# version without them falls back to always offloading the parfor.
+_HOST_LOWERING_FUNCTION = "_lower_parfor_parallel_std"
+_HOST_LOWERING_LOWERER_ATTRS = (
+    "_alloca_var",
+    "_blk_local_varmap",
+    "_singly_assigned_vars",
+)
+
 
 def _getvar(lowerer, x):
     """Returns the LLVM Value corresponding to a Numba IR variable.
@@ -86,6 +102,225 @@ def _load_range(lowerer, value):
         return lowerer.context.get_constant(types.uintp, value)
 
 
+def _load_range_extent(lowerer, start, stop, step):
+    """Returns the LLVM Value for the number of iterations of a loop nest.
+
+    The number of iterations of a loop nest ``(start, stop, step)`` is
+    ``max(0, (stop - start + step - 1) // step)``. For the common case of a
+    zero-based loop with a unit step the extent is just ``stop``.
+
+    Args:
+        lowerer: The Numba Lower instance used to lower the function.
+        start: The start of the loop nest, either an int or a Numba IR
+            variable.
+        stop: The stop of the loop nest, either an int or a Numba IR
+            variable.
+        step: The step of the loop nest.
+
+    Raises:
+        UnsupportedParforError: If the step is not a positive integer
+            constant.
+
+    Returns: An LLVM Value object
+    """
+    if not isinstance(step, int) or step <= 0:
+        raise UnsupportedParforError(
+            "Only positive constant loop steps are supported."
+        )
+
+    if isinstance(start, int) and start == 0 and step == 1:
+        return _load_range(lowerer, stop)
+
+    builder = lowerer.builder
+    context = lowerer.context
+
+    def _load_intp(value):
+        if isinstance(value, ir.Var):
+            return context.cast(
+                builder,
+                lowerer.loadvar(value.name),
+                lowerer.fndesc.typemap[value.name],
+                types.intp,
+            )
+        return context.get_constant(types.intp, value)
+
+    zero = context.get_constant(types.intp, 0)
+    num_iters = builder.sub(_load_intp(stop), _load_intp(start))
+    if step != 1:
+        num_iters = builder.add(
+            num_iters, context.get_constant(types.intp, step - 1)
+        )
+        num_iters = builder.sdiv(
+            num_iters, context.get_constant(types.intp, step)
+        )
+    is_empty = builder.icmp_signed("<", num_iters, zero)
+
+    return builder.select(is_empty, zero, num_iters)
+
+
+def _load_queue_ref(lowerer, kernel_fn):
+    """Returns the LLVM Value for the DPCTLSyclQueueRef of the queue on which
+    a parfor kernel is launched.
+
+    A kernel is launched on the queue it was built with, so that the kernel
+    bundle and the launch queue share the same SYCL context. The queue is
+    owned by the kernel's SyclKernelBuild and is not freed after the launch.
+    """
+    return lowerer.builder.inttoptr(
+        lowerer.context.get_constant(
+            types.uintp, kernel_fn.kernel.queue_ref_address
+        ),
+        cgutils.voidptr_t,
+    )
+
+
+def _load_kernel_ref(lowerer, kernel_fn):
+    """Returns the LLVM Value for the DPCTLSyclKernelRef of a parfor kernel.
+
+    The SYCL kernel of a parfor may still be getting built on a worker thread.
+    The kernel reference is therefore loaded at run time from the slot of the
+    kernel's SyclKernelBuild, and the build is recorded in the metadata of the
+    function so that it is waited on before the function is finalized.
+    """
+    kernel_build = kernel_fn.kernel
+    if lowerer.metadata is not None:
+        lowerer.metadata.setdefault("dpex_kernel_builds", []).append(
+            kernel_build
+        )
+    else:
+        kernel_build.wait()
+
+    kernel_ref_slot = lowerer.builder.inttoptr(
+        lowerer.context.get_constant(
+            types.uintp, kernel_build.kernel_ref_slot_address
+        ),
+        cgutils.voidptr_t.as_pointer(),
+    )
+
+    return lowerer.builder.load(kernel_ref_slot)
+
+
+def _is_host_lowering_supported(lowerer):
+    """Returns True if the installed Numba version provides the private
+    functions and Lower members needed to execute a parfor on the host.
+    """
+    return hasattr(parfor_lowering, _HOST_LOWERING_FUNCTION) and all(
+        hasattr(lowerer, attr) for attr in _HOST_LOWERING_LOWERER_ATTRS
+    )
+
+
+def _get_host_parfor(lowerer, parfor):
+    """Returns a copy of a parfor that is lowered with Numba's parallel
+    backend when the parfor is executed on the host, or None if the parfor
+    always has to be offloaded.
+
+    A parfor can be executed on the host if the host execution threshold is
+    set and all the arrays it accesses are allocated in host-accessible USM,
+    i.e., with the "shared" or "host" usm_type, so that the host loop accesses
+    the data in place, and if the installed Numba version supports it. The
+    loop body of the copy is deep-copied as the kernel builder modifies the
+    loop body of the parfor. The init block of the copy is empty as it is
+    lowered once for both the host and the device version.
+    """
+    if config.PARFOR_HOST_THRESHOLD <= 0:
+        return None
+
+    if not _is_host_lowering_supported(lowerer):
+        warnings.warn(
+            NumbaPerformanceWarning(
+                "PARFOR_HOST_THRESHOLD is ignored as the installed Numba "
+                "version does not support lowering a parfor for both the "
+                "host and the device.",
+                parfor.loc,
+            )
+        )
+        return None
+
+    typemap = lowerer.fndesc.typemap
+    for param in parfor.params:
+        paramty = typemap[param]
+        if isinstance(paramty, types.Array) and (
+            not isinstance(paramty, USMNdArray)
+            or paramty.usm_type not in ("shared", "host")
+        ):
+            return None
+
+    host_parfor = copy.copy(parfor)
+    host_parfor.loop_body = copy.deepcopy(parfor.loop_body)
+    host_parfor.init_block = ir.Block(
+        parfor.init_block.scope, parfor.init_block.loc
+    )
+    host_parfor.lowerer = None
+
+    return host_parfor
+
+
+def _load_run_on_host_cond(lowerer, loop_nests):
+    """Returns an LLVM Value that is true if the trip count of a parfor is
+    below the host execution threshold.
+    """
+    builder = lowerer.builder
+    trip_count = lowerer.context.get_constant(types.intp, 1)
+    for loop_nest in loop_nests:
+        trip_count = builder.mul(
+            trip_count,
+            _load_range_extent(
+                lowerer, loop_nest.start, loop_nest.stop, loop_nest.step
+            ),
+        )
+
+    return builder.icmp_signed(
+        "<",
+        trip_count,
+        lowerer.context.get_constant(types.intp, config.PARFOR_HOST_THRESHOLD),
+    )
+
+
+def _spill_to_stack(lowerer, names):
+    """Moves the values of variables out of the lowerer's block-local SSA
+    values into stack slots.
+
+    The reduction variables of a parfor are assigned in both the host and the
+    device branch. A value stored in one branch does not dominate the code
+    after the branches, so the variables have to be kept on the stack.
+    """
+    for name in names:
+        lowerer._singly_assigned_vars.discard(name)
+        if name in lowerer._blk_local_varmap:
+            value = lowerer._blk_local_varmap.pop(name)
+            lowerer._alloca_var(name, lowerer.typeof(name))
+            lowerer.builder.store(value, lowerer.getvar(name))
+
+
+def _lower_parfor_on_host(lowerer, parfor):
+    """Lowers a parfor with Numba's parallel backend.
+
+    Arrays allocated inside the function may have a pending asynchronous fill
+    that has to finish before the host accesses their data.
+    """
+    if config.DEBUG_KERNEL_LAUNCHER:
+        cgutils.printf(
+            lowerer.builder, "DPEX-DEBUG: Execute parfor on the host.\n"
+        )
+
+    rtctx = DpexRTContext(lowerer.context)
+    for param in parfor.params:
+        paramty = lowerer.fndesc.typemap[param]
+        if isinstance(paramty, DpnpNdArray):
+            datamodel = dpex_dmm.lookup(paramty)
+            meminfo = lowerer.builder.load(
+                cgutils.gep_inbounds(
+                    lowerer.builder,
+                    _getvar(lowerer, param),
+                    0,
+                    datamodel.get_field_position("meminfo"),
+                )
+            )
+            rtctx.meminfo_wait_pending_event(lowerer.builder, meminfo)
+
+    getattr(parfor_lowering, _HOST_LOWERING_FUNCTION)(lowerer, parfor)
+
+
 class ParforLowerImpl:
     """Provides a custom lowerer for parfor nodes that generates a SYCL kernel
     for a parfor and submits it to a queue.
@@ -134,10 +369,19 @@ class ParforLowerImpl:
             datamodel_mgr=dpex_dmm,
         )
 
+        # Array arguments allocated inside the function may have a pending
+        # fill operation that the kernel has to depend on.
+        dep_events = kernel_builder.build_dependent_events(
+            kernel_argtys=kernel_fn.kernel_arg_types,
+            callargs_ptrs=callargs_ptrs,
+            datamodel_mgr=dpex_dmm,
+        )
+
         return _KernelArgs(
             num_flattened_args=num_flattened_args,
             arg_vals=args_list,
             arg_types=args_ty_list,
+            dep_events=dep_events,
         )
 
     def _submit_parfor_kernel(
@@ -155,34 +399,31 @@ class ParforLowerImpl:
         keep_alive_kernels.append(kernel_fn.kernel)
         kernel_builder = KernelLaunchIRBuilder(lowerer.context, lowerer.builder)
 
-        ptr_to_queue_ref = kernel_builder.get_queue(exec_queue=kernel_fn.queue)
+        curr_queue_ref = _load_queue_ref(lowerer, kernel_fn)
         args = self._build_kernel_arglist(kernel_fn, lowerer, kernel_builder)
 
         # Create a global range over which to submit the kernel based on the
         # loop_ranges of the parfor
         global_range = []
         # SYCL ranges can have at max 3 dimension. If the parfor is of a higher
-        # dimension then the indexing for the higher dimensions is done inside
-        # the kernel.
+        # dimension then the loop nests from the third one onwards are
+        # collapsed into the last dimension of the range and the indexing for
+        # the higher dimensions is done inside the kernel.
         global_range_rank = len(loop_ranges) if len(loop_ranges) < 3 else 3
 
         for i in range(global_range_rank):
             start, stop, step = loop_ranges[i]
-            stop = _load_range(lowerer, stop)
-            if step != 1:
-                raise UnsupportedParforError(
-                    "non-unit strides are not yet supported."
-                )
-            global_range.append(stop)
+            global_range.append(_load_range_extent(lowerer, start, stop, step))
+
+        for start, stop, step in loop_ranges[global_range_rank:]:
+            global_range[-1] = lowerer.builder.mul(
+                global_range[-1],
+                _load_range_extent(lowerer, start, stop, step),
+            )
 
         local_range = []
 
-        kernel_ref_addr = kernel_fn.kernel.addressof_ref()
-        kernel_ref = lowerer.builder.inttoptr(
-            lowerer.context.get_constant(types.uintp, kernel_ref_addr),
-            cgutils.voidptr_t,
-        )
-        curr_queue_ref = lowerer.builder.load(ptr_to_queue_ref)
+        kernel_ref = _load_kernel_ref(lowerer, kernel_fn)
 
         # Submit a synchronous kernel
         kernel_builder.submit_sycl_kernel(
@@ -193,11 +434,9 @@ class ParforLowerImpl:
             arg_ty_list=args.arg_types,
             global_range=global_range,
             local_range=local_range,
+            dependent_events=args.dep_events,
         )
 
-        # At this point we can free the DPCTLSyclQueueRef (curr_queue)
-        kernel_builder.free_queue(ptr_to_sycl_queue_ref=ptr_to_queue_ref)
-
     def _submit_reduction_main_parfor_kernel(
         self,
         lowerer,
@@ -213,7 +452,7 @@ class ParforLowerImpl:
         keep_alive_kernels.append(kernel_fn.kernel)
         kernel_builder = KernelLaunchIRBuilder(lowerer.context, lowerer.builder)
 
-        ptr_to_queue_ref = kernel_builder.get_queue(exec_queue=kernel_fn.queue)
+        curr_queue_ref = _load_queue_ref(lowerer, kernel_fn)
 
         args = self._build_kernel_arglist(kernel_fn, lowerer, kernel_builder)
         # Create a global range over which to submit the kernel based on the
@@ -229,12 +468,7 @@ class ParforLowerImpl:
             _load_range(lowerer, reductionHelper.work_group_size)
         )
 
-        kernel_ref_addr = kernel_fn.kernel.addressof_ref()
-        kernel_ref = lowerer.builder.inttoptr(
-            lowerer.context.get_constant(types.uintp, kernel_ref_addr),
-            cgutils.voidptr_t,
-        )
-        curr_queue_ref = lowerer.builder.load(ptr_to_queue_ref)
+        kernel_ref = _load_kernel_ref(lowerer, kernel_fn)
 
         # Submit a synchronous kernel
         kernel_builder.submit_sycl_kernel(
@@ -245,19 +479,19 @@ class ParforLowerImpl:
             arg_ty_list=args.arg_types,
             global_range=global_range,
             local_range=local_range,
+            dependent_events=args.dep_events,
         )
 
-        # At this point we can free the DPCTLSyclQueueRef (curr_queue)
-        kernel_builder.free_queue(ptr_to_sycl_queue_ref=ptr_to_queue_ref)
-
-    def _submit_reduction_remainder_parfor_kernel(
+    def _submit_reduction_final_parfor_kernel(
         self,
         lowerer,
         kernel_fn,
+        reductionHelper=None,
     ):
         """
-        Adds a call to submit the remainder kernel of a parfor reduction into
-        the function body of the current Numba JIT compiled function.
+        Adds a call to submit the final kernel of a parfor reduction into
+        the function body of the current Numba JIT compiled function. The
+        final kernel is submitted as a single work-group.
         """
         # Ensure that the Python arguments are kept alive for the duration of
         # the kernel execution
@@ -265,25 +499,21 @@ class ParforLowerImpl:
 
         kernel_builder = KernelLaunchIRBuilder(lowerer.context, lowerer.builder)
 
-        ptr_to_queue_ref = kernel_builder.get_queue(exec_queue=kernel_fn.queue)
+        curr_queue_ref = _load_queue_ref(lowerer, kernel_fn)
 
         args = self._build_kernel_arglist(kernel_fn, lowerer, kernel_builder)
-        # Create a global range over which to submit the kernel based on the
-        # loop_ranges of the parfor
+        # The final kernel is executed by a single work-group.
         global_range = []
-
-        stop = _load_range(lowerer, 1)
-
-        global_range.append(stop)
+        global_range.append(
+            _load_range(lowerer, reductionHelper.work_group_size)
+        )
 
         local_range = []
-
-        kernel_ref_addr = kernel_fn.kernel.addressof_ref()
-        kernel_ref = lowerer.builder.inttoptr(
-            lowerer.context.get_constant(types.uintp, kernel_ref_addr),
-            cgutils.voidptr_t,
+        local_range.append(
+            _load_range(lowerer, reductionHelper.work_group_size)
         )
-        curr_queue_ref = lowerer.builder.load(ptr_to_queue_ref)
+
+        kernel_ref = _load_kernel_ref(lowerer, kernel_fn)
 
         # Submit a synchronous kernel
         kernel_builder.submit_sycl_kernel(
@@ -294,11 +524,9 @@ class ParforLowerImpl:
             arg_ty_list=args.arg_types,
             global_range=global_range,
             local_range=local_range,
+            dependent_events=args.dep_events,
         )
 
-        # At this point we can free the DPCTLSyclQueueRef (curr_queue)
-        kernel_builder.free_queue(ptr_to_sycl_queue_ref=ptr_to_queue_ref)
-
     def _reduction_codegen(
         self,
         parfor,
@@ -346,11 +574,6 @@ class ParforLowerImpl:
             reductionHelperList=reductionHelperList,
         )
 
-        if len(parfor.loop_nests) > 1:
-            raise UnsupportedParforError(
-                "Reduction with nested loop is not yet supported."
-            )
-
         parfor_kernel = create_reduction_main_kernel_for_parfor(
             loop_ranges,
             parfor,
@@ -359,6 +582,7 @@ class ParforLowerImpl:
             bool(alias_map),
             reductionKernelVar,
             parfor_reddict,
+            reductionHelperList,
         )
 
         self._submit_reduction_main_parfor_kernel(
@@ -367,7 +591,7 @@ class ParforLowerImpl:
             reductionHelperList[0],
         )
 
-        parfor_kernel = create_reduction_remainder_kernel_for_parfor(
+        parfor_kernel = create_reduction_final_kernel_for_parfor(
             parfor,
             typemap,
             flags,
@@ -377,51 +601,25 @@ class ParforLowerImpl:
             reductionHelperList,
         )
 
-        self._submit_reduction_remainder_parfor_kernel(
+        self._submit_reduction_final_parfor_kernel(
             lowerer,
             parfor_kernel,
+            reductionHelperList[0],
         )
 
-        reductionKernelVar.copy_final_sum_to_host(parfor_kernel)
-
-    def _lower_parfor_as_kernel(self, lowerer, parfor):
-        """Lowers a parfor node created by the dpjit compiler to a
-        ``numba_dpex.kernel``.
-
-        The general approach is as follows:
-
-            - The code from the parfor's init block is lowered normally
-              in the context of the current function.
-            - The body of the parfor is transformed into a kernel function.
-            - Dpctl runtime calls to submit the kernel are added.
+        reductionKernelVar.copy_final_sum_to_host()
 
+    def _lower_parfor_body_as_kernel(self, lowerer, parfor):
+        """Compiles the body of a parfor into a kernel and adds the calls to
+        submit it into the current function. The init block of the parfor has
+        to be lowered already.
         """
-        # We copy the typemap here because for race condition variable we'll
-        # update their type to array so they can be updated by the kernel.
-        orig_typemap = lowerer.fndesc.typemap
-
-        # replace original typemap with copy and restore the original at the
-        # end.
-        lowerer.fndesc.typemap = copy.copy(orig_typemap)
-
-        if config.DEBUG_ARRAY_OPT:
-            print("lowerer.fndesc", lowerer.fndesc, type(lowerer.fndesc))
+        if config.DEBUG_KERNEL_LAUNCHER:
+            cgutils.printf(
+                lowerer.builder, "DPEX-DEBUG: Offload parfor to the device.\n"
+            )
 
         typemap = lowerer.fndesc.typemap
-        varmap = lowerer.varmap
-
-        loc = parfor.init_block.loc
-        scope = parfor.init_block.scope
-
-        # Lower the init block of the parfor.
-        for instr in parfor.init_block.body:
-            lowerer.lower_inst(instr)
-
-        for racevar in parfor.races:
-            if racevar not in varmap:
-                rvtyp = typemap[racevar]
-                rv = ir.Var(scope, racevar, loc)
-                lowerer._alloca_var(rv.name, rvtyp)
 
         alias_map = {}
         arg_aliases = {}
@@ -500,6 +698,64 @@ class ParforLowerImpl:
                 loop_ranges,
             )
 
+    def _lower_parfor_as_kernel(self, lowerer, parfor):
+        """Lowers a parfor node created by the dpjit compiler to a
+        ``numba_dpex.kernel``.
+
+        The general approach is as follows:
+
+            - The code from the parfor's init block is lowered normally
+              in the context of the current function.
+            - The body of the parfor is transformed into a kernel function.
+            - Dpctl runtime calls to submit the kernel are added.
+            - If the parfor can also be executed on the host, a run time
+              check of the trip count selects between submitting the kernel
+              and executing the parfor with Numba's parallel backend.
+
+        """
+        host_parfor = _get_host_parfor(lowerer, parfor)
+
+        # We copy the typemap here because for race condition variable we'll
+        # update their type to array so they can be updated by the kernel.
+        orig_typemap = lowerer.fndesc.typemap
+
+        # replace original typemap with copy and restore the original at the
+        # end.
+        lowerer.fndesc.typemap = copy.copy(orig_typemap)
+
+        if config.DEBUG_ARRAY_OPT:
+            print("lowerer.fndesc", lowerer.fndesc, type(lowerer.fndesc))
+
+        typemap = lowerer.fndesc.typemap
+        varmap = lowerer.varmap
+
+        loc = parfor.init_block.loc
+        scope = parfor.init_block.scope
+
+        # Lower the init block of the parfor.
+        for instr in parfor.init_block.body:
+            lowerer.lower_inst(instr)
+
+        for racevar in parfor.races:
+            if racevar not in varmap:
+                rvtyp = typemap[racevar]
+                rv = ir.Var(scope, racevar, loc)
+                lowerer._alloca_var(rv.name, rvtyp)
+
+        if host_parfor is None:
+            self._lower_parfor_body_as_kernel(lowerer, parfor)
+        else:
+            _spill_to_stack(lowerer, list(parfor.redvars) + list(parfor.races))
+            run_on_host = _load_run_on_host_cond(lowerer, parfor.loop_nests)
+            with lowerer.builder.if_else(run_on_host, likely=False) as (
+                on_host,
+                on_device,
+            ):
+                with on_host:
+                    _lower_parfor_on_host(lowerer, host_parfor)
+                with on_device:
+                    self._lower_parfor_body_as_kernel(lowerer, parfor)
+
         # TODO: free the kernel at this point
 
         # Restore the original typemap of the function that was replaced
@@ -4,7 +4,7 @@
 import copy
 import operator
 
-import dpnp
+import dpctl
 import numba
 from numba.core import ir, types
 from numba.core.ir_utils import (
@@ -16,11 +16,44 @@ from numba.core.ir_utils import (
 from numba.parfors import parfor
 from numba.parfors.parfor_lowering_utils import ParforLoweringBuilder
 
-from numba_dpex import utils
-from numba_dpex.core.utils.kernel_launcher import KernelLaunchIRBuilder
-from numba_dpex.dpctl_iface import libsyclinterface_bindings as sycl
-
+from ..exceptions import UnsupportedParforError
 from ..types.dpnp_ndarray_type import DpnpNdArray
+from ..utils.kernel_templates.reduction_template import get_reduction_operator
+
+# The functions used to combine the result of a reduction with the value of
+# the reduction variable before the parfor.
+_combine_ops = {
+    operator.iadd: operator.add,
+    operator.imul: operator.mul,
+    max: max,
+    min: min,
+}
+
+# Upper bound for the work-group size used by the reduction kernels. The bound
+# limits the local memory used per reduction variable.
+_MAX_REDUCTION_WORK_GROUP_SIZE = 256
+
+
+def get_reduction_work_group_size(sycl_device):
+    """Returns the work-group size to be used by the reduction kernels for a
+    device.
+
+    The work-group size is the largest power of two that is not greater than
+    either the device's maximum work-group size or
+    ``_MAX_REDUCTION_WORK_GROUP_SIZE``. A power of two is needed by the local
+    memory tree reduction.
+
+    Args:
+        sycl_device (str): The filter string of the SYCL device on which the
+            reduction kernels are to be executed.
+
+    Returns:
+        int: The work-group size.
+    """
+    max_work_group_size = dpctl.SyclDevice(sycl_device).max_work_group_size
+    work_group_size = min(max_work_group_size, _MAX_REDUCTION_WORK_GROUP_SIZE)
+
+    return 1 << (work_group_size.bit_length() - 1)
 
 
 class ReductionHelper:
@@ -46,70 +79,162 @@ class ReductionHelper:
         reddtype = redarrvar_typ.dtype
         redarrdim = redarrvar_typ.ndim
 
-        # allocate partial sum
-        work_group_size = 8
+        # The work-group size is selected based on the limits of the device
+        # on which the reduction is executed.
+        work_group_size = get_reduction_work_group_size(
+            inputArrayType.queue.sycl_device
+        )
+        # The number of work-groups of the main kernel is capped so that the
+        # final kernel can reduce all partial sums in a single work-group with
+        # at most one partial sum per work item.
+        max_num_groups = work_group_size
+
         # writing work_group_size inot IR
         work_group_size_var = pfbdr.assign(
             rhs=ir.Const(work_group_size, loc),
             typ=types.literal(work_group_size),
             name="work_group_size",
         )
-
-        # get total_work from parfor loop range
-        # FIXME: right way is to use (stop - start) if start != 0
-        total_work_var = pfbdr.assign(
-            rhs=parfor.loop_nests[0].stop,
-            typ=types.intp,
-            name="tot_work",
+        work_group_size_m1_var = pfbdr.assign(
+            rhs=ir.Const(work_group_size - 1, loc),
+            typ=types.literal(work_group_size - 1),
+            name="work_group_size_m1",
+        )
+        max_num_groups_var = pfbdr.assign(
+            rhs=ir.Const(max_num_groups, loc),
+            typ=types.literal(max_num_groups),
+            name="max_num_groups",
+        )
+        one_var = pfbdr.assign(
+            rhs=ir.Const(1, loc), typ=types.literal(1), name="one"
+        )
+        zero_var = pfbdr.assign(
+            rhs=ir.Const(0, loc), typ=types.literal(0), name="zero"
+        )
+        max_func = pfbdr.bind_global_function(
+            fobj=max,
+            ftype=pfbdr._typingctx.resolve_value_type(max),
+            args=[types.intp, types.intp],
         )
 
-        # global_size_mod = tot_work%work_group_size # noqa: E800 help understanding
+        # get the extent of every dimension from the parfor loop ranges, i.e.,
+        # max(0, (stop - start + step - 1) // step)
+        self.loop_extent_vars = []
+        for loop_nest in parfor.loop_nests:
+            if not isinstance(loop_nest.step, int) or loop_nest.step <= 0:
+                raise UnsupportedParforError(
+                    "Only positive constant loop steps are supported."
+                )
+            extent_var = self._assign_int(pfbdr, loop_nest.stop, "loop_extent")
+            if not (isinstance(loop_nest.start, int) and loop_nest.start == 0):
+                extent_var = self._assign_binop(
+                    pfbdr,
+                    operator.sub,
+                    extent_var,
+                    self._assign_int(pfbdr, loop_nest.start, "loop_start"),
+                    "loop_extent",
+                )
+            if loop_nest.step != 1:
+                extent_var = self._assign_binop(
+                    pfbdr,
+                    operator.add,
+                    extent_var,
+                    self._assign_int(pfbdr, loop_nest.step - 1, "step_m1"),
+                    "loop_extent",
+                )
+                extent_var = self._assign_binop(
+                    pfbdr,
+                    operator.floordiv,
+                    extent_var,
+                    self._assign_int(pfbdr, loop_nest.step, "step"),
+                    "loop_extent",
+                )
+            # An empty loop nest has to contribute an extent of zero and not a
+            # negative one, otherwise the product of two negative extents
+            # results in a positive total_work.
+            extent_var = pfbdr.assign(
+                rhs=pfbdr.call(max_func, args=[extent_var, zero_var]),
+                typ=types.intp,
+                name="loop_extent",
+            )
+            self.loop_extent_vars.append(extent_var)
+
+        # A multi-dimensional parfor is reduced over its linearized iteration
+        # space, i.e., total_work is the product of the loop extents.
+        self.total_work_var = self.loop_extent_vars[0]
+        for loop_extent_var in self.loop_extent_vars[1:]:
+            ir_expr = ir.Expr.binop(
+                operator.mul, self.total_work_var, loop_extent_var, loc
+            )
+            pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
+                types.intp, types.intp, types.intp
+            )
+            self.total_work_var = pfbdr.assign(
+                rhs=ir_expr, typ=types.intp, name="tot_work"
+            )
+
+        # Calculates num_groups as the number of work-groups needed to have
+        # one work item per iteration, i.e.,
+        # (tot_work + work_group_size - 1) // work_group_size
         ir_expr = ir.Expr.binop(
-            operator.mod, total_work_var, work_group_size_var, loc
+            operator.add, self.total_work_var, work_group_size_m1_var, loc
         )
         pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
             types.intp, types.intp, types.intp
         )
-        self.global_size_mod_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="global_size_mod"
+        tot_work_padded_var = pfbdr.assign(
+            rhs=ir_expr, typ=types.intp, name="tot_work_padded"
         )
-
-        # Calculates global_size_var as total_work - global_size_mod
         ir_expr = ir.Expr.binop(
-            operator.sub, total_work_var, self.global_size_mod_var, loc
+            operator.floordiv, tot_work_padded_var, work_group_size_var, loc
         )
         pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
             types.intp, types.intp, types.intp
         )
-        self.global_size_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="global_size"
+        num_groups_var = pfbdr.assign(
+            rhs=ir_expr, typ=types.intp, name="num_groups"
         )
 
-        # Calculates partial_sum_size_var as
-        # global_size_var_assign // work_group_size_var_assign
+        # Clamps num_groups to [1, max_num_groups]. Small problems are reduced
+        # by a single work-group, whereas for large problems every work item
+        # sequentially reduces several iterations before the work-group
+        # reduction.
+        min_func = pfbdr.bind_global_function(
+            fobj=min,
+            ftype=pfbdr._typingctx.resolve_value_type(min),
+            args=[types.intp, types.intp],
+        )
+        num_groups_var = pfbdr.assign(
+            rhs=pfbdr.call(min_func, args=[num_groups_var, max_num_groups_var]),
+            typ=types.intp,
+            name="num_groups",
+        )
+        self.partial_sum_size_var = pfbdr.assign(
+            rhs=pfbdr.call(max_func, args=[num_groups_var, one_var]),
+            typ=types.intp,
+            name="partial_sum_size",
+        )
+
+        # Calculates global_size_var as partial_sum_size * work_group_size
         ir_expr = ir.Expr.binop(
-            operator.floordiv,
-            self.global_size_var,
+            operator.mul,
+            self.partial_sum_size_var,
             work_group_size_var,
             loc,
         )
         pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
             types.intp, types.intp, types.intp
         )
-        self.partial_sum_size_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="partial_sum_size"
+        self.global_size_var = pfbdr.assign(
+            rhs=ir_expr, typ=types.intp, name="global_size"
         )
-        # Dpnp object
-        fillFunc = None
-        parfor_reddict = parfor.reddict
-        redop = parfor_reddict[red_name].redop
+        # Every element of the partial sum array is written by the reduction
+        # main kernel, so the array does not need to be initialized. The
+        # reduction arrays are drawn from the scratch pool to avoid a USM
+        # allocation on every execution of the parfor.
+        from numba_dpex.dpnp_iface.arrayobj import empty_scratch
 
-        if redop == operator.iadd:
-            fillFunc = dpnp.zeros
-        elif redop == operator.imul:
-            fillFunc = dpnp.ones
-        else:
-            raise NotImplementedError
+        fillFunc = empty_scratch
 
         kws = {
             "shape": types.UniTuple(types.intp, redarrdim),
@@ -165,12 +290,27 @@ class ReductionHelper:
             [final_sum_size_var], name="tuple_sizeVar"
         )
 
+        # The final sum is allocated in host USM memory so that the result
+        # written by the reduction final kernel can be read by the host
+        # without a copy.
+        final_sum_typ = redarrvar_typ.copy(usm_type="host")
+        kws["usm_type"] = types.literal(final_sum_typ.usm_type)
+        glbl_np_empty = pfbdr.bind_global_function(
+            fobj=empty_scratch,
+            ftype=get_np_ufunc_typ(empty_scratch),
+            args=[],
+            kws=kws,
+        )
+        usmTyVar = pfbdr.make_const_variable(
+            cval=final_sum_typ.usm_type,
+            typ=types.literal(final_sum_typ.usm_type),
+        )
         empty_call = pfbdr.call(
             glbl_np_empty, args=[sizeVar, dt, orderTyVar, deviceVar, usmTyVar]
         )
         self.final_sum_var = pfbdr.assign(
             rhs=empty_call,
-            typ=redarrvar_typ,
+            typ=final_sum_typ,
             name="final_sum",
         )
         self.work_group_size = work_group_size
@@ -179,6 +319,20 @@ class ReductionHelper:
         self.redvars_to_redarrs_dict[red_name].append(self.partial_sum_var.name)
         self.redvars_to_redarrs_dict[red_name].append(self.final_sum_var.name)
 
+    def _assign_int(self, pfbdr, value, name):
+        """Assigns an integer constant or variable to a new intp variable."""
+        if isinstance(value, int):
+            value = ir.Const(value, pfbdr._loc)
+        return pfbdr.assign(rhs=value, typ=types.intp, name=name)
+
+    def _assign_binop(self, pfbdr, op, lhs, rhs, name):
+        """Assigns the result of an intp binary operation to a new variable."""
+        ir_expr = ir.Expr.binop(op, lhs, rhs, pfbdr._loc)
+        pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
+            types.intp, types.intp, types.intp
+        )
+        return pfbdr.assign(rhs=ir_expr, typ=types.intp, name=name)
+
     def _redtyp_to_redarraytype(self, redtyp, inputArrayType):
         """Go from a reduction variable type to a reduction array type
         used to hold per-worker results.
@@ -258,8 +412,12 @@ class ReductionKernelVariables:
             races, loop_body, typemap, lowerer.fndesc.calltypes
         )
 
-        # Reorder all the params so that inputs go first then outputs.
+        # Reorder all the params so that inputs go first then outputs. The
+        # start variables of the loop nests are passed last.
         parfor_params = parfor_inputs + parfor_outputs
+        from .kernel_builder import _get_loop_start_vars
+
+        parfor_params += _get_loop_start_vars(parfor_node, parfor_params)
 
         # Some Var and loop_indices may not have legal parameter names so create
         # a dict of potentially illegal param name to guaranteed legal name.
@@ -297,7 +455,7 @@ class ReductionKernelVariables:
         param_types = [_to_scalar_from_0d(typemap[v]) for v in parfor_params]
 
         # Calculate types of args passed to the kernel function.
-        func_arg_types = [typemap[v] for v in (parfor_inputs + parfor_outputs)]
+        func_arg_types = [typemap[v] for v in parfor_params]
 
         # Replace illegal parameter names in the loop body with legal ones.
         replace_var_names(loop_body, param_dict)
@@ -393,27 +551,24 @@ class ReductionKernelVariables:
     def work_group_size(self):
         return self._work_group_size
 
-    def copy_final_sum_to_host(self, parfor_kernel):
-        lowerer = self.lowerer
-        ir_builder = KernelLaunchIRBuilder(lowerer.context, lowerer.builder)
-
-        # Create a local variable storing a pointer to a DPCTLSyclQueueRef
-        # pointer.
-        curr_queue = ir_builder.get_queue(exec_queue=parfor_kernel.queue)
+    def copy_final_sum_to_host(self):
+        """Stores the results of the reduction into the reduction variables.
 
+        The final sum arrays are allocated in host USM memory and the
+        reduction final kernel is executed synchronously, so the results are
+        loaded directly from the final sum arrays without any copy or queue
+        synchronization. Every result is combined with the value the
+        reduction variable had before the parfor.
+        """
+        lowerer = self.lowerer
         builder = lowerer.builder
         context = lowerer.context
+        typemap = lowerer.fndesc.typemap
 
         for i, redvar in enumerate(self.parfor_redvars):
             srcVar = self.final_sum_names[i]
-
-            item_size = builder.gep(
-                lowerer.getvar(srcVar),
-                [
-                    context.get_constant(types.int32, 0),
-                    context.get_constant(types.int32, 3),  # itmesize
-                ],
-            )
+            src_dtype = typemap[srcVar].dtype
+            redvar_typ = typemap[redvar]
 
             array_attr = builder.gep(
                 lowerer.getvar(srcVar),
@@ -422,25 +577,21 @@ class ReductionKernelVariables:
                     context.get_constant(types.int32, 4),  # data
                 ],
             )
-
-            dest = builder.bitcast(
-                lowerer.getvar(redvar),
-                utils.get_llvm_type(context=context, type=types.voidptr),
-            )
             src = builder.bitcast(
                 builder.load(array_attr),
-                utils.get_llvm_type(context=context, type=types.voidptr),
+                context.get_data_type(src_dtype).as_pointer(),
+            )
+            result = context.cast(
+                builder,
+                context.unpack_value(builder, src_dtype, src),
+                src_dtype,
+                redvar_typ,
             )
 
-            args = [
-                builder.load(curr_queue),
-                dest,
-                src,
-                builder.load(item_size),
-            ]
-
-            event_ref = sycl.dpctl_queue_memcpy(builder, *args)
-            sycl.dpctl_event_wait(builder, event_ref)
-            sycl.dpctl_event_delete(builder, event_ref)
-
-        ir_builder.free_queue(ptr_to_sycl_queue_ref=curr_queue)
+            redop = get_reduction_operator(self.parfor_reddict[redvar], typemap)
+            combine_impl = context.get_function(
+                _combine_ops[redop],
+                numba.core.typing.signature(redvar_typ, redvar_typ, redvar_typ),
+            )
+            result = combine_impl(builder, [lowerer.loadvar(redvar), result])
+            lowerer.storevar(result, redvar)
@@ -22,7 +22,7 @@ from numba.core.typing import signature
 from numba_dpex.core.types import DpctlSyclQueue
 
 from ..utils.kernel_templates.reduction_template import (
-    RemainderReduceIntermediateKernelTemplate,
+    TreeReduceFinalKernelTemplate,
     TreeReduceIntermediateKernelTemplate,
 )
 from .kernel_builder import _print_body  # saved for debug
@@ -42,6 +42,7 @@ def create_reduction_main_kernel_for_parfor(
     has_aliases,
     reductionKernelVar,
     parfor_reddict=None,
+    reductionHelperList=None,
 ):
     """
     Creates a numba_dpex.kernel function for reduction main kernel.
@@ -77,6 +78,30 @@ def create_reduction_main_kernel_for_parfor(
         except KeyError:
             pass
 
+    # The number of iterations of the parfor is passed as an extra argument to
+    # the kernel as the global range of the kernel can be smaller than it. For
+    # a multi-dimensional parfor the extents of the inner dimensions are passed
+    # as well to recover the loop indices from the linearized index.
+    loop_extent_var_names = [
+        var.name for var in reductionHelperList[0].loop_extent_vars
+    ]
+    total_work_var_name = reductionHelperList[0].total_work_var.name
+    extra_param_names = loop_extent_var_names[1:] + [total_work_var_name]
+    extra_param_dict = legalize_names(extra_param_names)
+    for name in extra_param_names:
+        reductionKernelVar.parfor_params.append(name)
+        reductionKernelVar.parfor_legalized_params.append(
+            extra_param_dict[name]
+        )
+        reductionKernelVar.param_types.append(_to_scalar_from_0d(typemap[name]))
+        reductionKernelVar.func_arg_types.append(
+            _to_scalar_from_0d(typemap[name])
+        )
+    total_work_var_legal_name = extra_param_dict[total_work_var_name]
+    inner_extent_var_legal_names = [
+        extra_param_dict[name] for name in loop_extent_var_names[1:]
+    ]
+
     kernel_template = TreeReduceIntermediateKernelTemplate(
         kernel_name=kernel_name,
         kernel_params=reductionKernelVar.parfor_legalized_params,
@@ -91,6 +116,8 @@ def create_reduction_main_kernel_for_parfor(
         redvars_dict=reductionKernelVar.redvars_legal_dict,
         typemap=typemap,
         work_group_size=reductionKernelVar.work_group_size,
+        total_work_var_name=total_work_var_legal_name,
+        inner_extent_var_names=inner_extent_var_legal_names,
     )
     kernel_ir = kernel_template.kernel_ir
 
@@ -106,6 +133,7 @@ def create_reduction_main_kernel_for_parfor(
     new_var_dict = {}
     reserved_names = (
         [sentinel_name]
+        + list(extra_param_dict.values())
         + list(reductionKernelVar.param_dict.values())
         + reductionKernelVar.legal_loop_indices
     )
@@ -165,7 +193,7 @@ def create_reduction_main_kernel_for_parfor(
     )
 
 
-def create_reduction_remainder_kernel_for_parfor(
+def create_reduction_final_kernel_for_parfor(
     parfor_node,
     typemap,
     flags,
@@ -175,24 +203,13 @@ def create_reduction_remainder_kernel_for_parfor(
     reductionHelperList,
 ):
     """
-    Creates a numba_dpex.kernel function for a reduction remainder kernel.
-    """
-
-    loc = parfor_node.init_block.loc
+    Creates a numba_dpex.kernel function for a reduction final kernel.
 
-    for race in parfor_node.races:
-        msg = (
-            "Variable %s used in parallel loop may be written "
-            "to simultaneously by multiple workers and may result "
-            "in non-deterministic or unintended results." % race
-        )
-        warnings.warn(NumbaParallelSafetyWarning(msg, loc))
-
-    loop_body_var_table = get_name_var_table(reductionKernelVar.loop_body)
-    sentinel_name = get_unused_var_name("__sentinel__", loop_body_var_table)
+    The final kernel reduces the partial sums written by the main kernel into
+    the final sum array inside a single work-group. It does not contain the
+    body of the parfor.
+    """
 
-    global_size_var_name = []
-    global_size_mod_var_name = []
     partial_sum_var_name = []
     partial_sum_size_var_name = []
     final_sum_var_name = []
@@ -202,36 +219,21 @@ def create_reduction_remainder_kernel_for_parfor(
         name = reductionHelper.partial_sum_var.name
         partial_sum_var_name.append(name)
 
-        name = reductionHelper.global_size_var.name
-        global_size_var_name.append(name)
-
-        name = reductionHelper.global_size_mod_var.name
-        global_size_mod_var_name.append(name)
-
         name = reductionHelper.partial_sum_size_var.name
         partial_sum_size_var_name.append(name)
 
         name = reductionHelper.final_sum_var.name
         final_sum_var_name.append(name)
 
-    kernel_name = "__dpex_redection_parfor_%s_remainder" % (parfor_node.id)
+    kernel_name = "__dpex_reduction_parfor_%s_final" % (parfor_node.id)
 
     partial_sum_var_dict = legalize_names(partial_sum_var_name)
-    global_size_var_dict = legalize_names(global_size_var_name)
-    global_size_mod_var_dict = legalize_names(global_size_mod_var_name)
     partial_sum_size_var_dict = legalize_names(partial_sum_size_var_name)
     final_sum_var_dict = legalize_names(final_sum_var_name)
 
     partial_sum_var_legal_name = [
         partial_sum_var_dict[v] for v in partial_sum_var_dict
     ]
-
-    global_size_var_legal_name = [
-        global_size_var_dict[v] for v in global_size_var_dict
-    ]
-    global_size_mod_var_legal_name = [
-        global_size_mod_var_dict[v] for v in global_size_mod_var_dict
-    ]
     partial_sum_size_var_legal_name = [
         partial_sum_size_var_dict[v] for v in partial_sum_size_var_dict
     ]
@@ -239,30 +241,27 @@ def create_reduction_remainder_kernel_for_parfor(
         final_sum_var_dict[v] for v in final_sum_var_dict
     ]
 
-    kernel_template = RemainderReduceIntermediateKernelTemplate(
+    kernel_template = TreeReduceFinalKernelTemplate(
         kernel_name=kernel_name,
         kernel_params=reductionKernelVar.parfor_legalized_params,
-        sentinel_name=sentinel_name,
-        legal_loop_indices=reductionKernelVar.legal_loop_indices,
         redvars_dict=reductionKernelVar.redvars_legal_dict,
         redvars=reductionKernelVar.parfor_redvars,
         parfor_reddict=parfor_reddict,
         typemap=typemap,
-        global_size_var_name=global_size_var_legal_name,
-        global_size_mod_var_name=global_size_mod_var_legal_name,
         partial_sum_size_var_name=partial_sum_size_var_legal_name,
         partial_sum_var_name=partial_sum_var_legal_name,
         final_sum_var_name=final_sum_var_legal_name,
-        reductionKernelVar=reductionKernelVar,
+        work_group_size=reductionKernelVar.work_group_size,
     )
     kernel_ir = kernel_template.kernel_ir
 
     var_table = get_name_var_table(kernel_ir.blocks)
     new_var_dict = {}
     reserved_names = (
-        [sentinel_name]
-        + list(reductionKernelVar.param_dict.values())
-        + reductionKernelVar.legal_loop_indices
+        list(reductionKernelVar.param_dict.values())
+        + reductionKernelVar.parfor_legalized_params
+        + partial_sum_size_var_legal_name
+        + final_sum_var_legal_name
     )
     for name, _ in var_table.items():
         if not (name in reserved_names):
@@ -270,31 +269,6 @@ def create_reduction_remainder_kernel_for_parfor(
     replace_var_names(kernel_ir.blocks, new_var_dict)
 
     for i, _ in enumerate(reductionKernelVar.parfor_redvars):
-        if reductionHelperList[i].global_size_var is not None:
-            reductionKernelVar.parfor_params.append(global_size_var_name[i])
-            reductionKernelVar.parfor_legalized_params.append(
-                global_size_var_legal_name[i]
-            )
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[global_size_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[global_size_var_name[i]])
-            )
-
-        if reductionHelperList[i].global_size_mod_var is not None:
-            reductionKernelVar.parfor_params.append(global_size_mod_var_name[i])
-            reductionKernelVar.parfor_legalized_params.append(
-                global_size_mod_var_legal_name[i]
-            )
-
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[global_size_mod_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[global_size_mod_var_name[i]])
-            )
-
         if reductionHelperList[i].partial_sum_size_var is not None:
             reductionKernelVar.parfor_params.append(
                 partial_sum_size_var_name[i]
@@ -322,17 +296,8 @@ def create_reduction_remainder_kernel_for_parfor(
 
     kernel_param_types = reductionKernelVar.param_types
 
-    kernel_stub_last_label = max(kernel_ir.blocks.keys()) + 1
-
-    # Add kernel stub last label to each parfor.loop_body label to prevent
-    # label conflicts.
-    loop_body = add_offset_to_labels(
-        reductionKernelVar.loop_body, kernel_stub_last_label
-    )
-    # new label for splitting sentinel block
-    new_label = max(loop_body.keys()) + 1
-
-    update_sentinel(kernel_ir, sentinel_name, loop_body, new_label)
+    kernel_ir.blocks = rename_labels(kernel_ir.blocks)
+    remove_dels(kernel_ir.blocks)
 
     old_alias = flags.noalias
     if not has_aliases:
@@ -2,11 +2,14 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from .parfor_buffer_reuse_pass import ParforBufferReusePass
 from .parfor_legalize_cfd_pass import ParforLegalizeCFDPass
-from .passes import DumpParforDiagnostics, NoPythonBackend
+from .passes import DpjitParforLowering, DumpParforDiagnostics, NoPythonBackend
 
 __all__ = [
+    "DpjitParforLowering",
     "DumpParforDiagnostics",
+    "ParforBufferReusePass",
     "ParforLegalizeCFDPass",
     "NoPythonBackend",
 ]
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""A lowering class for dpjit functions that waits on the asynchronous fill of
+an array once before the array is accessed from the host.
+
+``dpnp.zeros``, ``dpnp.ones``, ``dpnp.full`` and their ``_like`` variants
+fill the data of a new array asynchronously. A kernel that uses the array
+depends on the fill event, but host code has to wait on it. Instead of waiting
+on every host access of an element, the lowerer inserts a single wait right
+after the allocation of every such array that is used outside of a parfor.
+"""
+
+import dpnp
+from numba.core import ir, types
+from numba.np.arrayobj import make_array
+from numba.parfors.parfor import Parfor
+from numba.parfors.parfor_lowering import ParforLower
+
+from numba_dpex.core.runtime.context import DpexRTContext
+from numba_dpex.core.types import DpnpNdArray
+
+_async_fill_functions = (
+    dpnp.zeros,
+    dpnp.ones,
+    dpnp.full,
+    dpnp.zeros_like,
+    dpnp.ones_like,
+    dpnp.full_like,
+)
+
+
+class DpjitParforLower(ParforLower):
+    """Lowers a dpjit function with parfor nodes and inserts the waits on the
+    asynchronous fills of the arrays that are accessed from the host.
+    """
+
+    def pre_lower(self):
+        super().pre_lower()
+        self._host_accessed_fills = self._get_host_accessed_fills()
+
+    def lower_inst(self, inst):
+        super().lower_inst(inst)
+        if (
+            isinstance(inst, ir.Assign)
+            and inst.target.name in self._host_accessed_fills
+        ):
+            arrty = self.typeof(inst.target.name)
+            array = make_array(arrty)(
+                self.context, self.builder, self.loadvar(inst.target.name)
+            )
+            DpexRTContext(self.context).meminfo_wait_pending_event(
+                self.builder, array.meminfo
+            )
+
+    def _get_host_accessed_fills(self):
+        """Returns the names of the variables that store an asynchronously
+        filled array and that are used by a statement outside of a parfor.
+        """
+        typemap = self.fndesc.typemap
+
+        host_stmts = []
+        for block in self.blocks.values():
+            for inst in block.body:
+                if isinstance(inst, Parfor):
+                    # The init block of a parfor is lowered on the host.
+                    host_stmts.extend(inst.init_block.body)
+                else:
+                    host_stmts.append(inst)
+
+        fills = {}
+        for inst in host_stmts:
+            if (
+                isinstance(inst, ir.Assign)
+                and isinstance(inst.value, ir.Expr)
+                and inst.value.op == "call"
+                and isinstance(typemap[inst.target.name], DpnpNdArray)
+            ):
+                fnty = typemap.get(inst.value.func.name)
+                if (
+                    isinstance(fnty, types.Function)
+                    and fnty.typing_key in _async_fill_functions
+                ):
+                    fills[inst.target.name] = inst
+
+        host_accessed = set()
+        for inst in host_stmts:
+            if isinstance(inst, ir.Del):
+                continue
+            for var in inst.list_vars():
+                if var.name in fills and fills[var.name] is not inst:
+                    host_accessed.add(var.name)
+
+        return host_accessed
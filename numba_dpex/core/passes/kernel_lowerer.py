@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""A lowering class for kernel and device functions that attaches the unroll
+hints given with ``numba_dpex.unroll`` to the generated loops.
+
+A ``for`` loop over ``numba_dpex.unroll(iterable, factor)`` gets an
+``llvm.loop`` metadata node with an ``llvm.loop.unroll.*`` hint on the
+branches that jump back to its header. llvm-spirv translates the metadata
+into SPIR-V loop controls that are honored by the device compiler.
+"""
+
+from llvmlite import ir as llvmir
+from numba.core import ir, types
+from numba.core.analysis import compute_cfg_from_blocks
+from numba.core.lowering import Lower
+
+from numba_dpex.ocl import stubs
+
+
+class _LoopIDMetadata(llvmir.values.MDValue):
+    """A distinct self-referential metadata node that identifies a loop."""
+
+    def __init__(self, module, hints):
+        super().__init__(module, [], name=str(len(module.metadata)))
+        self.operands = (self,) + tuple(hints)
+
+    def descr(self, buf):
+        buf += ("distinct ",)
+        super().descr(buf)
+
+    # A loop ID is only equal to itself, comparing the self-referential
+    # operands would never terminate.
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+
+
+class KernelLower(Lower):
+    """Lowers a kernel or device function and adds the loop metadata for the
+    loops marked with ``numba_dpex.unroll``.
+    """
+
+    def pre_lower(self):
+        super().pre_lower()
+        self._loop_ids = self._get_loop_ids()
+
+    def post_block(self, block):
+        super().post_block(block)
+        loop_id = self._loop_ids.get(block)
+        terminator = self.builder.basic_block.terminator
+        if loop_id is not None and terminator is not None:
+            terminator.set_metadata("llvm.loop", loop_id)
+
+    def _get_unroll_factors(self):
+        """Returns a dict mapping the header label of every loop over a
+        ``numba_dpex.unroll`` call to its unroll factor. A factor of None
+        stands for a full unroll.
+        """
+        typemap = self.fndesc.typemap
+        calltypes = self.fndesc.calltypes
+
+        factors = {}
+        iterables = {}
+        headers = {}
+        for label, block in self.blocks.items():
+            for inst in block.find_insts(ir.Assign):
+                expr = inst.value
+                if not isinstance(expr, ir.Expr):
+                    continue
+                if expr.op == "call":
+                    fnty = typemap.get(expr.func.name)
+                    if (
+                        isinstance(fnty, types.Function)
+                        and fnty.typing_key is stubs.unroll
+                    ):
+                        factor = calltypes[expr].args[1]
+                        factors[inst.target.name] = getattr(
+                            factor, "literal_value", None
+                        )
+                elif expr.op == "getiter":
+                    iterables[inst.target.name] = expr.value.name
+                elif expr.op == "iternext":
+                    headers[expr.value.name] = label
+
+        unroll_factors = {}
+        for it, header in headers.items():
+            iterable = iterables.get(it)
+            if iterable in factors:
+                unroll_factors[header] = factors[iterable]
+
+        return unroll_factors
+
+    def _get_loop_ids(self):
+        """Returns a dict mapping every IR block that ends with the back edge
+        of a loop marked with ``numba_dpex.unroll`` to the loop ID metadata of
+        the loop.
+        """
+        unroll_factors = self._get_unroll_factors()
+        if not unroll_factors:
+            return {}
+
+        cfg = compute_cfg_from_blocks(self.blocks)
+        loops = cfg.loops()
+        i32 = llvmir.IntType(32)
+
+        loop_ids = {}
+        for header, factor in unroll_factors.items():
+            loop = loops.get(header)
+            if loop is None:
+                continue
+            if factor is None:
+                hint = self.module.add_metadata(["llvm.loop.unroll.full"])
+            elif factor == 1:
+                hint = self.module.add_metadata(["llvm.loop.unroll.disable"])
+            else:
+                hint = self.module.add_metadata(
+                    ["llvm.loop.unroll.count", i32(factor)]
+                )
+            loop_id = _LoopIDMetadata(self.module, [hint])
+            for pred, _ in cfg.predecessors(header):
+                if pred in loop.body:
+                    loop_ids[self.blocks[pred]] = loop_id
+
+        return loop_ids
@@ -0,0 +1,298 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+from numba.core import ir
+from numba.core.analysis import (
+    compute_cfg_from_blocks,
+    compute_live_map,
+    compute_use_defs,
+)
+from numba.core.compiler_machinery import FunctionPass, register_pass
+from numba.core.ir_utils import build_definitions, find_potential_aliases
+from numba.parfors.parfor import Parfor
+
+from numba_dpex import config
+from numba_dpex.core.types.dpnp_ndarray_type import DpnpNdArray
+from numba_dpex.dpnp_iface.dpnpimpl import dpnp_allocation_functions
+
+
+class ParforBufferReusePassImpl:
+    """Reuses the buffers of dead temporary dpnp arrays for new allocations.
+
+    Every array expression that gets converted into a parfor allocates its
+    output array using ``dpnp.empty`` in the init block of the parfor. In a
+    chain of array expressions most of these arrays are temporaries that are
+    dead as soon as the next parfor consumed them. The pass computes the
+    lifetime of the arrays allocated inside every basic block and replaces a
+    ``dpnp.empty`` allocation with an earlier temporary array of the same type
+    and shape that is no longer live.
+
+    To keep the transformation safe the pass only reuses an array if:
+
+        - the array was allocated by a dpnp array constructor in the same basic
+          block,
+        - the array is only used by parfor nodes, i.e., it is never returned,
+          passed to a function or stored in a container, and it is only
+          indexed inside the parfor bodies,
+        - the array has no aliases and is not live at the end of the block.
+
+    The reused buffers are listed in the parfor diagnostics report.
+    """
+
+    def __init__(self, state) -> None:
+        self._state = state
+        self._typemap = state.typemap
+        self._definitions = {}
+        self._diagnostics = getattr(state, "parfor_diagnostics", None)
+
+    def _collect_definitions(self, stmts):
+        for stmt in stmts:
+            if isinstance(stmt, ir.Assign):
+                self._definitions.setdefault(stmt.target.name, stmt.value)
+            elif isinstance(stmt, Parfor):
+                self._collect_definitions(stmt.init_block.body)
+                for block in stmt.loop_body.values():
+                    self._collect_definitions(block.body)
+
+    def _get_dpnp_allocation(self, stmt):
+        """Returns the name of the dpnp array constructor called by ``stmt``
+        or None if the statement is not a dpnp array allocation.
+        """
+        if not (
+            isinstance(stmt, ir.Assign)
+            and isinstance(stmt.value, ir.Expr)
+            and stmt.value.op == "call"
+            and isinstance(self._typemap.get(stmt.target.name), DpnpNdArray)
+        ):
+            return None
+
+        func_def = self._definitions.get(stmt.value.func.name)
+        if not (
+            isinstance(func_def, ir.Expr)
+            and func_def.op == "getattr"
+            and func_def.attr in dpnp_allocation_functions
+        ):
+            return None
+
+        module_def = self._definitions.get(func_def.value.name)
+        if (
+            isinstance(module_def, (ir.Global, ir.FreeVar))
+            and module_def.value is dpnp
+        ):
+            return func_def.attr
+
+        return None
+
+    def _get_shape_vars(self, alloc):
+        """Returns the list of variables that make up the shape argument of an
+        allocation call.
+        """
+        if not alloc.args:
+            return None
+        shape = alloc.args[0]
+        shape_def = self._definitions.get(shape.name)
+        if isinstance(shape_def, ir.Expr) and shape_def.op == "build_tuple":
+            return shape_def.items
+        return [shape]
+
+    def _is_same_shape(self, shape1, shape2, equiv_set):
+        if shape1 is None or shape2 is None or len(shape1) != len(shape2):
+            return False
+
+        for dim1, dim2 in zip(shape1, shape2):
+            if dim1.name == dim2.name:
+                continue
+            const1 = self._definitions.get(dim1.name)
+            const2 = self._definitions.get(dim2.name)
+            if (
+                isinstance(const1, ir.Const)
+                and isinstance(const2, ir.Const)
+                and const1.value == const2.value
+            ):
+                continue
+            if equiv_set is not None and equiv_set.is_equiv(dim1, dim2):
+                continue
+            return False
+
+        return True
+
+    def _find_escaped_in_parfor(self, parfor, escaped):
+        """Adds the variables that escape inside the init block or the body of
+        a parfor to ``escaped``.
+
+        Inside a parfor an array may only be indexed, or be the target of its
+        own allocation. Any other use, e.g., passing the array to a function
+        or storing it in a container, lets the array escape.
+        """
+        stmts = list(parfor.init_block.body)
+        for block in parfor.loop_body.values():
+            stmts.extend(block.body)
+
+        for stmt in stmts:
+            if isinstance(stmt, ir.Del):
+                continue
+            if isinstance(stmt, Parfor):
+                self._find_escaped_in_parfor(stmt, escaped)
+                continue
+
+            accessed = None
+            if isinstance(stmt, (ir.SetItem, ir.StaticSetItem)):
+                accessed = stmt.target.name
+            elif (
+                isinstance(stmt, ir.Assign)
+                and isinstance(stmt.value, ir.Expr)
+                and stmt.value.op in ("getitem", "static_getitem", "getattr")
+            ):
+                accessed = stmt.value.value.name
+
+            for var in stmt.list_vars():
+                if var.name == accessed or (
+                    isinstance(stmt, ir.Assign) and stmt.target.name == var.name
+                ):
+                    continue
+                escaped.add(var.name)
+
+    def _analyze_block(self, block, live_out, alias_map, arg_aliases):
+        """Computes the allocations and the last use of every variable of
+        a basic block.
+
+        Returns:
+            A tuple of a list of ``(position, stmt, equiv_set)`` tuples for
+            every ``dpnp.empty`` allocation in the block, a dict mapping the
+            arrays whose buffers can be reused to their position of definition
+            and a dict mapping every variable to the position of its last use.
+        """
+        empty_allocs = []
+        reusable = {}
+        escaped = set()
+        last_use = {}
+
+        for pos, stmt in enumerate(block.body):
+            if isinstance(stmt, ir.Del):
+                continue
+
+            if isinstance(stmt, Parfor):
+                allocs = [
+                    (s, stmt.equiv_set)
+                    for s in stmt.init_block.body
+                    if self._get_dpnp_allocation(s)
+                ]
+            elif self._get_dpnp_allocation(stmt):
+                allocs = [(stmt, None)]
+            else:
+                allocs = []
+
+            for alloc, equiv_set in allocs:
+                arr = alloc.target.name
+                reusable[arr] = pos
+                if self._get_dpnp_allocation(alloc) == "empty":
+                    empty_allocs.append((pos, alloc, equiv_set))
+
+            if isinstance(stmt, Parfor):
+                self._find_escaped_in_parfor(stmt, escaped)
+
+            for var in stmt.list_vars():
+                last_use[var.name] = pos
+                if not isinstance(stmt, Parfor) and not (
+                    isinstance(stmt, ir.Assign) and stmt.target.name == var.name
+                ):
+                    escaped.add(var.name)
+
+        reusable = {
+            arr: pos
+            for arr, pos in reusable.items()
+            if arr not in escaped
+            and arr not in live_out
+            and arr not in alias_map
+            and arr not in arg_aliases
+        }
+
+        return empty_allocs, reusable, last_use
+
+    def _reuse_buffers_in_block(self, block, live_out, alias_map, arg_aliases):
+        empty_allocs, reusable, last_use = self._analyze_block(
+            block, live_out, alias_map, arg_aliases
+        )
+        scope = block.scope
+        num_reused = 0
+        consumed = set()
+
+        for pos, alloc, equiv_set in empty_allocs:
+            arr = alloc.target.name
+            arrty = self._typemap[arr]
+            shape = self._get_shape_vars(alloc.value)
+
+            for dead_arr, def_pos in reusable.items():
+                if (
+                    dead_arr in consumed
+                    or dead_arr == arr
+                    or def_pos >= pos
+                    or last_use[dead_arr] >= pos
+                    or self._typemap[dead_arr] != arrty
+                ):
+                    continue
+                dead_alloc = self._definitions[dead_arr]
+                if not self._is_same_shape(
+                    self._get_shape_vars(dead_alloc), shape, equiv_set
+                ):
+                    continue
+
+                if config.DEBUG_ARRAY_OPT:
+                    print(f"Reusing the buffer of {dead_arr} for {arr}")
+
+                alloc.value = ir.Var(scope, dead_arr, alloc.loc)
+                consumed.add(dead_arr)
+                if self._diagnostics is not None:
+                    self._diagnostics.reused_buffers.append((dead_arr, arr))
+                num_reused += 1
+                break
+
+        return num_reused
+
+    def run(self):
+        func_ir = self._state.func_ir
+        blocks = func_ir.blocks
+
+        for block in blocks.values():
+            self._collect_definitions(block.body)
+
+        cfg = compute_cfg_from_blocks(blocks)
+        usedefs = compute_use_defs(blocks)
+        live_map = compute_live_map(cfg, blocks, usedefs.usemap, usedefs.defmap)
+        alias_map, arg_aliases = find_potential_aliases(
+            blocks, func_ir.arg_names, self._typemap, func_ir
+        )
+
+        num_reused = 0
+        for label, block in blocks.items():
+            live_out = set()
+            for succ, _ in cfg.successors(label):
+                live_out |= live_map[succ]
+            num_reused += self._reuse_buffers_in_block(
+                block, live_out, alias_map, arg_aliases
+            )
+
+        if num_reused:
+            func_ir._definitions = build_definitions(blocks)
+
+        return num_reused > 0
+
+
+@register_pass(mutates_CFG=False, analysis_only=False)
+class ParforBufferReusePass(FunctionPass):
+    _name = "parfor_buffer_reuse_pass"
+
+    def __init__(self):
+        FunctionPass.__init__(self)
+
+    def run_pass(self, state):
+        """
+        Reuse the buffers of dead temporary arrays for new allocations.
+        """
+        # Ensure we have an IR and type information.
+        assert state.func_ir
+        buffer_reuse = ParforBufferReusePassImpl(state)
+
+        return buffer_reuse.run()
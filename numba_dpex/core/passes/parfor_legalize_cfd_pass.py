@@ -4,7 +4,7 @@
 
 from numba.core import ir, types
 from numba.core.compiler_machinery import FunctionPass, register_pass
-from numba.core.ir_utils import find_topo_order
+from numba.core.ir_utils import find_potential_aliases, find_topo_order
 from numba.parfors.parfor import (
     Parfor,
     ParforDiagnostics,
@@ -35,6 +35,13 @@ class ParforLegalizeCFDPassImpl:
     the RHS arrays are "device" and "shared" respectively, the LHS array's
     usm_type attribute will be "device".
 
+    Arrays allocated by a parfor that are only ever accessed by parfor nodes,
+    i.e., temporaries that never escape to the host code of the function, are
+    always allocated as "device" USM. Keeping such arrays resident on the
+    device avoids having every subsequent kernel read them from host or shared
+    USM memory. The arrays promoted to device USM are listed in the parfor
+    diagnostics report.
+
     Once the pass has identified a parfor with DpnpNdArrays and legalized it,
     the "lowerer" attribute of the parfor is set to
     ``numba_dpex.core.passes.parfor_lowering_pass._lower_parfor_as_kernel`` so
@@ -49,6 +56,11 @@ class ParforLegalizeCFDPassImpl:
         self._state = state
         self._cfd_updated_values = set()
         self._seen_array_set = set()
+        self._device_resident_candidates = set()
+        # The usm_type an array promoted to device USM would have had without
+        # the promotion.
+        self._promoted_usm_types = {}
+        self._diagnostics = getattr(state, "parfor_diagnostics", None)
         diagnostics = ParforDiagnostics()
         self.nested_fusion_info = diagnostics.nested_fusion_info
 
@@ -79,6 +91,11 @@ class ParforLegalizeCFDPassImpl:
                 continue
             argty = self._state.typemap[para]
             deviceTypes.add(argty.device)
+            # A temporary promoted to device USM must not make the arrays
+            # computed from it device USM as well.
+            if para in self._promoted_usm_types:
+                usmTypes.append(self._promoted_usm_types[para])
+                continue
             try:
                 usmTypes.append(
                     ParforLegalizeCFDPassImpl.inputUsmTypeStrToInt[
@@ -184,12 +201,24 @@ class ParforLegalizeCFDPassImpl:
         for para in outputParams:
             if not isinstance(self._state.typemap[para], DpnpNdArray):
                 continue
+            para_usm_ty = usm_ty
+            if (
+                para not in self._seen_array_set
+                and para in self._device_resident_candidates
+                and usm_ty
+                != ParforLegalizeCFDPassImpl.inputUsmTypeStrToInt["device"]
+            ):
+                para_usm_ty = ParforLegalizeCFDPassImpl.inputUsmTypeStrToInt[
+                    "device"
+                ]
+                self._promoted_usm_types[para] = usm_ty
+                self._record_device_resident_array(parfor, para, usm_ty)
             # Legalize LHS. Skip if we already updated the type before and no
             # further legalization is needed.
             if self._legalize_array_attrs(
                 para,
                 device_ty,
-                ParforLegalizeCFDPassImpl.inputUsmTypeIntToStr[usm_ty],
+                ParforLegalizeCFDPassImpl.inputUsmTypeIntToStr[para_usm_ty],
             ):
                 # Keep track of vars that have been updated
                 self._cfd_updated_values.add(para)
@@ -201,6 +230,61 @@ class ParforLegalizeCFDPassImpl:
 
         return device_ty
 
+    def _find_device_resident_candidates(self):
+        """Returns the names of the arrays that are only accessed by parfor
+        nodes and never escape to the host code of the function.
+
+        An array escapes if it is used by any statement other than a parfor
+        and its own definition, e.g., if it is returned, passed to a function,
+        indexed outside a parfor or stored in a container, or if it is
+        aliased.
+        """
+        func_ir = self._state.func_ir
+        typemap = self._state.typemap
+
+        arrays = set()
+        escaped = set()
+        for block in func_ir.blocks.values():
+            for stmt in block.body:
+                if isinstance(stmt, Parfor):
+                    for var in stmt.list_vars():
+                        if isinstance(typemap.get(var.name), DpnpNdArray):
+                            arrays.add(var.name)
+                    continue
+                if isinstance(stmt, ir.Del):
+                    continue
+                for var in stmt.list_vars():
+                    if isinstance(stmt, ir.Assign) and (
+                        stmt.target.name == var.name
+                    ):
+                        continue
+                    escaped.add(var.name)
+
+        alias_map, arg_aliases = find_potential_aliases(
+            func_ir.blocks, func_ir.arg_names, typemap, func_ir
+        )
+
+        return {
+            arr
+            for arr in arrays
+            if arr not in escaped
+            and arr not in alias_map
+            and arr not in arg_aliases
+        }
+
+    def _record_device_resident_array(self, parfor, arr, usm_ty):
+        """Adds an array promoted to device USM to the diagnostics report."""
+        if self._diagnostics is None:
+            return
+
+        self._diagnostics.device_resident_arrays.append(
+            (
+                parfor.id,
+                arr,
+                ParforLegalizeCFDPassImpl.inputUsmTypeIntToStr[usm_ty],
+            )
+        )
+
     def _legalize_cfd_parfor_blocks(self, parfor):
         """Legalize the parfor params based on the compute follows data
         programming model and usm allocator precedence rule.
@@ -290,6 +374,10 @@ class ParforLegalizeCFDPassImpl:
             self.nested_fusion_info,
         )
 
+        self._device_resident_candidates = (
+            self._find_device_resident_candidates()
+        )
+
         # FIXME: Traversing the blocks in  topological order is not sufficient.
         # The traversal should be converted to a backward data flow traversal of
         # the CFG. The algorithm needs to then become a fixed-point work list
@@ -11,10 +11,13 @@ from numba.core.compiler_machinery import (
     register_pass,
 )
 from numba.core.ir_utils import remove_dels
-from numba.core.typed_passes import NativeLowering
+from numba.core.typed_passes import NativeLowering, NativeParforLowering
 
 from numba_dpex import config
 
+from .dpjit_lowerer import DpjitParforLower
+from .kernel_lowerer import KernelLower
+
 
 @register_pass(mutates_CFG=True, analysis_only=False)
 class ConstantSizeStaticLocalMemoryPass(FunctionPass):
@@ -131,6 +134,14 @@ class NoPythonBackend(FunctionPass):
         lowered = state["cr"]
         signature = typing.signature(state.return_type, *state.args)
 
+        # The kernels generated for the parfors of the function may still be
+        # getting built on worker threads.
+        from numba_dpex.core.parfors.kernel_builder import (
+            wait_for_kernel_builds,
+        )
+
+        wait_for_kernel_builds(state.metadata)
+
         from numba.core.compiler import compile_result
 
         state.cr = compile_result(
@@ -180,6 +191,8 @@ class QualNameDisambiguationLowering(NativeLowering):
     another @func decorated block, the numba compiler machinery
     creates same qualified names for different compiled function.
     Therefore, we utilize `unique_name` to resolve the ambiguity.
+    The function is lowered with `KernelLower` that attaches the
+    `numba_dpex.unroll` hints to the loops.
 
     Args:
         NativeLowering (CompilerPass): Superclass from which this
@@ -191,9 +204,33 @@ class QualNameDisambiguationLowering(NativeLowering):
 
     _name = "qual-name-disambiguation-lowering"
 
+    @property
+    def lowering_class(self):
+        return KernelLower
+
     def run_pass(self, state):
         qual_name = state.func_id.func_qualname
         state.func_id.func_qualname = state.func_id.unique_name
         ret = NativeLowering.run_pass(self, state)
         state.func_id.func_qualname = qual_name
         return ret
+
+
+@register_pass(mutates_CFG=True, analysis_only=False)
+class DpjitParforLowering(NativeParforLowering):
+    """Parfor lowering pass for dpjit functions
+
+    The function is lowered with `DpjitParforLower` that waits on the
+    asynchronous fill of a dpnp array once before the array is accessed from
+    the host, instead of on every access of an element.
+
+    Args:
+        NativeParforLowering (CompilerPass): Superclass from which this
+        class has been inherited.
+    """
+
+    _name = "dpjit-parfor-lowering"
+
+    @property
+    def lowering_class(self):
+        return DpjitParforLower
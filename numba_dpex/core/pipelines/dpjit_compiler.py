@@ -8,7 +8,6 @@ from numba.core.typed_passes import (
     AnnotateTypes,
     InlineOverloads,
     IRLegalization,
-    NativeParforLowering,
     NopythonRewrites,
     NoPythonSupportedFeatureValidation,
     NopythonTypeInference,
@@ -21,8 +20,10 @@ from numba.core.typed_passes import (
 
 from numba_dpex.core.exceptions import UnsupportedCompilationModeError
 from numba_dpex.core.passes import (
+    DpjitParforLowering,
     DumpParforDiagnostics,
     NoPythonBackend,
+    ParforBufferReusePass,
     ParforLegalizeCFDPass,
 )
 from numba_dpex.parfor_diagnostics import ExtendedParforDiagnostics
@@ -60,7 +61,12 @@ class _DpjitPassBuilder(object):
             ParforLegalizeCFDPass,
             "Legalize parfors for compute follows data",
         )
+        # Fusion has to run after the compute follows data legalization so
+        # that only parfors that run on the same device get fused.
         pm.add_pass(ParforFusionPass, "fuse parfors")
+        pm.add_pass(
+            ParforBufferReusePass, "reuse buffers of dead temporary arrays"
+        )
         pm.add_pass(ParforPreLoweringPass, "parfor prelowering")
 
         pm.finalize()
@@ -91,7 +97,7 @@ class _DpjitPassBuilder(object):
 
         # lower
         pm.add_pass(
-            NativeParforLowering, "lowerer with support for parfor nodes"
+            DpjitParforLowering, "lowerer with support for parfor nodes"
         )
         pm.add_pass(NoPythonBackend, "nopython mode backend")
         pm.add_pass(DumpParforDiagnostics, "dump parfor diagnostics")
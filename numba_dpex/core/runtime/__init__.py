@@ -2,6 +2,9 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
+import ctypes
+
 import llvmlite.binding as ll
 
 from ._dpexrt_python import c_helpers
@@ -13,3 +16,8 @@ for (
     c_address,
 ) in c_helpers.items():
     ll.add_symbol(py_name, c_address)
+
+# Free the USM allocations kept by the scratch pool of the runtime at exit.
+# An atexit handler runs before the interpreter is finalized, i.e., while
+# dpctl and the SYCL runtime are still alive.
+atexit.register(ctypes.CFUNCTYPE(None)(c_helpers["DPEXRT_scratch_pool_free"]))
@@ -43,14 +43,33 @@ static NRT_MemInfo *DPEXRT_MemInfo_fill(NRT_MemInfo *mi,
                                         bool value_is_float,
                                         int64_t value,
                                         const DPCTLSyclQueueRef qref);
+static MemInfoDtorInfo *MemInfo_get_usm_dtor_info(NRT_MemInfo *mi);
+static void DPEXRT_MemInfo_wait_pending_event(NRT_MemInfo *mi);
+static size_t DPEXRT_MemInfo_append_pending_event(NRT_MemInfo *mi,
+                                                  DPCTLSyclEventRef *events,
+                                                  size_t nevents);
 static NRT_MemInfo *NRT_MemInfo_new_from_usmndarray(PyObject *ndarrobj,
                                                     void *data,
                                                     npy_intp nitems,
                                                     npy_intp itemsize,
                                                     DPCTLSyclQueueRef qref);
+static NRT_MemInfo *MemInfo_new_for_usm(npy_intp size,
+                                        size_t usm_type,
+                                        const DPCTLSyclQueueRef qref,
+                                        void *data);
 static NRT_MemInfo *DPEXRT_MemInfo_alloc(npy_intp size,
                                          size_t usm_type,
                                          const DPCTLSyclQueueRef qref);
+static NRT_MemInfo *DPEXRT_MemInfo_alloc_scratch(npy_intp size,
+                                                 size_t usm_type,
+                                                 const DPCTLSyclQueueRef qref);
+static void *
+scratch_pool_acquire(size_t size, size_t usm_type, DPCTLSyclQueueRef qref);
+static bool scratch_pool_release(void *data,
+                                 size_t size,
+                                 size_t usm_type,
+                                 DPCTLSyclQueueRef qref);
+static void DPEXRT_scratch_pool_free(void);
 static void usmndarray_meminfo_dtor(void *ptr, size_t size, void *info);
 static PyObject *box_from_arystruct_parent(usmarystruct_t *arystruct,
                                            int ndim,
@@ -122,6 +141,174 @@ static void usm_free(void *data, void *opaque_data)
     DPCTLfree_with_queue(data, qref);
 }
 
+/*----------------------------------------------------------------------------*/
+/*--------- Scratch pool for short-lived USM allocations             ---------*/
+/*----------------------------------------------------------------------------*/
+
+/* The maximum number of free allocations kept by the scratch pool. */
+#define DPEXRT_SCRATCH_POOL_CAPACITY 32
+/* The smallest size class of the scratch pool in bytes. */
+#define DPEXRT_SCRATCH_POOL_MIN_SIZE 256
+
+/*!
+ * @brief A free USM allocation stored in the scratch pool.
+ *
+ * The qref is the queue the allocation was made with and is owned by the
+ * pool until the allocation is reused or freed.
+ */
+typedef struct
+{
+    void *data;
+    size_t size;
+    size_t usm_type;
+    DPCTLSyclQueueRef qref;
+} ScratchPoolEntry;
+
+static ScratchPoolEntry scratch_pool[DPEXRT_SCRATCH_POOL_CAPACITY];
+static size_t scratch_pool_nentries = 0;
+// Set once the pool is freed at exit, the allocations released after that
+// point are freed by their owner.
+static bool scratch_pool_is_freed = false;
+
+/*!
+ * @brief Rounds up an allocation size to the size class used by the scratch
+ * pool, i.e., the next power of two that is not smaller than
+ * DPEXRT_SCRATCH_POOL_MIN_SIZE.
+ */
+static size_t scratch_pool_size_class(size_t size)
+{
+    size_t size_class = DPEXRT_SCRATCH_POOL_MIN_SIZE;
+
+    while (size_class < size)
+        size_class <<= 1;
+
+    return size_class;
+}
+
+/*!
+ * @brief Returns true if two queues target the same device and context, i.e.
+ * a USM allocation made with one queue is usable with the other.
+ */
+static bool queues_share_device_and_context(DPCTLSyclQueueRef qref1,
+                                            DPCTLSyclQueueRef qref2)
+{
+    bool ret = false;
+    DPCTLSyclContextRef cref1 = DPCTLQueue_GetContext(qref1);
+    DPCTLSyclContextRef cref2 = DPCTLQueue_GetContext(qref2);
+    DPCTLSyclDeviceRef dref1 = DPCTLQueue_GetDevice(qref1);
+    DPCTLSyclDeviceRef dref2 = DPCTLQueue_GetDevice(qref2);
+
+    ret = DPCTLContext_AreEq(cref1, cref2) && DPCTLDevice_AreEq(dref1, dref2);
+
+    DPCTLContext_Delete(cref1);
+    DPCTLContext_Delete(cref2);
+    DPCTLDevice_Delete(dref1);
+    DPCTLDevice_Delete(dref2);
+
+    return ret;
+}
+
+/*!
+ * @brief Removes and returns a free allocation of the given size class from
+ * the scratch pool.
+ *
+ * The pool is shared by all threads and the GIL is used to guard it.
+ *
+ * @param    size           The size class of the allocation.
+ * @param    usm_type       The usm type of the allocation.
+ * @param    qref           The queue on which the allocation is to be used.
+ * @return   {return}       A pointer to the USM allocation, NULL if the pool
+ *                          has no matching allocation.
+ */
+static void *
+scratch_pool_acquire(size_t size, size_t usm_type, DPCTLSyclQueueRef qref)
+{
+    void *data = NULL;
+    PyGILState_STATE gstate;
+
+    gstate = PyGILState_Ensure();
+    for (size_t i = 0; i < scratch_pool_nentries; ++i) {
+        ScratchPoolEntry *entry = &scratch_pool[i];
+
+        if (entry->size != size || entry->usm_type != usm_type ||
+            !queues_share_device_and_context(entry->qref, qref))
+            continue;
+
+        data = entry->data;
+        DPCTLQueue_Delete(entry->qref);
+        // Fill the hole with the last entry of the pool
+        scratch_pool[i] = scratch_pool[--scratch_pool_nentries];
+        break;
+    }
+    PyGILState_Release(gstate);
+
+    DPEXRT_DEBUG(drt_debug_print(
+        "DPEXRT-DEBUG: scratch_pool_acquire size=%zu data=%p at %s, line %d\n",
+        size, data, __FILE__, __LINE__));
+
+    return data;
+}
+
+/*!
+ * @brief Returns an allocation to the scratch pool.
+ *
+ * @param    data           The USM allocation.
+ * @param    size           The size class of the allocation.
+ * @param    usm_type       The usm type of the allocation.
+ * @param    qref           The queue the allocation was made with. The
+ *                          ownership of the qref is passed to the pool if the
+ *                          allocation was returned to the pool.
+ * @return   {return}       True if the allocation was returned to the pool,
+ *                          false if the pool is full or already freed and the
+ *                          caller has to free the allocation.
+ */
+static bool scratch_pool_release(void *data,
+                                 size_t size,
+                                 size_t usm_type,
+                                 DPCTLSyclQueueRef qref)
+{
+    bool released = false;
+    PyGILState_STATE gstate;
+
+    gstate = PyGILState_Ensure();
+    if (!scratch_pool_is_freed &&
+        scratch_pool_nentries < DPEXRT_SCRATCH_POOL_CAPACITY)
+    {
+        ScratchPoolEntry *entry = &scratch_pool[scratch_pool_nentries++];
+        entry->data = data;
+        entry->size = size;
+        entry->usm_type = usm_type;
+        entry->qref = qref;
+        released = true;
+    }
+    PyGILState_Release(gstate);
+
+    return released;
+}
+
+/*!
+ * @brief Frees all allocations stored in the scratch pool.
+ *
+ * The function is registered with Python's atexit module by
+ * numba_dpex.core.runtime, so that it runs before the interpreter is
+ * finalized while dpctl and the SYCL runtime are still alive.
+ */
+static void DPEXRT_scratch_pool_free(void)
+{
+    PyGILState_STATE gstate;
+
+    gstate = PyGILState_Ensure();
+    for (size_t i = 0; i < scratch_pool_nentries; ++i) {
+        ScratchPoolEntry *entry = &scratch_pool[i];
+
+        DPCTLfree_with_queue(entry->data, entry->qref);
+        DPCTLQueue_Delete(entry->qref);
+    }
+    scratch_pool_nentries = 0;
+    scratch_pool_is_freed = true;
+    PyGILState_Release(gstate);
+}
+
 /*----------------------------------------------------------------------------*/
 /*--------- Functions for dpctl libsyclinterface/sycl gluing         ---------*/
 /*----------------------------------------------------------------------------*/
@@ -344,16 +531,38 @@ static void usmndarray_meminfo_dtor(void *ptr, size_t size, void *info)
         return;
     }
 
-    // If there is no owner PyObject, free the data by calling the
-    // external_allocator->free
-    if (!(mi_dtor_info->owner))
-        mi_dtor_info->mi->external_allocator->free(
-            mi_dtor_info->mi->data,
-            mi_dtor_info->mi->external_allocator->opaque_data);
+    // Any asynchronous operation still pending on the data has to finish
+    // before the data can be freed.
+    if (mi_dtor_info->pending_event) {
+        DPCTLEvent_Wait((DPCTLSyclEventRef)mi_dtor_info->pending_event);
+        DPCTLEvent_Delete((DPCTLSyclEventRef)mi_dtor_info->pending_event);
+        mi_dtor_info->pending_event = NULL;
+    }
+
+    // If there is no owner PyObject, return the data to the scratch pool if
+    // it was drawn from it, or else free the data by calling the
+    // external_allocator->free. The scratch pool takes the ownership of the
+    // DpctlSyclQueueRef object stored inside the external_allocator.
+    if (!(mi_dtor_info->owner)) {
+        if (mi_dtor_info->scratch_usm_type &&
+            scratch_pool_release(mi_dtor_info->mi->data, mi_dtor_info->mi->size,
+                                 mi_dtor_info->scratch_usm_type,
+                                 (DPCTLSyclQueueRef)mi_dtor_info->mi
+                                     ->external_allocator->opaque_data))
+        {
+            mi_dtor_info->mi->external_allocator->opaque_data = NULL;
+        }
+        else {
+            mi_dtor_info->mi->external_allocator->free(
+                mi_dtor_info->mi->data,
+                mi_dtor_info->mi->external_allocator->opaque_data);
+        }
+    }
 
     // free the DpctlSyclQueueRef object stored inside the external_allocator
-    DPCTLQueue_Delete(
-        (DPCTLSyclQueueRef)mi_dtor_info->mi->external_allocator->opaque_data);
+    if (mi_dtor_info->mi->external_allocator->opaque_data)
+        DPCTLQueue_Delete((DPCTLSyclQueueRef)mi_dtor_info->mi
+                              ->external_allocator->opaque_data);
 
     // free the external_allocator object
     free(mi_dtor_info->mi->external_allocator);
@@ -399,10 +608,85 @@ static MemInfoDtorInfo *MemInfoDtorInfo_new(NRT_MemInfo *mi, PyObject *owner)
     }
     mi_dtor_info->mi = mi;
     mi_dtor_info->owner = owner;
+    mi_dtor_info->pending_event = NULL;
+    mi_dtor_info->scratch_usm_type = 0;
 
     return mi_dtor_info;
 }
 
+/*!
+ * @brief Returns the MemInfoDtorInfo object of a MemInfo that was created by
+ * DPEXRT.
+ *
+ * @param    mi             An NRT_MemInfo object.
+ * @return   {return}       The MemInfoDtorInfo stored as the dtor_info of the
+ *                          MemInfo, NULL if the MemInfo was not created by
+ *                          DPEXRT.
+ */
+static MemInfoDtorInfo *MemInfo_get_usm_dtor_info(NRT_MemInfo *mi)
+{
+    if (!mi || mi->dtor != usmndarray_meminfo_dtor)
+        return NULL;
+
+    return (MemInfoDtorInfo *)mi->dtor_info;
+}
+
+/*!
+ * @brief Waits on any asynchronous operation that is pending on the data of
+ * a MemInfo object and releases the associated event.
+ *
+ * The function has to be called before the data of the MemInfo is accessed
+ * from the host.
+ *
+ * @param    mi             An NRT_MemInfo object, may be NULL.
+ */
+static void DPEXRT_MemInfo_wait_pending_event(NRT_MemInfo *mi)
+{
+    MemInfoDtorInfo *mi_dtor_info = NULL;
+
+    if (!(mi_dtor_info = MemInfo_get_usm_dtor_info(mi)))
+        return;
+
+    if (mi_dtor_info->pending_event) {
+        DPEXRT_DEBUG(drt_debug_print(
+            "DPEXRT-DEBUG: Waiting on pending event for mi=%p at %s, line %d\n",
+            mi, __FILE__, __LINE__));
+        DPCTLEvent_Wait((DPCTLSyclEventRef)mi_dtor_info->pending_event);
+        DPCTLEvent_Delete((DPCTLSyclEventRef)mi_dtor_info->pending_event);
+        mi_dtor_info->pending_event = NULL;
+    }
+}
+
+/*!
+ * @brief Moves the pending event of a MemInfo object, if any, into an array of
+ * events that will be used as the dependencies of a kernel submission.
+ *
+ * The ownership of the event is transferred to the caller, who has to
+ * delete the event once the dependent kernel has been waited on.
+ *
+ * @param    mi             An NRT_MemInfo object, may be NULL.
+ * @param    events         An array of DPCTLSyclEventRef with enough free
+ *                          space to store one more event.
+ * @param    nevents        The number of events already stored in `events`.
+ * @return   {return}       The updated number of events stored in `events`.
+ */
+static size_t DPEXRT_MemInfo_append_pending_event(NRT_MemInfo *mi,
+                                                  DPCTLSyclEventRef *events,
+                                                  size_t nevents)
+{
+    MemInfoDtorInfo *mi_dtor_info = NULL;
+
+    if (!(mi_dtor_info = MemInfo_get_usm_dtor_info(mi)))
+        return nevents;
+
+    if (mi_dtor_info->pending_event) {
+        events[nevents++] = (DPCTLSyclEventRef)mi_dtor_info->pending_event;
+        mi_dtor_info->pending_event = NULL;
+    }
+
+    return nevents;
+}
+
 /*!
  * @brief Creates a NRT_MemInfo object for a dpnp.ndarray
  *
@@ -487,33 +771,29 @@ error:
 }
 
 /*!
- * @brief Creates a NRT_MemInfo object whose data is allocated using a USM
- * allocator.
+ * @brief Creates a NRT_MemInfo object for USM data.
  *
  * @param    size         The size of memory (data) owned by the NRT_MemInfo
  *                        object.
  * @param    usm_type     The usm type of the memory.
- * @param    qref         The sycl queue on which the memory was allocated. Note
- *                        that the ownership of the qref object is passed to
- *                        the NRT_MemInfo. As such, it is the caller's
- *                        responsibility to ensure the qref is nt owned by any
- *                        other object and is not deallocated. For such cases,
- *                        the caller should copy the DpctlSyclQueueRef and
- *                        pass a copy of the original qref.
+ * @param    qref         The sycl queue on which the memory was allocated. The
+ *                        ownership of the qref object is passed to the
+ *                        NRT_MemInfo.
+ * @param    data         An existing USM allocation of at least size bytes
+ *                        whose ownership is passed to the NRT_MemInfo. If
+ *                        NULL, the data is allocated using a USM allocator.
  * @return   {return}     A new NRT_MemInfo object, NULL if no NRT_MemInfo
  *                        object could be created.
  */
-static NRT_MemInfo *DPEXRT_MemInfo_alloc(npy_intp size,
-                                         size_t usm_type,
-                                         const DPCTLSyclQueueRef qref)
+static NRT_MemInfo *MemInfo_new_for_usm(npy_intp size,
+                                        size_t usm_type,
+                                        const DPCTLSyclQueueRef qref,
+                                        void *data)
 {
     NRT_MemInfo *mi = NULL;
     NRT_ExternalAllocator *ext_alloca = NULL;
     MemInfoDtorInfo *midtor_info = NULL;
 
-    DPEXRT_DEBUG(drt_debug_print(
-        "DPEXRT-DEBUG: Inside DPEXRT_MemInfo_alloc  %s, line %d\n", __FILE__,
-        __LINE__));
     // Allocate a new NRT_MemInfo object
     if (!(mi = (NRT_MemInfo *)malloc(sizeof(NRT_MemInfo)))) {
         DPEXRT_DEBUG(drt_debug_print(
@@ -531,12 +811,12 @@ static NRT_MemInfo *DPEXRT_MemInfo_alloc(npy_intp size,
     mi->refct = 1; /* starts with 1 refct */
     mi->dtor = usmndarray_meminfo_dtor;
     mi->dtor_info = midtor_info;
-    mi->data = ext_alloca->malloc(size, qref);
+    mi->data = data ? data : ext_alloca->malloc(size, qref);
 
     DPEXRT_DEBUG(
         DPCTLSyclDeviceRef device_ref; device_ref = DPCTLQueue_GetDevice(qref);
         drt_debug_print(
-            "DPEXRT-DEBUG: DPEXRT_MemInfo_alloc, device info in %s at %d:\n%s",
+            "DPEXRT-DEBUG: MemInfo_new_for_usm, device info in %s at %d:\n%s",
             __FILE__, __LINE__, DPCTLDeviceMgr_GetDeviceInfoStr(device_ref));
         DPCTLDevice_Delete(device_ref););
 
@@ -546,7 +826,7 @@ static NRT_MemInfo *DPEXRT_MemInfo_alloc(npy_intp size,
     mi->size = size;
     mi->external_allocator = ext_alloca;
     DPEXRT_DEBUG(drt_debug_print(
-        "DPEXRT-DEBUG: DPEXRT_MemInfo_alloc mi=%p "
+        "DPEXRT-DEBUG: MemInfo_new_for_usm mi=%p "
         "external_allocator=%p for usm_type=%zu on queue=%p, %s at %d\n",
         mi, ext_alloca, usm_type, DPCTLQueue_Hash(qref), __FILE__, __LINE__));
 
@@ -560,11 +840,84 @@ error:
     return NULL;
 }
 
+/*!
+ * @brief Creates a NRT_MemInfo object whose data is allocated using a USM
+ * allocator.
+ *
+ * @param    size         The size of memory (data) owned by the NRT_MemInfo
+ *                        object.
+ * @param    usm_type     The usm type of the memory.
+ * @param    qref         The sycl queue on which the memory was allocated. Note
+ *                        that the ownership of the qref object is passed to
+ *                        the NRT_MemInfo. As such, it is the caller's
+ *                        responsibility to ensure the qref is nt owned by any
+ *                        other object and is not deallocated. For such cases,
+ *                        the caller should copy the DpctlSyclQueueRef and
+ *                        pass a copy of the original qref.
+ * @return   {return}     A new NRT_MemInfo object, NULL if no NRT_MemInfo
+ *                        object could be created.
+ */
+static NRT_MemInfo *DPEXRT_MemInfo_alloc(npy_intp size,
+                                         size_t usm_type,
+                                         const DPCTLSyclQueueRef qref)
+{
+    DPEXRT_DEBUG(drt_debug_print(
+        "DPEXRT-DEBUG: Inside DPEXRT_MemInfo_alloc  %s, line %d\n", __FILE__,
+        __LINE__));
+
+    return MemInfo_new_for_usm(size, usm_type, qref, NULL);
+}
+
+/*!
+ * @brief Creates a NRT_MemInfo object whose data is drawn from the scratch
+ * pool.
+ *
+ * The function is meant for short-lived temporaries, e.g., the partial results
+ * of a reduction, that are allocated again and again with the same size. The
+ * allocation is rounded up to a power of two size class. If the pool has no
+ * free allocation of the size class for the device and context of the queue a
+ * new allocation is made. When the NRT_MemInfo is destroyed the data is
+ * returned to the pool instead of being freed. The data is not initialized.
+ *
+ * @param    size         The minimum size of memory (data) owned by the
+ *                        NRT_MemInfo object.
+ * @param    usm_type     The usm type of the memory.
+ * @param    qref         The sycl queue on which the memory is used. Similar
+ *                        to DPEXRT_MemInfo_alloc, the ownership of the qref
+ *                        object is passed to the NRT_MemInfo.
+ * @return   {return}     A new NRT_MemInfo object, NULL if no NRT_MemInfo
+ *                        object could be created.
+ */
+static NRT_MemInfo *DPEXRT_MemInfo_alloc_scratch(npy_intp size,
+                                                 size_t usm_type,
+                                                 const DPCTLSyclQueueRef qref)
+{
+    NRT_MemInfo *mi = NULL;
+    void *data = NULL;
+    size_t size_class = scratch_pool_size_class((size_t)size);
+
+    data = scratch_pool_acquire(size_class, usm_type, qref);
+    if (!(mi = MemInfo_new_for_usm(size_class, usm_type, qref, data))) {
+        if (data)
+            DPCTLfree_with_queue(data, qref);
+        return NULL;
+    }
+    ((MemInfoDtorInfo *)mi->dtor_info)->scratch_usm_type = usm_type;
+
+    return mi;
+}
+
 /**
  * @brief Interface for the core.runtime.context.DpexRTContext.meminfo_alloc.
  * This function takes an allocated memory as NRT_MemInfo and fills it with
  * the value specified by `value`.
  *
+ * The fill is asynchronous. The event returned by the DPCTLQueue_Fill call is
+ * stored as the pending_event of the MemInfo and is either added as a
+ * dependency of the first kernel that consumes the MemInfo or is waited on
+ * before the data is accessed from the host
+ * (see DPEXRT_MemInfo_wait_pending_event).
+ *
  * @param mi                An NRT_MemInfo object, should be found from memory
  *                          allocation.
  * @param itemsize          The itemsize, the size of each item in the array.
@@ -583,6 +936,7 @@ static NRT_MemInfo *DPEXRT_MemInfo_fill(NRT_MemInfo *mi,
                                         const DPCTLSyclQueueRef qref)
 {
     DPCTLSyclEventRef eref = NULL;
+    MemInfoDtorInfo *mi_dtor_info = NULL;
     size_t count = 0, size = 0, exp = 0;
 
     /**
@@ -709,8 +1063,21 @@ static NRT_MemInfo *DPEXRT_MemInfo_fill(NRT_MemInfo *mi,
         goto error;
     }
 
-    DPCTLEvent_Wait(eref);
-    DPCTLEvent_Delete(eref);
+    // Defer the wait on the fill to the first consumer of the data. If the
+    // MemInfo was not created by DPEXRT there is nowhere to store the event
+    // and the fill has to be synchronous.
+    if (!(mi_dtor_info = MemInfo_get_usm_dtor_info(mi))) {
+        DPCTLEvent_Wait(eref);
+        DPCTLEvent_Delete(eref);
+        return mi;
+    }
+
+    // Serialize with any earlier operation that is still pending.
+    if (mi_dtor_info->pending_event) {
+        DPCTLEvent_Wait((DPCTLSyclEventRef)mi_dtor_info->pending_event);
+        DPCTLEvent_Delete((DPCTLSyclEventRef)mi_dtor_info->pending_event);
+    }
+    mi_dtor_info->pending_event = (void *)eref;
 
     return mi;
 
@@ -1057,6 +1424,10 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
     DPEXRT_DEBUG(drt_debug_print(
         "DPEXRT-DEBUG: In DPEXRT_sycl_usm_ndarray_to_python_acqref.\n"));
 
+    // The boxed array is accessible from Python, so any pending asynchronous
+    // operation on its data has to complete first.
+    DPEXRT_MemInfo_wait_pending_event(arystruct->meminfo);
+
     if (descr == NULL) {
         PyErr_Format(
             PyExc_RuntimeError,
@@ -1480,7 +1851,13 @@ static PyObject *build_c_helpers_dict(void)
     _declpointer("DpexrtQueue_SubmitRange", &DpexrtQueue_SubmitRange);
     _declpointer("DpexrtQueue_SubmitNDRange", &DpexrtQueue_SubmitNDRange);
     _declpointer("DPEXRT_MemInfo_alloc", &DPEXRT_MemInfo_alloc);
+    _declpointer("DPEXRT_MemInfo_alloc_scratch", &DPEXRT_MemInfo_alloc_scratch);
+    _declpointer("DPEXRT_scratch_pool_free", &DPEXRT_scratch_pool_free);
     _declpointer("DPEXRT_MemInfo_fill", &DPEXRT_MemInfo_fill);
+    _declpointer("DPEXRT_MemInfo_wait_pending_event",
+                 &DPEXRT_MemInfo_wait_pending_event);
+    _declpointer("DPEXRT_MemInfo_append_pending_event",
+                 &DPEXRT_MemInfo_append_pending_event);
     _declpointer("NRT_ExternalAllocator_new_for_usm",
                  &NRT_ExternalAllocator_new_for_usm);
     _declpointer("DPEXRT_sycl_queue_from_python",
@@ -1555,8 +1932,18 @@ MOD_INIT(_dpexrt_python)
                        PyLong_FromVoidPtr(&DpexrtQueue_SubmitNDRange));
     PyModule_AddObject(m, "DPEXRT_MemInfo_alloc",
                        PyLong_FromVoidPtr(&DPEXRT_MemInfo_alloc));
+    PyModule_AddObject(m, "DPEXRT_MemInfo_alloc_scratch",
+                       PyLong_FromVoidPtr(&DPEXRT_MemInfo_alloc_scratch));
+    PyModule_AddObject(m, "DPEXRT_scratch_pool_free",
+                       PyLong_FromVoidPtr(&DPEXRT_scratch_pool_free));
     PyModule_AddObject(m, "DPEXRT_MemInfo_fill",
                        PyLong_FromVoidPtr(&DPEXRT_MemInfo_fill));
+    PyModule_AddObject(m, "DPEXRT_MemInfo_wait_pending_event",
+                       PyLong_FromVoidPtr(&DPEXRT_MemInfo_wait_pending_event));
+    PyModule_AddObject(
+        m, "DPEXRT_MemInfo_append_pending_event",
+        PyLong_FromVoidPtr(&DPEXRT_MemInfo_append_pending_event));
     PyModule_AddObject(m, "c_helpers", build_c_helpers_dict());
+
     return MOD_SUCCESS_VAL(m);
 }
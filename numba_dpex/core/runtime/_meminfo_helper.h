@@ -36,11 +36,22 @@ struct MemInfo
  * The struct is stored in the dtor_info attribute of a MemInfo object and
  * used by the destructor to free the MemInfo and DecRef the Pyobject.
  *
+ * The pending_event member stores a DPCTLSyclEventRef for an asynchronous
+ * operation (e.g. a fill) that was submitted on the MemInfo's data and has not
+ * yet been waited on. Any consumer of the data must either add the event as a
+ * dependency or wait on it before accessing the data.
+ *
+ * The scratch_usm_type member is non-zero if the MemInfo's data was drawn
+ * from the DPEXRT scratch pool. Such data is returned to the pool instead of
+ * being freed when the MemInfo is destroyed.
+ *
  */
 typedef struct
 {
     PyObject *owner;
     NRT_MemInfo *mi;
+    void *pending_event;
+    size_t scratch_usm_type;
 } MemInfoDtorInfo;
 
 typedef struct
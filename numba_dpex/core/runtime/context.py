@@ -36,6 +36,18 @@ class DpexRTContext(object):
 
         return self.meminfo_alloc_unchecked(builder, size, usm_type, queue_ref)
 
+    @_check_null_result
+    def meminfo_alloc_scratch(self, builder, size, usm_type, queue_ref):
+        """
+        Wrapper to call
+        :func:`~context.DpexRTContext.meminfo_alloc_scratch_unchecked` with
+        null checking of the returned value.
+        """
+
+        return self.meminfo_alloc_scratch_unchecked(
+            builder, size, usm_type, queue_ref
+        )
+
     @_check_null_result
     def meminfo_fill(
         self,
@@ -98,6 +110,36 @@ class DpexRTContext(object):
 
         return ret
 
+    def meminfo_alloc_scratch_unchecked(
+        self, builder, size, usm_type, queue_ref
+    ):
+        """Allocate a new MemInfo whose data payload of at least `size` bytes
+        is drawn from the DPEXRT scratch pool.
+
+        The data is returned to the pool when the MemInfo is destroyed. The
+        arguments are the same as for
+        :func:`~context.DpexRTContext.meminfo_alloc_unchecked`.
+
+        Returns:
+            ret (`llvmlite.ir.instructions.CallInstr`): A pointer to the `MemInfo`
+                is returned from the `DPEXRT_MemInfo_alloc_scratch` C function
+                call.
+        """
+
+        mod = builder.module
+        u64 = llvmir.IntType(64)
+        fnty = llvmir.FunctionType(
+            cgutils.voidptr_t, [cgutils.intp_t, u64, cgutils.voidptr_t]
+        )
+        fn = cgutils.get_or_insert_function(
+            mod, fnty, "DPEXRT_MemInfo_alloc_scratch"
+        )
+        fn.return_value.add_attribute("noalias")
+
+        ret = builder.call(fn, [size, usm_type, queue_ref])
+
+        return ret
+
     def meminfo_fill_unchecked(
         self,
         builder,
@@ -162,6 +204,66 @@ class DpexRTContext(object):
 
         return ret
 
+    def meminfo_wait_pending_event(self, builder, meminfo):
+        """Waits on any asynchronous operation, e.g., a fill, that is still
+        pending on the data of a `MemInfo`.
+
+        The call has to be inserted before the data of a `MemInfo` allocated
+        inside dpjit is accessed from the host.
+
+        Args:
+            builder (`llvmlite.ir.builder.IRBuilder`): LLVM IR builder.
+            meminfo (`llvmlite.ir.values.Value`): An LLVM Value storing the
+                pointer to the `MemInfo`.
+
+        Returns:
+            ret (`llvmlite.ir.instructions.CallInstr`): The call to the
+                `DPEXRT_MemInfo_wait_pending_event` C function.
+        """
+        mod = builder.module
+        fnty = llvmir.FunctionType(llvmir.types.VoidType(), [cgutils.voidptr_t])
+        fn = cgutils.get_or_insert_function(
+            mod, fnty, "DPEXRT_MemInfo_wait_pending_event"
+        )
+        fn.args[0].add_attribute("nocapture")
+
+        return builder.call(fn, [builder.bitcast(meminfo, cgutils.voidptr_t)])
+
+    def meminfo_append_pending_event(self, builder, meminfo, events, nevents):
+        """Moves the pending event of a `MemInfo`, if any, into an array of
+        events to be used as the dependencies of a kernel submission.
+
+        The ownership of the moved event is transferred to the caller.
+
+        Args:
+            builder (`llvmlite.ir.builder.IRBuilder`): LLVM IR builder.
+            meminfo (`llvmlite.ir.values.Value`): An LLVM Value storing the
+                pointer to the `MemInfo`.
+            events (`llvmlite.ir.values.Value`): An LLVM Value storing a
+                pointer to an array of `DPCTLSyclEventRef`.
+            nevents (`llvmlite.ir.values.Value`): An LLVM int64 Value storing
+                the number of events already present in the ``events`` array.
+
+        Returns:
+            ret (`llvmlite.ir.instructions.CallInstr`): The updated number of
+                events in the ``events`` array as returned by the
+                `DPEXRT_MemInfo_append_pending_event` C function.
+        """
+        mod = builder.module
+        u64 = llvmir.IntType(64)
+        fnty = llvmir.FunctionType(
+            u64, [cgutils.voidptr_t, cgutils.voidptr_t.as_pointer(), u64]
+        )
+        fn = cgutils.get_or_insert_function(
+            mod, fnty, "DPEXRT_MemInfo_append_pending_event"
+        )
+        fn.args[0].add_attribute("nocapture")
+
+        return builder.call(
+            fn,
+            [builder.bitcast(meminfo, cgutils.voidptr_t), events, nevents],
+        )
+
     def arraystruct_from_python(self, pyapi, obj, ptr):
         """Generates a call to DPEXRT_sycl_usm_ndarray_from_python C function
         defined in the _DPREXRT_python Python extension.
@@ -9,7 +9,7 @@ import dpnp
 from llvmlite import binding as ll
 from llvmlite import ir as llvmir
 from numba import typeof
-from numba.core import cgutils, funcdesc, types, typing, utils
+from numba.core import cgutils, fastmathpass, funcdesc, types, typing, utils
 from numba.core.base import BaseContext
 from numba.core.callconv import MinimalCallConv
 from numba.core.registry import cpu_target
@@ -123,6 +123,9 @@ class DpexKernelTargetContext(BaseContext):
     """
 
     implement_powi_as_math_call = True
+    # Prefix of the OpenCL builtins, i.e., "native" or "half", that single
+    # precision math functions are mapped to. Set per kernel via subtarget.
+    math_builtins = None
 
     def _gen_arg_addrspace_md(self, fn):
         """Generate kernel_arg_addr_space metadata."""
@@ -164,7 +167,32 @@ class DpexKernelTargetContext(BaseContext):
         name = llvmir.MetaDataString(mod, "kernel_arg_base_type")
         return mod.add_metadata([name] + consts)
 
-    def _finalize_kernel_wrapper_module(self, fn):
+    def _gen_kernel_attributes_md(self, fn, kernel_attributes):
+        """Generate the reqd_work_group_size, work_group_size_hint and
+        intel_reqd_sub_group_size function metadata.
+
+        The llvm-spirv translator turns the metadata into the LocalSize,
+        LocalSizeHint and SubgroupSize execution modes of the kernel.
+        """
+        mod = fn.module
+        i32 = llvmir.IntType(32)
+
+        for name, size in (
+            ("reqd_work_group_size", kernel_attributes.reqd_work_group_size),
+            ("work_group_size_hint", kernel_attributes.work_group_size_hint),
+        ):
+            if size is not None:
+                # Unspecified dimensions of the work-group are of size one.
+                size = tuple(size) + (1,) * (3 - len(size))
+                fn.set_metadata(name, mod.add_metadata([i32(v) for v in size]))
+
+        if kernel_attributes.reqd_sub_group_size is not None:
+            fn.set_metadata(
+                "intel_reqd_sub_group_size",
+                mod.add_metadata([i32(kernel_attributes.reqd_sub_group_size)]),
+            )
+
+    def _finalize_kernel_wrapper_module(self, fn, kernel_attributes=None):
         """Add metadata and calling convention to the wrapper function.
 
         The helper function adds function metadata to the wrapper function and
@@ -174,14 +202,57 @@ class DpexKernelTargetContext(BaseContext):
 
         Args:
             fn: LLVM function representing the "kernel" wrapper function.
+            kernel_attributes (DpexKernelAttributes): Optional attributes
+                that are added as function metadata.
 
         """
         # Set norecurse
         fn.attributes.add("norecurse")
         # Set SPIR kernel calling convention
         fn.calling_convention = CC_SPIR_KERNEL
+        if kernel_attributes is not None:
+            self._gen_kernel_attributes_md(fn, kernel_attributes)
+
+    def _specialize_array_shape(self, builder, aryty, ary, shape):
+        """Replaces the shape of an array kernel argument with constants.
+
+        The nitems and, for C-contiguous arrays, the strides of the array are
+        derived from the shape and replaced as well, so that the index
+        computations inside the kernel are folded by LLVM.
+
+        Args:
+            builder: The LLVM IR builder of the kernel wrapper.
+            aryty: The Numba type of the array argument.
+            ary: The LLVM struct value of the array argument.
+            shape (tuple): The shape on which the kernel is specialized.
 
-    def _generate_spir_kernel_wrapper(self, func, argtypes):
+        Returns: The LLVM struct value with a constant shape.
+        """
+        intp_t = self.get_value_type(types.intp)
+        array = cgutils.create_struct_proxy(aryty)(self, builder, value=ary)
+        array.shape = cgutils.pack_array(
+            builder, [intp_t(dim) for dim in shape]
+        )
+        nitems = 1
+        for dim in shape:
+            nitems *= dim
+        array.nitems = intp_t(nitems)
+
+        if aryty.layout == "C":
+            stride = self.get_abi_sizeof(self.get_data_type(aryty.dtype))
+            strides = []
+            for dim in reversed(shape):
+                strides.append(stride)
+                stride *= dim
+            array.strides = cgutils.pack_array(
+                builder, [intp_t(s) for s in reversed(strides)]
+            )
+
+        return array._getvalue()
+
+    def _generate_spir_kernel_wrapper(
+        self, func, argtypes, arg_shapes=None, kernel_attributes=None
+    ):
         module = func.module
         arginfo = self.get_arg_packer(argtypes)
         wrapperfnty = llvmir.FunctionType(
@@ -200,6 +271,13 @@ class DpexKernelTargetContext(BaseContext):
         builder = llvmir.IRBuilder(wrapper.append_basic_block("entry"))
 
         callargs = arginfo.from_arguments(builder, wrapper.args)
+        # Fold the shapes of the arrays the kernel was specialized on into the
+        # kernel.
+        if arg_shapes:
+            for i, shape in arg_shapes.items():
+                callargs[i] = self._specialize_array_shape(
+                    builder, argtypes[i], callargs[i], shape
+                )
 
         # XXX handle error status
         status, _ = self.call_conv.call_function(
@@ -207,7 +285,7 @@ class DpexKernelTargetContext(BaseContext):
         )
         builder.ret_void()
 
-        self._finalize_kernel_wrapper_module(wrapper)
+        self._finalize_kernel_wrapper_module(wrapper, kernel_attributes)
 
         # Link the spir_func module to the wrapper module
         module.link_in(ll.parse_assembly(str(wrapper_module)))
@@ -244,6 +322,10 @@ class DpexKernelTargetContext(BaseContext):
         self.ufunc_db = copy.deepcopy(ufunc_db)
         self.cpu_context = cpu_target.target_context
 
+    def post_lowering(self, mod, library):
+        if self.fastmath:
+            fastmathpass.rewrite_module(mod, self.fastmath)
+
     def create_module(self, name):
         return self._internal_codegen._create_empty_module(name)
 
@@ -327,11 +409,15 @@ class DpexKernelTargetContext(BaseContext):
             name + "dpex_fn", argtypes, abi_tags=abi_tags, uid=uid
         )
 
-    def prepare_spir_kernel(self, func, argtypes):
+    def prepare_spir_kernel(
+        self, func, argtypes, arg_shapes=None, kernel_attributes=None
+    ):
         module = func.module
         func.linkage = "linkonce_odr"
         module.data_layout = codegen.SPIR_DATA_LAYOUT[self.address_size]
-        wrapper = self._generate_spir_kernel_wrapper(func, argtypes)
+        wrapper = self._generate_spir_kernel_wrapper(
+            func, argtypes, arg_shapes, kernel_attributes
+        )
         return wrapper
 
     def set_spir_func_calling_conv(self, func):
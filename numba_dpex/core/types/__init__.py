@@ -5,6 +5,7 @@
 from .array_type import Array
 from .dpctl_types import DpctlSyclEvent, DpctlSyclQueue
 from .dpnp_ndarray_type import DpnpNdArray
+from .local_accessor_type import LocalAccessorType
 from .numba_types_short_names import (
     b1,
     bool_,
@@ -36,6 +37,7 @@ __all__ = [
     "DpctlSyclQueue",
     "DpctlSyclEvent",
     "DpnpNdArray",
+    "LocalAccessorType",
     "RangeType",
     "NdRangeType",
     "USMNdArray",
@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from numba_dpex.utils import address_space
+
+from .array_type import Array
+
+
+class LocalAccessorType(Array):
+    """Numba-dpex type corresponding to
+    :class:`numba_dpex.core.kernel_interface.local_accessor.LocalAccessor`.
+
+    Inside a kernel a local accessor is a C-contiguous array in the local
+    address space. The shape of the accessor is a run-time value, so that
+    the type only depends on the number of dimensions and the dtype.
+    """
+
+    def __init__(self, ndim, dtype):
+        name = f"LocalAccessor({dtype}, {ndim})"
+        super(LocalAccessorType, self).__init__(
+            dtype,
+            ndim,
+            "C",
+            name=name,
+            addrspace=address_space.LOCAL,
+        )
@@ -11,8 +11,10 @@ from numba.np import numpy_support
 from numba_dpex.utils import address_space
 
 from ..kernel_interface.indexers import NdRange, Range
+from ..kernel_interface.local_accessor import LocalAccessor
 from ..types.dpctl_types import DpctlSyclEvent, DpctlSyclQueue
 from ..types.dpnp_ndarray_type import DpnpNdArray
+from ..types.local_accessor_type import LocalAccessorType
 from ..types.range_types import NdRangeType, RangeType
 from ..types.usm_ndarray_type import USMNdArray
 
@@ -150,3 +152,18 @@ def typeof_ndrange(val, c):
     Returns: A numba_dpex.core.types.range_types.RangeType instance.
     """
     return NdRangeType(val.global_range.ndim)
+
+
+@typeof_impl.register(LocalAccessor)
+def typeof_local_accessor(val, c):
+    """Registers the type inference implementation function for a
+    numba_dpex.LocalAccessor PyObject.
+
+    Args:
+        val : An instance of numba_dpex.LocalAccessor.
+        c : Unused argument used to be consistent with Numba API.
+
+    Returns: A numba_dpex.core.types.local_accessor_type.LocalAccessorType
+    instance.
+    """
+    return LocalAccessorType(val.ndim, numpy_support.from_dtype(val.dtype))
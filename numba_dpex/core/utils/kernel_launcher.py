@@ -323,6 +323,71 @@ class KernelLaunchIRBuilder:
 
         return args_ty_list
 
+    def build_dependent_events(
+        self, kernel_argtys, callargs_ptrs, datamodel_mgr
+    ):
+        """Collects the events pending on the kernel's array arguments.
+
+        Arrays allocated inside dpjit, e.g., by ``dpnp.zeros``, may still have
+        an asynchronous fill operation pending on their data. The events for
+        such operations are moved out of the arrays' MemInfo objects into an
+        array of events that are to be passed as the dependencies of the
+        kernel submission.
+
+        Args:
+            kernel_argtys: The Numba types of the kernel arguments.
+            callargs_ptrs: LLVM Values storing pointers to every kernel
+                argument.
+            datamodel_mgr: The data model manager used to look up the position
+                of the meminfo member of an array argument.
+
+        Returns: A tuple of an LLVM Value pointing to the array of
+        DPCTLSyclEventRef and an LLVM Value storing the number of events in the
+        array, or None if no kernel argument is an array.
+        """
+        array_args = [
+            (argtype, callargs_ptrs[arg_num])
+            for arg_num, argtype in enumerate(kernel_argtys)
+            if isinstance(argtype, DpnpNdArray)
+        ]
+        if not array_args:
+            return None
+
+        events = cgutils.alloca_once(
+            self.builder,
+            utils.get_llvm_type(context=self.context, type=types.voidptr),
+            size=self.context.get_constant(types.uintp, len(array_args)),
+        )
+        nevents = self.context.get_constant(types.int64, 0)
+        for argtype, array_ptr in array_args:
+            datamodel = datamodel_mgr.lookup(argtype)
+            meminfo = self.builder.load(
+                self.builder.gep(
+                    array_ptr,
+                    [
+                        self.context.get_constant(types.int32, 0),
+                        self.context.get_constant(
+                            types.int32,
+                            datamodel.get_field_position("meminfo"),
+                        ),
+                    ],
+                )
+            )
+            nevents = self.rtctx.meminfo_append_pending_event(
+                self.builder, meminfo, events, nevents
+            )
+
+        return events, nevents
+
+    def _delete_dependent_events(self, dependent_events):
+        """Deletes the DPCTLSyclEventRef objects collected by
+        :meth:`build_dependent_events`.
+        """
+        events, nevents = dependent_events
+        with cgutils.for_range(self.builder, nevents) as loop:
+            eref = self.builder.load(self.builder.gep(events, [loop.index]))
+            sycl.dpctl_event_delete(self.builder, eref)
+
     def _create_sycl_range(self, idx_range):
         """Allocate a size_t[3] array to store the extents of a sycl::range.
 
@@ -371,9 +436,15 @@ class KernelLaunchIRBuilder:
         global_range,
         local_range=[],
         wait_before_return=True,
+        dependent_events=None,
     ) -> llvmir.PointerType(llvmir.IntType(8)):
         """
         Submits the kernel to the specified queue, waits.
+
+        If ``dependent_events`` is provided, i.e., a tuple returned by
+        :meth:`build_dependent_events`, the kernel is submitted with a
+        dependency on every event in it and the events are deleted after the
+        submission.
         """
         eref = None
         gr = self._create_sycl_range(global_range)
@@ -385,15 +456,20 @@ class KernelLaunchIRBuilder:
             self.context.get_constant(types.uintp, total_kernel_args),
             gr,
         ]
+        if dependent_events is None:
+            depevents = utils.create_null_ptr(
+                builder=self.builder, context=self.context
+            )
+            ndepevents = self.context.get_constant(types.uintp, 0)
+        else:
+            depevents, ndepevents = dependent_events
         args2 = [
             self.context.get_constant(types.uintp, len(global_range)),
             self.builder.bitcast(
-                utils.create_null_ptr(
-                    builder=self.builder, context=self.context
-                ),
+                depevents,
                 utils.get_llvm_type(context=self.context, type=types.voidptr),
             ),
-            self.context.get_constant(types.uintp, 0),
+            ndepevents,
         ]
         args = []
         if len(local_range) == 0:
@@ -404,6 +480,11 @@ class KernelLaunchIRBuilder:
             args = args1 + [lr] + args2
             eref = sycl.dpctl_queue_submit_ndrange(self.builder, *args)
 
+        # The SYCL runtime keeps track of the dependencies once the kernel is
+        # submitted, so the events can be released right away.
+        if dependent_events is not None:
+            self._delete_dependent_events(dependent_events)
+
         if wait_before_return:
             sycl.dpctl_event_wait(self.builder, eref)
             sycl.dpctl_event_delete(self.builder, eref)
@@ -4,15 +4,68 @@
 
 import sys
 
-import dpnp
-from numba.core import compiler
+from .stub_ir_cache import get_kernel_stub_ir
 
-import numba_dpex as dpex
+
+def _generate_loop_index(id_expr, loop_range, param_dict):
+    """Returns the expression that maps a zero-based iteration id to the loop
+    index of a loop nest with the given (start, stop, step) range.
+
+    Args:
+        id_expr (str): The expression of the zero-based iteration id.
+        loop_range (tuple): The start, stop and step of the loop nest.
+        param_dict (dict): Dictionary to lookup variable names for loop
+        range attributes.
+
+    Returns:
+        str: The expression of the loop index.
+    """
+    start, _, step = loop_range
+    st = str(param_dict.get(str(start), start))
+
+    index_expr = id_expr
+    if step != 1:
+        index_expr = f"{index_expr} * {step}"
+    if not (isinstance(start, int) and start == 0):
+        index_expr = f"{st} + {index_expr}"
+
+    return index_expr
+
+
+def _generate_loop_extent(loop_range, param_dict):
+    """Returns the expression for the number of iterations of a loop nest
+    with the given (start, stop, step) range.
+
+    Args:
+        loop_range (tuple): The start, stop and step of the loop nest.
+        param_dict (dict): Dictionary to lookup variable names for loop
+        range attributes.
+
+    Returns:
+        str: The expression of the loop extent.
+    """
+    start, stop, step = loop_range
+    st = str(param_dict.get(str(start), start))
+    en = str(param_dict.get(str(stop), stop))
+
+    extent_expr = en
+    if not (isinstance(start, int) and start == 0):
+        extent_expr = f"{extent_expr} - {st}"
+    if step != 1:
+        extent_expr = f"({extent_expr} + {step - 1}) // {step}"
+
+    return f"({extent_expr})"
 
 
 class RangeKernelTemplate:
     """A template class to generate a numba_dpex.kernel decorated function
     representing a basic range kernel.
+
+    SYCL ranges have at most three dimensions. The loop nests of a parfor with
+    a higher dimensionality are collapsed: the first two loop nests are mapped
+    to the first two dimensions of the range and the remaining loop nests are
+    linearized into the third dimension. The loop indices of the collapsed
+    loop nests are then recovered inside the kernel.
     """
 
     def __init__(
@@ -64,31 +117,43 @@ class RangeKernelTemplate:
         # Create the dpex kernel function.
         kernel_txt += "def " + self._kernel_name
         kernel_txt += "(" + (", ".join(self._kernel_params)) + "):\n"
-        global_id_dim = 0
-        for_loop_dim = self._kernel_rank
-        global_id_dim = self._kernel_rank
+        global_id_dim = self._kernel_rank if self._kernel_rank <= 3 else 2
 
         for dim in range(global_id_dim):
             dimstr = str(dim)
-            kernel_txt += (
-                f"    {self._ivar_names[dim]} = dpex.get_global_id({dimstr})\n"
+            index_expr = _generate_loop_index(
+                f"dpex.get_global_id({dimstr})",
+                self._loop_ranges[dim],
+                self._param_dict,
+            )
+            kernel_txt += f"    {self._ivar_names[dim]} = {index_expr}\n"
+
+        # Recover the indices of the loop nests that were collapsed into the
+        # last dimension of the range, innermost loop nest first.
+        if self._kernel_rank > 3:
+            kernel_txt += "    linear_rem = dpex.get_global_id(2)\n"
+            for dim in range(self._kernel_rank - 1, global_id_dim, -1):
+                extent = _generate_loop_extent(
+                    self._loop_ranges[dim], self._param_dict
+                )
+                index_expr = _generate_loop_index(
+                    f"(linear_rem % {extent})",
+                    self._loop_ranges[dim],
+                    self._param_dict,
+                )
+                kernel_txt += (
+                    f"    {self._ivar_names[dim]} = {index_expr}\n"
+                    + f"    linear_rem = linear_rem // {extent}\n"
+                )
+            index_expr = _generate_loop_index(
+                "linear_rem",
+                self._loop_ranges[global_id_dim],
+                self._param_dict,
             )
-
-        for dim in range(global_id_dim, for_loop_dim):
-            for indent in range(1 + (dim - global_id_dim)):
-                kernel_txt += "    "
-
-            start, stop, step = self._loop_ranges[dim]
-            st = str(self._param_dict.get(str(start), start))
-            en = str(self._param_dict.get(str(stop), stop))
             kernel_txt += (
-                f"for {self._ivar_names[dim]} in range({st}, {en} + 1):\n"
+                f"    {self._ivar_names[global_id_dim]} = {index_expr}\n"
             )
 
-        for dim in range(global_id_dim, for_loop_dim):
-            for _ in range(1 + (dim - global_id_dim)):
-                kernel_txt += "    "
-
         # Add the sentinel assignment so that we can find the loop body position
         # in the IR.
         kernel_txt += "    "
@@ -100,18 +165,19 @@ class RangeKernelTemplate:
         return kernel_txt
 
     def _generate_kernel_ir(self):
-        """Exec the kernel_txt string into a Python function object and then
-        compile it using Numba's compiler front end.
+        """Compiles the kernel_txt string using Numba's compiler front end, or
+        clones the cached IR of a kernel stub with the same structure.
 
         Returns: The Numba functionIR object for the compiled kernel_txt string.
 
         """
-        globls = {"dpnp": dpnp, "dpex": dpex}
-        locls = {}
-        exec(self._kernel_txt, globls, locls)
-        kernel_fn = locls[self._kernel_name]
+        names = (
+            list(self._kernel_params)
+            + list(self._ivar_names)
+            + [self._sentinel_name]
+        )
 
-        return compiler.run_frontend(kernel_fn)
+        return get_kernel_stub_ir(self._kernel_txt, self._kernel_name, names)
 
     @property
     def kernel_ir(self):
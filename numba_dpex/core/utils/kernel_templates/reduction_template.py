@@ -5,17 +5,163 @@
 import operator
 import sys
 
-import dpnp
-from numba.core import compiler
-
-import numba_dpex as dpex
+import numpy as np
+from numba.core import ir, types
+from numba.np.numpy_support import as_dtype
 
 from .kernel_template_iface import KernelTemplateInterface
+from .range_kernel_template import _generate_loop_index
+from .stub_ir_cache import get_kernel_stub_ir
+
+
+def get_reduction_operator(redvar_info, typemap):
+    """Returns the operator that combines two partial results of a parfor
+    reduction.
+
+    Numba only infers the ``redop`` of in-place binary operator reductions.
+    For reductions written as calls to the ``min`` or ``max`` builtins the
+    ``redop`` is None and the operator is found from the reduce nodes of the
+    reduction variable.
+
+    Args:
+        redvar_info: The reduction information Numba generated for a parfor
+            reduction variable.
+        typemap: The typemap of the function containing the parfor.
+
+    Raises:
+        NotImplementedError: If the reduction operator is not supported.
+
+    Returns:
+        One of ``operator.iadd``, ``operator.imul``, ``max`` or ``min``.
+    """
+    redop = redvar_info.redop
+    if redop in (operator.iadd, operator.isub):
+        return operator.iadd
+    elif redop in (operator.imul, operator.itruediv):
+        return operator.imul
+    elif redop is None:
+        for inst in redvar_info.reduce_nodes:
+            if not (
+                isinstance(inst, ir.Assign)
+                and isinstance(inst.value, ir.Expr)
+                and inst.value.op == "call"
+            ):
+                continue
+            fnty = typemap.get(inst.value.func.name)
+            if isinstance(fnty, types.Function) and fnty.typing_key in (
+                max,
+                min,
+            ):
+                return fnty.typing_key
+
+    raise NotImplementedError
+
+
+def get_reduction_identity(redop, dtype):
+    """Returns the identity value of a reduction operator for a dtype.
+
+    Args:
+        redop: A reduction operator returned by ``get_reduction_operator``.
+        dtype: The Numba type of the reduction variable.
+
+    Returns:
+        The identity value as a Python scalar.
+    """
+    if redop == operator.iadd:
+        return 0
+    elif redop == operator.imul:
+        return 1
+
+    if isinstance(dtype, types.Boolean):
+        lowest, highest = False, True
+    elif isinstance(dtype, types.Integer):
+        info = np.iinfo(as_dtype(dtype))
+        lowest, highest = int(info.min), int(info.max)
+    else:
+        lowest, highest = -np.inf, np.inf
+
+    return lowest if redop == max else highest
+
+
+def _generate_combine(redop, lhs, rhs):
+    """Returns the statement that combines ``rhs`` into ``lhs`` for a
+    reduction operator.
+    """
+    if redop == operator.iadd:
+        return f"{lhs} += {rhs}"
+    elif redop == operator.imul:
+        return f"{lhs} *= {rhs}"
+    else:
+        return f"{lhs} = {redop.__name__}({lhs}, {rhs})"
+
+
+def _generate_identity(redvar_info, typemap, redvar):
+    """Returns the expression that initializes a private reduction variable to
+    the identity value of its reduction operator.
+    """
+    redop = get_reduction_operator(redvar_info, typemap)
+    dtype = typemap[redvar]
+    identity = get_reduction_identity(redop, dtype)
+    if redop in (operator.iadd, operator.imul):
+        return str(identity)
+    elif identity == np.inf:
+        return f"dpnp.{dtype}(dpnp.inf)"
+    elif identity == -np.inf:
+        return f"dpnp.{dtype}(-dpnp.inf)"
+    else:
+        return f"dpnp.{dtype}({identity!r})"
+
+
+def _generate_local_tree_reduction(
+    redvars, redvars_dict, parfor_reddict, typemap
+):
+    """Generates the work-group local memory tree reduction of the values
+    stored in the ``local_sums_<redvar>`` arrays.
+
+    The generated code assumes that the local range is a power of two and that
+    every work item of the work-group executes it. At the end, the first
+    element of every ``local_sums_<redvar>`` array stores the reduced value of
+    the work-group.
+
+    Returns:
+        str: The text of the tree reduction.
+    """
+    txt = (
+        "    stride0 = local_size0 // 2\n"
+        + "    while stride0 > 0:\n"
+        + "        dpex.barrier(dpex.LOCAL_MEM_FENCE)\n"
+        + "        if local_id0 < stride0:\n"
+    )
+    for redvar in redvars:
+        redop = get_reduction_operator(parfor_reddict[redvar], typemap)
+        redvar_legal = redvars_dict[redvar]
+        combine = _generate_combine(
+            redop,
+            f"local_sums_{redvar_legal}[local_id0]",
+            f"local_sums_{redvar_legal}[local_id0 + stride0]",
+        )
+        txt += f"            {combine}\n"
+    txt += "        stride0 >>= 1\n"
+
+    return txt
 
 
 class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
     """The class to build reduction main kernel_txt template and
-    compiled Numba functionIR."""
+    compiled Numba functionIR.
+
+    The main kernel is launched over an nd-range whose global size is a
+    multiple of the work-group size and that may be smaller than the number of
+    iterations of the parfor. Every work item first sequentially reduces the
+    iterations in a grid-stride loop, the private results are then reduced
+    inside every work-group using local memory and the result of every
+    work-group is stored into the partial sums array.
+
+    A multi-dimensional parfor is reduced over its linearized iteration space.
+    The loop indices are recovered from the linear index in row-major order,
+    so that consecutive work items access consecutive elements of C-contiguous
+    arrays.
+    """
 
     def __init__(
         self,
@@ -32,6 +178,8 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         redvars_dict,
         typemap,
         work_group_size,
+        total_work_var_name,
+        inner_extent_var_names,
     ) -> None:
         self._kernel_name = kernel_name
         self._kernel_params = kernel_params
@@ -46,6 +194,8 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         self._redvars_dict = redvars_dict
         self._typemap = typemap
         self._work_group_size = work_group_size
+        self._total_work_var_name = total_work_var_name
+        self._inner_extent_var_names = inner_extent_var_names
 
         self._kernel_txt = self._generate_kernel_stub_as_string()
         self._kernel_ir = self._generate_kernel_ir()
@@ -56,22 +206,14 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         gufunc_txt = ""
         gufunc_txt += "def " + self._kernel_name
         gufunc_txt += "(" + (", ".join(self._kernel_params)) + "):\n"
-        global_id_dim = 0
-        for_loop_dim = self._parfor_dim
-
-        if self._parfor_dim > 3:
-            raise NotImplementedError
-        else:
-            global_id_dim = self._parfor_dim
 
-        for dim in range(global_id_dim):
-            dstr = str(dim)
-            gufunc_txt += (
-                f"    {self._ivar_names[dim]} = dpex.get_global_id({dstr})\n"
-            )
-            gufunc_txt += f"    local_id{dim} = dpex.get_local_id({dstr})\n"
-            gufunc_txt += f"    local_size{dim} = dpex.get_local_size({dstr})\n"
-            gufunc_txt += f"    group_id{dim} = dpex.get_group_id({dstr})\n"
+        gufunc_txt += (
+            "    global_id0 = dpex.get_global_id(0)\n"
+            + "    global_size0 = dpex.get_global_size(0)\n"
+            + "    local_id0 = dpex.get_local_id(0)\n"
+            + "    local_size0 = dpex.get_local_size(0)\n"
+            + "    group_id0 = dpex.get_group_id(0)\n"
+        )
 
         # Allocate local_sums arrays for each reduction variable.
         for redvar in self._redvars:
@@ -80,30 +222,55 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
             gufunc_txt += f"    local_sums_{redvar} = \
                 dpex.local.array({self._work_group_size}, dpnp.{rtyp})\n"
 
-        for dim in range(global_id_dim, for_loop_dim):
-            for indent in range(1 + (dim - global_id_dim)):
-                gufunc_txt += "    "
-
-            start, stop, step = self._loop_ranges[dim]
-            st = str(self._param_dict.get(str(start), start))
-            en = str(self._param_dict.get(str(stop), stop))
-            gufunc_txt += (
-                f"for {self._ivar_names[dim]} in range({st}, {en} + 1):\n"
-            )
-
-        for dim in range(global_id_dim, for_loop_dim):
-            for indent in range(1 + (dim - global_id_dim)):
-                gufunc_txt += "    "
-        # Add the sentinel assignment so that we can find the loop body position
-        # in the IR.
+        # Initialize the private reduction variables
         for redvar in self._redvars:
             legal_redvar = self._redvars_dict[redvar]
             gufunc_txt += "    "
             gufunc_txt += legal_redvar + " = "
-            gufunc_txt += f"{self._parfor_reddict[redvar].init_val} \n"
+            gufunc_txt += _generate_identity(
+                self._parfor_reddict[redvar], self._typemap, redvar
+            )
+            gufunc_txt += "\n"
 
-        gufunc_txt += "    "
-        gufunc_txt += self._sentinel_name + " = 0\n"
+        # Grid-stride loop over the iterations of the parfor. Add the sentinel
+        # assignment so that we can find the loop body position in the IR.
+        if self._parfor_dim == 1:
+            index_expr = _generate_loop_index(
+                "linear_id", self._loop_ranges[0], self._param_dict
+            )
+            if index_expr == "linear_id":
+                gufunc_txt += (
+                    f"    for {self._ivar_names[0]} in range(global_id0, "
+                    + f"{self._total_work_var_name}, global_size0):\n"
+                )
+            else:
+                gufunc_txt += (
+                    "    for linear_id in range(global_id0, "
+                    + f"{self._total_work_var_name}, global_size0):\n"
+                    + f"        {self._ivar_names[0]} = {index_expr}\n"
+                )
+        else:
+            gufunc_txt += (
+                "    for linear_id in range("
+                + f"global_id0, {self._total_work_var_name}, global_size0):\n"
+            )
+            gufunc_txt += "        linear_rem = linear_id\n"
+            for dim in range(self._parfor_dim - 1, 0, -1):
+                extent = self._inner_extent_var_names[dim - 1]
+                index_expr = _generate_loop_index(
+                    f"(linear_rem % {extent})",
+                    self._loop_ranges[dim],
+                    self._param_dict,
+                )
+                gufunc_txt += (
+                    f"        {self._ivar_names[dim]} = {index_expr}\n"
+                    + f"        linear_rem = linear_rem // {extent}\n"
+                )
+            index_expr = _generate_loop_index(
+                "linear_rem", self._loop_ranges[0], self._param_dict
+            )
+            gufunc_txt += f"        {self._ivar_names[0]} = {index_expr}\n"
+        gufunc_txt += "        " + self._sentinel_name + " = 0\n"
 
         # Generate local_sum[local_id0] = redvar, for each reduction variable
         for redvar in self._redvars:
@@ -113,32 +280,13 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
                 + f"local_sums_{legal_redvar}[local_id0] = {legal_redvar}\n"
             )
 
-        gufunc_txt += (
-            "    stride0 = local_size0 // 2\n"
-            + "    while stride0 > 0:\n"
-            + "        dpex.barrier(dpex.LOCAL_MEM_FENCE)\n"
-            + "        if local_id0 < stride0:\n"
+        gufunc_txt += _generate_local_tree_reduction(
+            self._redvars,
+            self._redvars_dict,
+            self._parfor_reddict,
+            self._typemap,
         )
 
-        for redvar in self._redvars:
-            redop = self._parfor_reddict[redvar].redop
-            redvar_legal = self._redvars_dict[redvar]
-            if redop == operator.iadd:
-                gufunc_txt += (
-                    "            "
-                    f"local_sums_{redvar_legal}[local_id0] "
-                    f"+= local_sums_{redvar_legal}[local_id0 + stride0]\n"
-                )
-            elif redop == operator.imul:
-                gufunc_txt += (
-                    "            "
-                    f"local_sums_{redvar_legal}[local_id0] "
-                    f"*= local_sums_{redvar_legal}[local_id0 + stride0]\n"
-                )
-            else:
-                raise NotImplementedError
-
-        gufunc_txt += "        stride0 >>= 1\n"
         gufunc_txt += "    if local_id0 == 0:\n"
         for redvar in self._redvars:
             for i, arg in enumerate(self._parfor_args):
@@ -156,18 +304,23 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         return gufunc_txt
 
     def _generate_kernel_ir(self):
-        """Exec the kernel_txt string into a Python function object and then
-        compile it using Numba's compiler front end.
+        """Compiles the kernel_txt string using Numba's compiler front end, or
+        clones the cached IR of a kernel stub with the same structure.
 
         Returns: The Numba functionIR object for the compiled kernel_txt string.
 
         """
-        globls = {"dpnp": dpnp, "dpex": dpex}
-        locls = {}
-        exec(self._kernel_txt, globls, locls)
-        kernel_fn = locls[self._kernel_name]
+        redvar_names = [self._redvars_dict[r] for r in self._redvars]
+        names = (
+            list(self._kernel_params)
+            + list(self._ivar_names)
+            + [self._sentinel_name, self._total_work_var_name]
+            + list(self._inner_extent_var_names)
+            + redvar_names
+            + [f"local_sums_{redvar}" for redvar in redvar_names]
+        )
 
-        return compiler.run_frontend(kernel_fn)
+        return get_kernel_stub_ir(self._kernel_txt, self._kernel_name, names)
 
     @property
     def kernel_ir(self):
@@ -200,48 +353,46 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         self._kernel_ir.dump()
 
 
-class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
-    """The class to build reduction remainder kernel_txt template and
+class TreeReduceFinalKernelTemplate(KernelTemplateInterface):
+    """The class to build the reduction final kernel_txt template and
     compiled Numba functionIR.
+
+    The final kernel is launched as a single work-group. The work items
+    sequentially reduce a strided subset of the partial sums generated by the
+    main kernel, the private results are reduced using a local memory tree
+    reduction and the first work item writes the result to the final sum
+    array. The final kernel does not contain the parfor body.
     """
 
     def __init__(
         self,
         kernel_name,
         kernel_params,
-        sentinel_name,
         redvars,
         parfor_reddict,
         redvars_dict,
         typemap,
-        legal_loop_indices,
-        global_size_var_name,
-        global_size_mod_var_name,
         partial_sum_size_var_name,
         partial_sum_var_name,
         final_sum_var_name,
-        reductionKernelVar,
+        work_group_size,
     ) -> None:
         self._kernel_name = kernel_name
         self._kernel_params = kernel_params
-        self._sentinel_name = sentinel_name
         self._redvars = redvars
         self._parfor_reddict = parfor_reddict
         self._redvars_dict = redvars_dict
         self._typemap = typemap
-        self._legal_loop_indices = legal_loop_indices
-        self._global_size_var_name = global_size_var_name
-        self._global_size_mod_var_name = global_size_mod_var_name
         self._partial_sum_size_var_name = partial_sum_size_var_name
         self._partial_sum_var_name = partial_sum_var_name
         self._final_sum_var_name = final_sum_var_name
-        self._reductionKernelVar = reductionKernelVar
+        self._work_group_size = work_group_size
 
         self._kernel_txt = self._generate_kernel_stub_as_string()
         self._kernel_ir = self._generate_kernel_ir()
 
     def _generate_kernel_stub_as_string(self):
-        """Generate reduction remainder kernel template"""
+        """Generate reduction final kernel template"""
 
         gufunc_txt = ""
         gufunc_txt += "def " + self._kernel_name
@@ -250,100 +401,88 @@ class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
         for i in range(len(self._redvars)):
             gufunc_txt += (
                 ", "
-                + f"{self._global_size_var_name[i]}, "
-                + f"{self._global_size_mod_var_name[i]}, "
-            )
-            gufunc_txt += (
-                f"{self._partial_sum_size_var_name[i]}, "
+                + f"{self._partial_sum_size_var_name[i]}, "
                 + f"{self._final_sum_var_name[i]}"
             )
 
         gufunc_txt += "):\n"
 
-        gufunc_txt += "    "
-
         gufunc_txt += (
-            "for j" + f" in range({self._partial_sum_size_var_name[0]}):\n"
+            "    local_id0 = dpex.get_local_id(0)\n"
+            + "    local_size0 = dpex.get_local_size(0)\n"
         )
 
         for i, redvar in enumerate(self._redvars):
-            redop = self._parfor_reddict[redvar].redop
-            if redop == operator.iadd:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] += \
-                    {self._partial_sum_var_name[i]}[j]\n"
-            elif redop == operator.imul:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] *= \
-                    {self._partial_sum_var_name[i]}[j]\n"
-            else:
-                raise NotImplementedError
-
-        gufunc_txt += (
-            f"    for j in range ({self._global_size_mod_var_name[0]}) :\n"
-        )
-
-        for redvar in self._redvars:
-            legal_redvar = self._redvars_dict[redvar]
-            gufunc_txt += "        "
-            gufunc_txt += legal_redvar + " = "
-            gufunc_txt += f"{self._parfor_reddict[redvar].init_val}\n"
-
-        gufunc_txt += (
-            "        "
-            + self._legal_loop_indices[0]
-            + " = "
-            + f"{self._global_size_var_name[0]} + j\n"
-        )
-
-        for redvar in self._redvars:
             rtyp = str(self._typemap[redvar])
-            redvar = self._redvars_dict[redvar]
+            legal_redvar = self._redvars_dict[redvar]
+            redop = get_reduction_operator(
+                self._parfor_reddict[redvar], self._typemap
+            )
+            gufunc_txt += f"    local_sums_{legal_redvar} = \
+                dpex.local.array({self._work_group_size}, dpnp.{rtyp})\n"
             gufunc_txt += (
-                "        "
-                + f"local_sums_{redvar} = "
-                + f"dpex.local.array(1, dpnp.{rtyp})\n"
+                f"    {legal_redvar} = "
+                + _generate_identity(
+                    self._parfor_reddict[redvar], self._typemap, redvar
+                )
+                + "\n"
+            )
+            gufunc_txt += (
+                "    for j in range("
+                + f"local_id0, {self._partial_sum_size_var_name[i]}, "
+                + "local_size0):\n"
+            )
+            combine = _generate_combine(
+                redop, legal_redvar, f"{self._partial_sum_var_name[i]}[j]"
+            )
+            gufunc_txt += f"        {combine}\n"
+            gufunc_txt += (
+                f"    local_sums_{legal_redvar}[local_id0] = {legal_redvar}\n"
             )
 
-        gufunc_txt += "        " + self._sentinel_name + " = 0\n"
+        gufunc_txt += _generate_local_tree_reduction(
+            self._redvars,
+            self._redvars_dict,
+            self._parfor_reddict,
+            self._typemap,
+        )
 
+        gufunc_txt += "    if local_id0 == 0:\n"
         for i, redvar in enumerate(self._redvars):
             legal_redvar = self._redvars_dict[redvar]
             gufunc_txt += (
-                "        " + f"local_sums_{legal_redvar}[0] = {legal_redvar}\n"
+                "        "
+                + f"{self._final_sum_var_name[i]}[0] = "
+                + f"local_sums_{legal_redvar}[0]\n"
             )
 
-        for i, redvar in enumerate(self._redvars):
-            legal_redvar = self._redvars_dict[redvar]
-            redop = self._parfor_reddict[redvar].redop
-            if redop == operator.iadd:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] +=  \
-                    local_sums_{legal_redvar}[0]\n"
-            elif redop == operator.imul:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] *=  \
-                    local_sums_{legal_redvar}[0]\n"
-            else:
-                raise NotImplementedError
+        gufunc_txt += "    return None\n"
 
         return gufunc_txt
 
     def _generate_kernel_ir(self):
-        """Exec the kernel_txt string into a Python function object and then
-        compile it using Numba's compiler front end.
+        """Compiles the kernel_txt string using Numba's compiler front end, or
+        clones the cached IR of a kernel stub with the same structure.
 
         Returns: The Numba functionIR object for the compiled kernel_txt string.
 
         """
+        redvar_names = [self._redvars_dict[r] for r in self._redvars]
+        names = (
+            list(self._kernel_params)
+            + list(self._partial_sum_var_name)
+            + list(self._partial_sum_size_var_name)
+            + list(self._final_sum_var_name)
+            + redvar_names
+            + [f"local_sums_{redvar}" for redvar in redvar_names]
+        )
 
-        globls = {"dpnp": dpnp, "dpex": dpex}
-        locls = {}
-        exec(self._kernel_txt, globls, locls)
-        kernel_fn = locls[self._kernel_name]
-
-        return compiler.run_frontend(kernel_fn)
+        return get_kernel_stub_ir(self._kernel_txt, self._kernel_name, names)
 
     @property
     def kernel_ir(self):
         """Returns the Numba IR generated for a
-            RemainderReduceIntermediateKernelTemplate.
+            TreeReduceFinalKernelTemplate.
 
         Returns: The Numba functionIR object for the compiled kernel_txt string.
         """
@@ -352,7 +491,7 @@ class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
     @property
     def kernel_string(self):
         """Returns the function string generated for a
-            RemainderReduceIntermediateKernelTemplate.
+            TreeReduceFinalKernelTemplate.
 
         Returns:
             str: A string representing a stub reduction kernel function
@@ -368,6 +507,6 @@ class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
 
     def dump_kernel_ir(self):
         """Helper to dump the Numba IR for the
-        RemainderReduceIntermediateKernelTemplate."""
+        TreeReduceFinalKernelTemplate."""
 
         self._kernel_ir.dump()
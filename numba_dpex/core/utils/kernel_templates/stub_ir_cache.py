@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""A cache of the Numba IR generated for the kernel stubs of parfors.
+
+The kernel templates generate the stub of a kernel as a Python function
+string. Compiling the string requires exec-ing it and running Numba's bytecode
+analysis and interpreter on the resulting function, which is repeated for
+every parfor of every compiled function. Stubs for different parfors only
+differ in the names of the kernel, its parameters, and its index variables as
+long as the parfors have the same structure, e.g., the same rank and number of
+parameters. The cache stores the IR of a stub with canonical names and returns
+a renamed clone of it for every new stub with the same structure. The least
+recently used entries are evicted once the cache holds more than
+``config.CACHE_SIZE`` entries.
+"""
+
+import copy
+import re
+import threading
+from collections import OrderedDict, defaultdict
+
+import dpnp
+from numba.core import compiler, ir
+from numba.core.ir_utils import (
+    build_definitions,
+    get_name_var_table,
+    replace_var_names,
+)
+
+import numba_dpex as dpex
+from numba_dpex import config
+
+_stub_ir_cache = OrderedDict()
+_stub_ir_cache_lock = threading.Lock()
+
+
+def _canonicalize(kernel_txt, names):
+    """Replaces every identifier in ``names`` inside ``kernel_txt`` with a
+    canonical name.
+
+    Returns:
+        A tuple of the canonical kernel string and a dict mapping every
+        canonical name back to the original one.
+    """
+    canonical_names = {}
+    for name in names:
+        if name not in canonical_names:
+            canonical_names[name] = f"__dpex_stub_{len(canonical_names)}"
+
+    # Match whole identifiers that are not attributes, e.g., the name
+    # "get_global_id" does not match "dpex.get_global_id". Longer names come
+    # first so that a name never matches the prefix of another one.
+    pattern = re.compile(
+        r"(?<![\w.])("
+        + "|".join(
+            re.escape(name)
+            for name in sorted(canonical_names, key=len, reverse=True)
+        )
+        + r")(?!\w)"
+    )
+    canonical_txt = pattern.sub(
+        lambda match: canonical_names[match.group(1)], kernel_txt
+    )
+
+    return canonical_txt, {v: k for k, v in canonical_names.items()}
+
+
+def _compile_stub(kernel_txt, kernel_name):
+    """Exec the kernel_txt string into a Python function object and then
+    compile it using Numba's compiler front end.
+    """
+    globls = {"dpnp": dpnp, "dpex": dpex}
+    locls = {}
+    exec(kernel_txt, globls, locls)
+    kernel_fn = locls[kernel_name]
+
+    return compiler.run_frontend(kernel_fn)
+
+
+def _rename(name, rename_dict):
+    """Returns the new name of a variable of a cached stub IR. Versioned
+    variables, e.g., "__dpex_stub_1.1", keep their version.
+    """
+    base, sep, version = name.partition(".")
+    return rename_dict.get(base, base) + sep + version
+
+
+def _derive_func_id(func_id, kernel_name, arg_names):
+    """Returns a new function identity for a clone of a cached stub IR that
+    carries the name and the argument names of the kernel.
+    """
+    kernel_func_id = func_id.derive()
+    kernel_func_id.func_qualname = kernel_name
+    kernel_func_id.func_name = kernel_name
+    kernel_func_id.unique_name = f"{kernel_name}${kernel_func_id.unique_id}"
+    kernel_func_id.arg_names = list(arg_names)
+    kernel_func_id.pysig = func_id.pysig.replace(
+        parameters=[
+            param.replace(name=name)
+            for param, name in zip(func_id.pysig.parameters.values(), arg_names)
+        ]
+    )
+
+    return kernel_func_id
+
+
+def _clone_stub_ir(stub_ir, rename_dict):
+    """Returns a deep copy of a cached stub IR with the canonical names
+    replaced by the names in ``rename_dict``.
+    """
+    kernel_ir = stub_ir.copy()
+    kernel_ir.blocks = copy.deepcopy(stub_ir.blocks)
+    kernel_ir.block_entry_vars = {}
+
+    var_rename_dict = {}
+    for name in get_name_var_table(kernel_ir.blocks):
+        new_name = _rename(name, rename_dict)
+        if new_name != name:
+            var_rename_dict[name] = new_name
+    replace_var_names(kernel_ir.blocks, var_rename_dict)
+    for block in kernel_ir.blocks.values():
+        for stmt in block.body:
+            if isinstance(stmt, ir.Assign) and isinstance(stmt.value, ir.Arg):
+                stmt.value.name = rename_dict.get(
+                    stmt.value.name, stmt.value.name
+                )
+
+    # The deep copy gives the clone its own scope, whose variables are renamed
+    # the same way as the variables of the blocks.
+    scope = kernel_ir.blocks[min(kernel_ir.blocks)].scope
+    scope.localvars = ir.VarMap()
+    for name, var in get_name_var_table(kernel_ir.blocks).items():
+        scope.localvars.define(name, var)
+    scope.redefined = defaultdict(
+        int,
+        {
+            _rename(name, rename_dict): count
+            for name, count in scope.redefined.items()
+        },
+    )
+    scope.var_redefinitions = defaultdict(
+        set,
+        {
+            _rename(name, rename_dict): {
+                _rename(version, rename_dict) for version in versions
+            }
+            for name, versions in scope.var_redefinitions.items()
+        },
+    )
+
+    kernel_ir.arg_names = tuple(
+        rename_dict.get(name, name) for name in stub_ir.arg_names
+    )
+    # Every clone needs its own function identity so that the kernels get
+    # distinct unique names when they are lowered.
+    kernel_ir.func_id = _derive_func_id(
+        stub_ir.func_id, rename_dict["__dpex_stub_0"], kernel_ir.arg_names
+    )
+    kernel_ir._definitions = build_definitions(kernel_ir.blocks)
+
+    return kernel_ir
+
+
+def get_kernel_stub_ir(kernel_txt, kernel_name, names):
+    """Returns the Numba IR for a kernel stub string.
+
+    Args:
+        kernel_txt (str): The kernel stub function as a string.
+        kernel_name (str): The name of the kernel stub function.
+        names (list): The names of the parameters of the kernel and of all
+            other identifiers in the stub that are specific to a parfor.
+
+    Returns: The Numba FunctionIR object for the kernel stub.
+    """
+    # The kernel name is canonicalized first, i.e., to "__dpex_stub_0".
+    canonical_txt, rename_dict = _canonicalize(
+        kernel_txt, [kernel_name] + list(names)
+    )
+
+    with _stub_ir_cache_lock:
+        stub_ir = _stub_ir_cache.get(canonical_txt)
+        if stub_ir is None:
+            stub_ir = _compile_stub(canonical_txt, "__dpex_stub_0")
+            _stub_ir_cache[canonical_txt] = stub_ir
+            while len(_stub_ir_cache) > config.CACHE_SIZE:
+                _stub_ir_cache.popitem(last=False)
+        else:
+            _stub_ir_cache.move_to_end(canonical_txt)
+
+    return _clone_stub_ir(stub_ir, rename_dict)
@@ -8,6 +8,7 @@ import warnings
 from numba.core import decorators, sigutils
 from numba.core.target_extension import jit_registry, target_registry
 
+from numba_dpex.core.compiler import make_compile_flags
 from numba_dpex.core.kernel_interface.dispatcher import JitKernel
 from numba_dpex.core.kernel_interface.func import (
     compile_func,
@@ -22,6 +23,16 @@ def kernel(
     func_or_sig=None,
     debug=False,
     enable_cache=True,
+    constants=None,
+    specialize_shapes=False,
+    max_specializations=None,
+    fastmath=False,
+    math_builtins=None,
+    opt_level=None,
+    build_options=None,
+    reqd_work_group_size=None,
+    work_group_size_hint=None,
+    reqd_sub_group_size=None,
 ):
     """A decorator to define a kernel function.
 
@@ -32,6 +43,36 @@ def kernel(
         * The function can not return any value.
         * All array arguments passed to a kernel should adhere to compute
           follows data programming model.
+
+    Args:
+        constants (tuple): Names of the kernel arguments that are compile-time
+            constants. Arguments annotated with ``typing.Literal`` are
+            constants as well. The kernel is compiled for every distinct value
+            of its constant arguments, letting the compiler fold the values
+            and fully unroll the loops that depend on them.
+        specialize_shapes (bool): If True, the kernel is also compiled for
+            every distinct shape of its array arguments.
+        max_specializations (int): The maximum number of variants compiled
+            for distinct constant values and shapes. Defaults to
+            ``numba_dpex.config.KERNEL_MAX_SPECIALIZATIONS``.
+        fastmath: Either a bool to enable all LLVM fast-math flags on the
+            floating point instructions of the kernel, or a set of the flags,
+            e.g., ``{"nnan", "contract"}``.
+        math_builtins (str): If set to ``"native"`` or ``"half"``, single
+            precision math functions are mapped to the faster but less
+            accurate ``native_*`` or ``half_*`` OpenCL builtins.
+        opt_level (int): The LLVM optimization level of the kernel. Defaults
+            to ``numba_dpex.config.DPEX_OPT``.
+        build_options: A string or a list of options passed to the driver
+            when the kernel is built for a device, e.g.,
+            ``"-cl-fast-relaxed-math -cl-mad-enable"``.
+        reqd_work_group_size: An int or a tuple of up to three ints. The
+            kernel is compiled for and can only be launched with this local
+            range.
+        work_group_size_hint: An int or a tuple of up to three ints. A hint
+            of the local range the kernel is most likely launched with.
+        reqd_sub_group_size (int): The sub-group size, i.e., the SIMD width,
+            the kernel is compiled for.
     """
 
     def _kernel_dispatcher(pyfunc, sigs=None):
@@ -40,6 +81,16 @@ def kernel(
             debug_flags=debug,
             enable_cache=enable_cache,
             specialization_sigs=sigs,
+            constants=constants,
+            specialize_shapes=specialize_shapes,
+            max_specializations=max_specializations,
+            fastmath=fastmath,
+            math_builtins=math_builtins,
+            opt_level=opt_level,
+            build_options=build_options,
+            reqd_work_group_size=reqd_work_group_size,
+            work_group_size_hint=work_group_size_hint,
+            reqd_sub_group_size=reqd_sub_group_size,
         )
 
     if func_or_sig is None:
@@ -71,6 +122,16 @@ def kernel(
                 debug_flags=debug,
                 enable_cache=enable_cache,
                 specialization_sigs=func_or_sig,
+                constants=constants,
+                specialize_shapes=specialize_shapes,
+                max_specializations=max_specializations,
+                fastmath=fastmath,
+                math_builtins=math_builtins,
+                opt_level=opt_level,
+                build_options=build_options,
+                reqd_work_group_size=reqd_work_group_size,
+                work_group_size_hint=work_group_size_hint,
+                reqd_sub_group_size=reqd_sub_group_size,
             )
 
         return _specialized_kernel_dispatcher
@@ -86,7 +147,13 @@ def kernel(
         return _kernel_dispatcher(func)
 
 
-def func(func_or_sig=None, debug=False, enable_cache=True):
+def func(
+    func_or_sig=None,
+    debug=False,
+    enable_cache=True,
+    fastmath=False,
+    math_builtins=None,
+):
     """A decorator to define a kernel device function.
 
     Device functions are functions that can be only invoked from a kernel
@@ -96,11 +163,21 @@ def func(func_or_sig=None, debug=False, enable_cache=True):
     A device function can be invoked from another device function and
     unlike a kernel function, a device function can return a value like
     normal functions.
+
+    The ``fastmath`` and ``math_builtins`` options are the same as for the
+    ``kernel`` decorator. The optimization level and the build options of
+    the kernel that calls the device function apply to it as well.
     """
+    compile_flags = make_compile_flags(
+        fastmath=fastmath, math_builtins=math_builtins
+    )
 
     def _func_autojit(pyfunc):
         return compile_func_template(
-            pyfunc, debug=debug, enable_cache=enable_cache
+            pyfunc,
+            debug=debug,
+            enable_cache=enable_cache,
+            compile_flags=compile_flags,
         )
 
     if func_or_sig is None:
@@ -127,7 +204,9 @@ def func(func_or_sig=None, debug=False, enable_cache=True):
             func_or_sig = [func_or_sig]
 
         def _wrapped(pyfunc):
-            return compile_func(pyfunc, func_or_sig, debug=debug)
+            return compile_func(
+                pyfunc, func_or_sig, debug=debug, compile_flags=compile_flags
+            )
 
         return _wrapped
     else:
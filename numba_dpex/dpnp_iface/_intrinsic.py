@@ -188,13 +188,17 @@ def _update_queue_attr(array, queue):
         setattr(array, k, v)
 
 
-def _empty_nd_impl(context, builder, arrtype, shapes, queue_ref):
+def _empty_nd_impl(
+    context, builder, arrtype, shapes, queue_ref, from_scratch_pool=False
+):
     """Utility function used for allocating a new array.
 
     This function is used for allocating a new array during LLVM code
     generation (lowering).  Given a target context, builder, array
     type, and a tuple or list of lowered dimension sizes, returns a
-    LLVM value pointing at a Numba runtime allocated array.
+    LLVM value pointing at a Numba runtime allocated array. If
+    ``from_scratch_pool`` is True the data is drawn from the DPEXRT scratch
+    pool.
     """
 
     arycls = make_array(arrtype)
@@ -262,30 +266,36 @@ def _empty_nd_impl(context, builder, arrtype, shapes, queue_ref):
         types.uint64, usm_ty_map[usm_ty] if usm_ty in usm_ty_map else 0
     )
 
-    args = (
-        context.get_dummy_value(),
-        allocsize,
-        usm_type,
-        queue_ref_copy,
-    )
-    mip = types.MemInfoPointer(types.voidptr)
-    arytypeclass = types.TypeRef(type(arrtype))
-    sig = signature(
-        mip,
-        arytypeclass,
-        types.intp,
-        types.uint64,
-        types.voidptr,
-    )
-    from numba_dpex.decorators import dpjit
-
-    op = dpjit(_call_usm_allocator)
-    fnop = context.typing_context.resolve_value_type(op)
-    # The _call_usm_allocator function will be compiled and added to
-    # registry when the get_call_type function is invoked.
-    fnop.get_call_type(context.typing_context, sig.args, {})
-    eqfn = context.get_function(fnop, sig)
-    meminfo = eqfn(builder, args)
+    if from_scratch_pool:
+        dpexrtCtx = dpexrt.DpexRTContext(context)
+        meminfo = dpexrtCtx.meminfo_alloc_scratch(
+            builder, allocsize, usm_type, queue_ref_copy
+        )
+    else:
+        args = (
+            context.get_dummy_value(),
+            allocsize,
+            usm_type,
+            queue_ref_copy,
+        )
+        mip = types.MemInfoPointer(types.voidptr)
+        arytypeclass = types.TypeRef(type(arrtype))
+        sig = signature(
+            mip,
+            arytypeclass,
+            types.intp,
+            types.uint64,
+            types.voidptr,
+        )
+        from numba_dpex.decorators import dpjit
+
+        op = dpjit(_call_usm_allocator)
+        fnop = context.typing_context.resolve_value_type(op)
+        # The _call_usm_allocator function will be compiled and added to
+        # registry when the get_call_type function is invoked.
+        fnop.get_call_type(context.typing_context, sig.args, {})
+        eqfn = context.get_function(fnop, sig)
+        meminfo = eqfn(builder, args)
     data = context.nrt.meminfo_data(builder, meminfo)
 
     intp_t = context.get_value_type(types.intp)
@@ -341,7 +351,15 @@ def intrin_usm_alloc(typingctx, allocsize, usm_type, queue):
     return sig, codegen
 
 
-def alloc_empty_arrayobj(context, builder, sig, queue_ref, args, is_like=False):
+def alloc_empty_arrayobj(
+    context,
+    builder,
+    sig,
+    queue_ref,
+    args,
+    is_like=False,
+    from_scratch_pool=False,
+):
     """Construct an empty numba.np.arrayobj.make_array.<locals>.ArrayStruct
 
     Args:
@@ -357,6 +375,8 @@ def alloc_empty_arrayobj(context, builder, sig, queue_ref, args, is_like=False):
             an np.empty(), np.zeros() or np.ones() call.
         is_like (bool, optional): Decides on how to parse the args.
             Defaults to False.
+        from_scratch_pool (bool, optional): Draws the data of the array from
+            the DPEXRT scratch pool. Defaults to False.
 
     Returns: The LLVM IR value that stores the empty array
     """
@@ -366,7 +386,9 @@ def alloc_empty_arrayobj(context, builder, sig, queue_ref, args, is_like=False):
         if is_like
         else _parse_empty_args(context, builder, sig, args)
     )
-    ary = _empty_nd_impl(context, builder, arrtype, shape, queue_ref)
+    ary = _empty_nd_impl(
+        context, builder, arrtype, shape, queue_ref, from_scratch_pool
+    )
 
     return ary
 
@@ -495,6 +517,65 @@ def impl_dpnp_empty(
     return sig, codegen
 
 
+@intrinsic
+def impl_dpnp_empty_scratch(
+    ty_context,
+    ty_shape,
+    ty_dtype,
+    ty_order,
+    ty_device,
+    ty_usm_type,
+    ty_sycl_queue,
+    ty_retty_ref,
+):
+    """A numba "intrinsic" function to inject code for an uninitialized array
+    whose data is drawn from the DPEXRT scratch pool.
+
+    The arguments are the same as for :func:`impl_dpnp_empty`.
+
+    Returns:
+        tuple(numba.core.typing.templates.Signature, function): A tuple of
+            numba function signature type and a function object.
+    """
+
+    ty_retty = ty_retty_ref.instance_type
+    sig = ty_retty(
+        ty_shape,
+        ty_dtype,
+        ty_order,
+        ty_device,
+        ty_usm_type,
+        ty_sycl_queue,
+        ty_retty_ref,
+    )
+
+    sycl_queue_arg_pos = -2
+
+    def codegen(context, builder, sig, args):
+        sycl_queue_arg = _ArgTyAndValue(
+            sig.args[sycl_queue_arg_pos], args[sycl_queue_arg_pos]
+        )
+        qref_payload: _QueueRefPayload = _get_queue_ref(
+            context=context,
+            builder=builder,
+            returned_sycl_queue_ty=sig.return_type.queue,
+            sycl_queue_arg=sycl_queue_arg,
+        )
+
+        ary = alloc_empty_arrayobj(
+            context,
+            builder,
+            sig,
+            qref_payload.queue_ref,
+            args,
+            from_scratch_pool=True,
+        )
+
+        return ary._getvalue()
+
+    return sig, codegen
+
+
 @intrinsic
 def impl_dpnp_zeros(
     ty_context,
@@ -21,6 +21,7 @@ from numba_dpex.core.types import DpnpNdArray
 from ._intrinsic import (
     impl_dpnp_empty,
     impl_dpnp_empty_like,
+    impl_dpnp_empty_scratch,
     impl_dpnp_full,
     impl_dpnp_full_like,
     impl_dpnp_ones,
@@ -261,6 +262,83 @@ def ol_dpnp_empty(
         raise errors.TypingError("Could not infer the rank of the ndarray.")
 
 
+def empty_scratch(
+    shape,
+    dtype=None,
+    order="C",
+    device=None,
+    usm_type="device",
+    sycl_queue=None,
+):
+    """Creates an uninitialized array whose data is drawn from a pool of
+    scratch allocations that is kept across calls.
+
+    The function is meant for short-lived temporaries generated by the dpjit
+    compiler, e.g., the partial results of a parfor reduction, and can only be
+    called inside a dpjit function. The arguments are the same as for
+    dpnp.empty().
+    """
+    raise NotImplementedError("empty_scratch is only supported inside dpjit.")
+
+
+@overload(empty_scratch, prefer_literal=True)
+def ol_empty_scratch(
+    shape,
+    dtype=None,
+    order="C",
+    device=None,
+    usm_type="device",
+    sycl_queue=None,
+):
+    """Implementation of an overload to support empty_scratch() inside
+    a dpjit function. See ol_dpnp_empty() for the arguments.
+
+    Raises:
+        errors.TypingError: If rank of the ndarray couldn't be inferred.
+
+    Returns:
+        function: Local function `impl_empty_scratch()`.
+    """
+
+    _ndim = _ty_parse_shape(shape)
+    _dtype = _parse_dtype(dtype)
+    _layout = _parse_layout(order)
+    _usm_type = _parse_usm_type(usm_type) if usm_type else "device"
+    _device = _parse_device_filter_string(device) if device else None
+
+    if not _ndim:
+        raise errors.TypingError("Could not infer the rank of the ndarray.")
+
+    ret_ty = DpnpNdArray(
+        ndim=_ndim,
+        layout=_layout,
+        dtype=_dtype,
+        usm_type=_usm_type,
+        device=_device,
+        queue=sycl_queue,
+    )
+
+    def impl(
+        shape,
+        dtype=None,
+        order="C",
+        device=None,
+        usm_type="device",
+        sycl_queue=None,
+    ):
+        return impl_dpnp_empty_scratch(
+            shape,
+            _dtype,
+            order,
+            _device,
+            _usm_type,
+            sycl_queue,
+            ret_ty,
+        )
+
+    return impl
+
+
 @overload(dpnp.zeros, prefer_literal=True)
 def ol_dpnp_zeros(
     shape,
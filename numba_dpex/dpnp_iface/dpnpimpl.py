@@ -5,6 +5,7 @@
 import copy
 
 import dpnp
+from numba.core import ir_utils
 from numba.core.imputils import Registry
 from numba.np import npyimpl
 
@@ -13,6 +14,22 @@ from numba_dpex.dpnp_iface import dpnp_ufunc_db
 
 registry = Registry("dpnpimpl")
 
+# The names of the dpnp array constructors that only allocate, and possibly
+# initialize, a new array and have no other side effect. The set is shared
+# with the numba_dpex passes that need to recognize an array allocation.
+dpnp_allocation_functions = frozenset(
+    [
+        "empty",
+        "empty_like",
+        "full",
+        "full_like",
+        "ones",
+        "ones_like",
+        "zeros",
+        "zeros_like",
+    ]
+)
+
 
 def _register_dpnp_ufuncs():
     """Adds dpnp ufuncs to the dpnpimpl.registry.
@@ -77,5 +94,32 @@ def _register_dpnp_ufuncs():
                 )
 
 
+def _is_dpnp_allocation_call(rhs, lives, call_list):
+    """Returns True if ``call_list`` is a call to a dpnp array constructor.
+
+    Only calls of the form ``dpnp.<constructor>(...)`` are matched, all other
+    calls are left to Numba's other handlers.
+    """
+    return (
+        len(call_list) == 2
+        and call_list[1] is dpnp
+        and call_list[0] in dpnp_allocation_functions
+    )
+
+
+def _register_dpnp_allocation_calls():
+    """Registers the dpnp array constructors as side-effect free calls with
+    Numba's dead code elimination.
+
+    Without it, the allocation of the output array of a parfor cannot be moved
+    above a preceding parfor by Numba's parfor fusion, and the allocations of
+    intermediate arrays that are dead after fusion are not removed.
+    """
+    if _is_dpnp_allocation_call not in ir_utils.remove_call_handlers:
+        ir_utils.remove_call_handlers.append(_is_dpnp_allocation_call)
+
+
 # Initialize the registry that stores the dpnp ufuncs
 _register_dpnp_ufuncs()
+# Let Numba remove the dead allocations of dpnp arrays
+_register_dpnp_allocation_calls()
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compares a histogram kernel that only uses global atomics with one that
+privatizes the bins of every work-group in local memory.
+"""
+
+import argparse
+from time import time
+
+import dpnp as np
+import numpy
+
+import numba_dpex as ndpx
+
+NUM_BINS = 256
+WORK_GROUP_SIZE = NUM_BINS
+
+
+@ndpx.kernel
+def histogram_global(data, hist):
+    """Every work-item increments its bin with a global atomic."""
+    i = ndpx.get_global_id(0)
+    ndpx.atomic.add(hist, data[i], 1)
+
+
+@ndpx.kernel
+def histogram_local(data, hist):
+    """
+    Every work-group computes the histogram of its data in local memory,
+    where the atomics only contend with the work-items of the same
+    work-group, and merges it into the global histogram once per bin.
+    """
+    i = ndpx.get_global_id(0)
+    lid = ndpx.get_local_id(0)
+
+    local_hist = ndpx.local.array(NUM_BINS, np.int32)
+    local_hist[lid] = 0
+    ndpx.barrier(ndpx.LOCAL_MEM_FENCE)
+
+    ndpx.atomic.add(
+        local_hist, data[i], 1, memory_scope=ndpx.memory_scope.work_group
+    )
+    ndpx.barrier(ndpx.LOCAL_MEM_FENCE)
+
+    if local_hist[lid] != 0:
+        ndpx.atomic.add(hist, lid, local_hist[lid])
+
+
+def run(kernel, data, repeat):
+    """Returns the histogram computed by kernel and the best time of repeat
+    runs.
+    """
+    nd_range = ndpx.NdRange(
+        ndpx.Range(data.shape[0]), ndpx.Range(WORK_GROUP_SIZE)
+    )
+    times = []
+    for _ in range(repeat):
+        hist = np.zeros(NUM_BINS, dtype=np.int32)
+        start = time()
+        kernel[nd_range](data, hist)
+        times.append(time() - start)
+
+    return hist, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of global and privatized histograms"
+    )
+    parser.add_argument(
+        "-n", type=int, default=2**22, help="Number of data elements"
+    )
+    parser.add_argument("-r", type=int, default=10, help="repeat")
+    args = parser.parse_args()
+
+    n = (args.n // WORK_GROUP_SIZE) * WORK_GROUP_SIZE
+    # A skewed distribution makes the contention on the global atomics
+    # visible.
+    data = np.asarray(
+        numpy.minimum(numpy.random.exponential(16, n), NUM_BINS - 1).astype(
+            numpy.int32
+        )
+    )
+    expected = numpy.bincount(np.asnumpy(data), minlength=NUM_BINS)
+
+    print("Using device ...")
+    print(data.device)
+
+    for name, kernel in (
+        ("global atomics", histogram_global),
+        ("local atomics", histogram_local),
+    ):
+        hist, best_time = run(kernel, data, args.r)
+        assert numpy.array_equal(np.asnumpy(hist), expected)
+        print(f"Histogram with {name}: {best_time:.6f} s")
+
+    print("Done...")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,7 +21,8 @@ def gemm(a, b, c):
     if i >= c.shape[0] or j >= c.shape[1]:
         return
     c[i, j] = 0
-    for k in range(c.shape[0]):
+    # Unrolling the reduction loop by 4 exposes more independent loads.
+    for k in ndpx.unroll(range(c.shape[0]), 4):
         c[i, j] += a[i, k] * b[k, j]
 
 
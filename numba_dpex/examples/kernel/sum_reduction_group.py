@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import operator
+
+import dpctl
+import dpctl.tensor as dpt
+
+import numba_dpex as ndpx
+
+
+@ndpx.kernel
+def sum_reduction_kernel(A, partial_sums):
+    """
+    The example demonstrates a reduction kernel that uses the
+    ``group.reduce`` work-group collective instead of a tree of barriers over
+    local memory.
+    """
+    global_id = ndpx.get_global_id(0)
+    local_id = ndpx.get_local_id(0)
+    group_id = ndpx.get_group_id(0)
+
+    group_sum = ndpx.group.reduce(A[global_id], operator.add)
+
+    if local_id == 0:
+        partial_sums[group_id] = group_sum
+
+
+def sum_reduce(A):
+    global_size = len(A)
+    work_group_size = 64
+    nb_work_groups = global_size // work_group_size
+
+    partial_sums = dpt.zeros(nb_work_groups, dtype=A.dtype, device=A.device)
+
+    gs = ndpx.Range(global_size)
+    ls = ndpx.Range(work_group_size)
+    sum_reduction_kernel[ndpx.NdRange(gs, ls)](A, partial_sums)
+
+    return int(dpt.sum(partial_sums))
+
+
+def test_sum_reduce():
+    N = 1024
+    device = dpctl.select_default_device()
+    A = dpt.ones(N, dtype=dpt.int32, device=device)
+
+    print("Running Device + Host reduction")
+
+    actual = sum_reduce(A)
+    expected = N
+
+    print("Actual:  ", actual)
+    print("Expected:", expected)
+
+    assert actual == expected
+
+    print("Done...")
+
+
+if __name__ == "__main__":
+    test_sum_reduce()
@@ -29,6 +29,7 @@ _KernelArgs = namedtuple(
         "flattened_args_count",
         "array_of_kernel_args",
         "array_of_kernel_arg_types",
+        "dependent_events",
     ],
 )
 
@@ -133,6 +134,14 @@ class _LaunchTrampolineFunctionBodyGenerator:
             datamodel_mgr=self._kernel_targetctx.data_model_manager,
         )
 
+        # Collect the events for any operation still pending on the array
+        # arguments, e.g., the fill of an array created by dpnp.zeros.
+        dependent_events = self._klbuilder.build_dependent_events(
+            kernel_argtys=kernel_argtys,
+            callargs_ptrs=kernel_args_ptrs,
+            datamodel_mgr=self._kernel_targetctx.data_model_manager,
+        )
+
         if config.DEBUG_KERNEL_LAUNCHER:
             cgutils.printf(
                 self._builder,
@@ -143,6 +152,7 @@ class _LaunchTrampolineFunctionBodyGenerator:
             flattened_args_count=num_flattened_kernel_args,
             array_of_kernel_args=args_list,
             array_of_kernel_arg_types=args_ty_list,
+            dependent_events=dependent_events,
         )
 
     def get_queue_ref_val(
@@ -275,6 +285,7 @@ class _LaunchTrampolineFunctionBodyGenerator:
             global_range=submit_call_args.global_range_extents,
             local_range=submit_call_args.local_range_extents,
             wait_before_return=False,
+            dependent_events=submit_call_args.kernel_args.dependent_events,
         )
         if config.DEBUG_KERNEL_LAUNCHER:
             cgutils.printf(self._builder, "DPEX-DEBUG: Wait on event.\n")
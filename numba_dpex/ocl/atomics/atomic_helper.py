@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from enum import Enum, auto
+from enum import Enum
 
 
 class sycl_memory_order(Enum):
@@ -26,12 +26,24 @@ class sycl_memory_order(Enum):
     =====================   ============
     """
 
-    relaxed = auto()
-    acquire = auto()
-    __consume_unsupported = auto()
-    release = auto()
-    acq_rel = auto()
-    seq_cst = auto()
+    relaxed = 0
+    acquire = 1
+    __consume_unsupported = 2
+    release = 3
+    acq_rel = 4
+    seq_cst = 5
+
+
+# The memory orders that can be used with the atomic functions. The consume
+# memory order is not supported. Before Python 3.11 its private name is still
+# a member of sycl_memory_order, so it is left out explicitly.
+supported_sycl_memory_orders = (
+    sycl_memory_order.relaxed,
+    sycl_memory_order.acquire,
+    sycl_memory_order.release,
+    sycl_memory_order.acq_rel,
+    sycl_memory_order.seq_cst,
+)
 
 
 class sycl_memory_scope(Enum):
@@ -54,11 +66,11 @@ class sycl_memory_scope(Enum):
     ===============  ============
     """
 
-    work_item = auto()
-    sub_group = auto()
-    work_group = auto()
-    device = auto()
-    system = auto()
+    work_item = 0
+    sub_group = 1
+    work_group = 2
+    device = 3
+    system = 4
 
 
 class _spv_scope(Enum):
@@ -108,8 +120,6 @@ def get_memory_semantics_mask(memory_order):
     spv_order = _spv_memory_semantics_mask.NONE.value
     if memory_order == sycl_memory_order.relaxed:
         spv_order = _spv_memory_semantics_mask.NONE.value
-    elif memory_order == sycl_memory_order.__consume_unsupported:
-        pass
     elif memory_order == sycl_memory_order.acquire:
         spv_order = _spv_memory_semantics_mask.Acquire.value
     elif memory_order == sycl_memory_order.release:
@@ -129,6 +139,24 @@ def get_memory_semantics_mask(memory_order):
     )
 
 
+def get_compare_exchange_failure_memory_order(memory_order):
+    """
+    This function returns the memory order of a compare exchange that failed
+    for a given memory order of the compare exchange. The memory order of a
+    failed compare exchange, which only loads, cannot contain a release.
+
+    For DPCPP implementation please refer:
+    https://github.com/intel/llvm/blob/sycl-nightly/20210507/sycl/include/CL/sycl/ONEAPI/atomic_ref.hpp#L50
+    """
+
+    if memory_order == sycl_memory_order.release:
+        return sycl_memory_order.relaxed
+    elif memory_order == sycl_memory_order.acq_rel:
+        return sycl_memory_order.acquire
+    else:
+        return memory_order
+
+
 def get_scope(memory_scope):
     """
     This function translates SYCL memory scope to SPIRV scope.
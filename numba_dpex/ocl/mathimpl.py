@@ -91,11 +91,31 @@ function_descriptors = {
 # library as oposed to the Python name.
 _lib_counterpart = {"gamma": "tgamma"}
 
+# Single precision functions that have native_* and half_* OpenCL builtins,
+# which trade accuracy for speed.
+_math_builtins_supported = {
+    "cos",
+    "exp",
+    "exp2",
+    "log",
+    "log10",
+    "log2",
+    "sin",
+    "sqrt",
+    "tan",
+}
 
-def _mk_fn_decl(name, decl_sig):
-    sym = _lib_counterpart.get(name, name)
 
+def _mk_fn_decl(name, decl_sig):
     def core(context, builder, sig, args):
+        sym = _lib_counterpart.get(name, name)
+        math_builtins = getattr(context, "math_builtins", None)
+        if (
+            math_builtins
+            and name in _math_builtins_supported
+            and decl_sig == _unary_f_f
+        ):
+            sym = math_builtins + "_" + sym
         fn = _declare_function(
             context, builder, sym, decl_sig, decl_sig.args, mangler=mangle
         )
@@ -2,7 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import inspect
+import operator
+
 from numba import types
+from numba.core import errors
 from numba.core.typing.npydecl import parse_dtype, parse_shape
 from numba.core.typing.templates import (
     AbstractTemplate,
@@ -15,6 +19,7 @@ from numba.core.typing.templates import (
 
 import numba_dpex as dpex
 from numba_dpex.core.types import Array
+from numba_dpex.ocl.atomics import atomic_helper
 from numba_dpex.utils import address_space
 
 registry = Registry()
@@ -84,35 +89,255 @@ class Ocl_sub_group_barrier(ConcreteTemplate):
     cases = [signature(types.void)]
 
 
-# dpex.atomic submodule -------------------------------------------------------
+@intrinsic
+class Ocl_unroll(AbstractTemplate):
+    key = dpex.unroll
+
+    def generic(self, args, kws):
+        pysig = inspect.signature(dpex.unroll)
+        try:
+            bound = pysig.bind(*args, **kws)
+        except TypeError:
+            return None
+        arguments = bound.arguments
+
+        iterable = arguments["iterable"]
+        if not isinstance(iterable, types.IterableType):
+            return None
+        # The factor has to be a positive compile-time constant.
+        factor = arguments.get("factor", types.none)
+        if factor != types.none and not (
+            isinstance(factor, types.IntegerLiteral)
+            and factor.literal_value > 0
+        ):
+            return None
+
+        return signature(iterable, iterable, factor).replace(pysig=pysig)
+
+
+_vector_widths = (2, 3, 4, 8, 16)
+_vector_dtypes = (
+    types.int32,
+    types.uint32,
+    types.int64,
+    types.uint64,
+    types.float32,
+    types.float64,
+)
+
+
+def _get_vector_ary_and_index_types(ary, idx):
+    """Returns the array and index types of a vector load or store, or None
+    if the array is not C-contiguous or the index does not match its
+    dimensions.
+    """
+    if not isinstance(ary, types.Array):
+        return None
+    # Only C-contiguous arrays are guaranteed to have consecutive elements
+    # along their last dimension.
+    if ary.layout != "C" or ary.dtype not in _vector_dtypes:
+        return None
+
+    if ary.ndim == 1 and isinstance(idx, types.Integer):
+        return ary, types.intp
+    if (
+        isinstance(idx, types.BaseTuple)
+        and len(idx) == ary.ndim
+        and all(isinstance(i, types.Integer) for i in idx)
+    ):
+        return ary, idx
+
+    return None
 
 
 @intrinsic
-class Ocl_atomic_add(AbstractTemplate):
-    key = dpex.atomic.add
+class Ocl_vload(AbstractTemplate):
+    key = dpex.vload
 
     def generic(self, args, kws):
         assert not kws
-        ary, idx, val = args
+        ary, idx, width = args
+        ary_and_idx = _get_vector_ary_and_index_types(ary, idx)
+        if ary_and_idx is None:
+            return None
+        if (
+            not isinstance(width, types.IntegerLiteral)
+            or width.literal_value not in _vector_widths
+        ):
+            return None
 
-        if ary.ndim == 1:
-            return signature(ary.dtype, ary, types.intp, ary.dtype)
-        elif ary.ndim > 1:
-            return signature(ary.dtype, ary, idx, ary.dtype)
+        return signature(
+            types.UniTuple(ary.dtype, width.literal_value), *ary_and_idx, width
+        )
 
 
 @intrinsic
-class Ocl_atomic_sub(AbstractTemplate):
-    key = dpex.atomic.sub
+class Ocl_vstore(AbstractTemplate):
+    key = dpex.vstore
 
     def generic(self, args, kws):
         assert not kws
-        ary, idx, val = args
+        ary, idx, value = args
+        ary_and_idx = _get_vector_ary_and_index_types(ary, idx)
+        if ary_and_idx is None:
+            return None
+        if (
+            not isinstance(value, types.BaseTuple)
+            or len(value) not in _vector_widths
+            or not all(isinstance(v, types.Number) for v in value)
+        ):
+            return None
+
+        return signature(
+            types.void, *ary_and_idx, types.UniTuple(ary.dtype, len(value))
+        )
+
+
+# dpex.atomic submodule -------------------------------------------------------
+
+
+_atomic_int_types = (types.int32, types.int64, types.uint32, types.uint64)
+_atomic_float_types = (types.float32, types.float64)
+
+# The values accepted for the memory order and the memory scope arguments
+_atomic_flag_values = {
+    "memory_order": frozenset(
+        order.value for order in atomic_helper.supported_sycl_memory_orders
+    ),
+    "memory_scope": frozenset(
+        scope.value for scope in atomic_helper.sycl_memory_scope
+    ),
+}
+
+
+def _get_atomic_pysig(value_names, memory_scope=dpex.memory_scope.device):
+    """Returns the Python signature of an atomic function with the value
+    arguments ``value_names`` and the default memory scope ``memory_scope``.
+    """
+    params = [
+        inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        for name in ("ary", "idx") + value_names
+    ]
+    params.append(
+        inspect.Parameter(
+            "memory_order",
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=dpex.memory_order.relaxed,
+        )
+    )
+    params.append(
+        inspect.Parameter(
+            "memory_scope",
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=memory_scope,
+        )
+    )
+    return inspect.Signature(params)
+
+
+class _Ocl_atomic_op(AbstractTemplate):
+    """Typing template of the atomic functions.
+
+    The memory order and the memory scope have to be integer literals, so
+    that they can be lowered to the constant operands of the SPIR-V atomic
+    instructions. An unsupported value, e.g., the consume memory order, is a
+    typing error. An omitted memory order or scope is typed as the literal
+    of its default value. The default memory scope of an atomic on a local
+    array is the work-group, as no other work-item can access the array.
+    """
+
+    value_names = ("val",)
+    supported_dtypes = _atomic_int_types + _atomic_float_types
+
+    def generic(self, args, kws):
+        pysig = _get_atomic_pysig(self.value_names)
+        try:
+            bound = pysig.bind(*args, **kws)
+        except TypeError:
+            return None
+        arguments = bound.arguments
+
+        ary = arguments["ary"]
+        if not isinstance(ary, types.Array):
+            return None
+        if ary.dtype not in self.supported_dtypes:
+            return None
+        if getattr(ary, "addrspace", None) == address_space.LOCAL:
+            pysig = _get_atomic_pysig(
+                self.value_names, dpex.memory_scope.work_group
+            )
+
+        flags = []
+        for name in ("memory_order", "memory_scope"):
+            flag = arguments.get(
+                name, types.literal(pysig.parameters[name].default)
+            )
+            if not isinstance(flag, types.IntegerLiteral):
+                return None
+            if flag.literal_value not in _atomic_flag_values[name]:
+                raise errors.TypingError(
+                    f"Unsupported {name} {flag.literal_value} for "
+                    f"atomic.{self.key.__name__}"
+                )
+            flags.append(flag)
 
         if ary.ndim == 1:
-            return signature(ary.dtype, ary, types.intp, ary.dtype)
+            idx = types.intp
         elif ary.ndim > 1:
-            return signature(ary.dtype, ary, idx, ary.dtype)
+            idx = arguments["idx"]
+
+        values = [ary.dtype] * len(self.value_names)
+        sig = signature(ary.dtype, ary, idx, *values, *flags)
+        return sig.replace(pysig=pysig)
+
+
+@intrinsic
+class Ocl_atomic_add(_Ocl_atomic_op):
+    key = dpex.atomic.add
+
+
+@intrinsic
+class Ocl_atomic_sub(_Ocl_atomic_op):
+    key = dpex.atomic.sub
+
+
+@intrinsic
+class Ocl_atomic_min(_Ocl_atomic_op):
+    key = dpex.atomic.min
+
+
+@intrinsic
+class Ocl_atomic_max(_Ocl_atomic_op):
+    key = dpex.atomic.max
+
+
+@intrinsic
+class Ocl_atomic_and_(_Ocl_atomic_op):
+    key = dpex.atomic.and_
+    supported_dtypes = _atomic_int_types
+
+
+@intrinsic
+class Ocl_atomic_or_(_Ocl_atomic_op):
+    key = dpex.atomic.or_
+    supported_dtypes = _atomic_int_types
+
+
+@intrinsic
+class Ocl_atomic_xor(_Ocl_atomic_op):
+    key = dpex.atomic.xor
+    supported_dtypes = _atomic_int_types
+
+
+@intrinsic
+class Ocl_atomic_exchange(_Ocl_atomic_op):
+    key = dpex.atomic.exchange
+
+
+@intrinsic
+class Ocl_atomic_compare_exchange(_Ocl_atomic_op):
+    key = dpex.atomic.compare_exchange
+    value_names = ("expected", "desired")
 
 
 @intrinsic_attr
@@ -125,9 +350,292 @@ class OclAtomicTemplate(AttributeTemplate):
     def resolve_sub(self, mod):
         return types.Function(Ocl_atomic_sub)
 
+    def resolve_min(self, mod):
+        return types.Function(Ocl_atomic_min)
+
+    def resolve_max(self, mod):
+        return types.Function(Ocl_atomic_max)
+
+    def resolve_and_(self, mod):
+        return types.Function(Ocl_atomic_and_)
+
+    def resolve_or_(self, mod):
+        return types.Function(Ocl_atomic_or_)
+
+    def resolve_xor(self, mod):
+        return types.Function(Ocl_atomic_xor)
+
+    def resolve_exchange(self, mod):
+        return types.Function(Ocl_atomic_exchange)
+
+    def resolve_compare_exchange(self, mod):
+        return types.Function(Ocl_atomic_compare_exchange)
+
 
 intrinsic_global(dpex.atomic.add, types.Function(Ocl_atomic_add))
 intrinsic_global(dpex.atomic.sub, types.Function(Ocl_atomic_sub))
+intrinsic_global(dpex.atomic.min, types.Function(Ocl_atomic_min))
+intrinsic_global(dpex.atomic.max, types.Function(Ocl_atomic_max))
+intrinsic_global(dpex.atomic.and_, types.Function(Ocl_atomic_and_))
+intrinsic_global(dpex.atomic.or_, types.Function(Ocl_atomic_or_))
+intrinsic_global(dpex.atomic.xor, types.Function(Ocl_atomic_xor))
+intrinsic_global(dpex.atomic.exchange, types.Function(Ocl_atomic_exchange))
+intrinsic_global(
+    dpex.atomic.compare_exchange, types.Function(Ocl_atomic_compare_exchange)
+)
+
+
+class _OclFlagTemplate(AttributeTemplate):
+    """Types the constants of a flag namespace as integer literals, so that
+    the functions taking them can read their values at compile time.
+    """
+
+    def generic_resolve(self, mod, attr):
+        value = getattr(mod.pymod, attr, None)
+        if isinstance(value, int):
+            return types.literal(value)
+
+
+@intrinsic_attr
+class OclMemoryOrderTemplate(_OclFlagTemplate):
+    key = types.Module(dpex.memory_order)
+
+
+@intrinsic_attr
+class OclMemoryScopeTemplate(_OclFlagTemplate):
+    key = types.Module(dpex.memory_scope)
+
+
+# dpex.group submodule -------------------------------------------------------
+
+# The value types and the operations supported by the work-group collectives
+_group_value_types = (
+    types.int32,
+    types.int64,
+    types.uint32,
+    types.uint64,
+    types.float32,
+    types.float64,
+)
+_group_operations = (operator.add, min, max)
+
+
+class _Ocl_group_scan_or_reduce(AbstractTemplate):
+    def generic(self, args, kws):
+        assert not kws
+        val, op = args
+        if val not in _group_value_types:
+            return None
+        if (
+            not isinstance(op, types.Function)
+            or op.typing_key not in _group_operations
+        ):
+            return None
+        return signature(val, val, op)
+
+
+@intrinsic
+class Ocl_group_reduce(_Ocl_group_scan_or_reduce):
+    key = dpex.group.reduce
+
+
+@intrinsic
+class Ocl_group_inclusive_scan(_Ocl_group_scan_or_reduce):
+    key = dpex.group.inclusive_scan
+
+
+@intrinsic
+class Ocl_group_exclusive_scan(_Ocl_group_scan_or_reduce):
+    key = dpex.group.exclusive_scan
+
+
+@intrinsic
+class Ocl_group_broadcast(AbstractTemplate):
+    key = dpex.group.broadcast
+
+    def generic(self, args, kws):
+        assert not kws
+        val, src = args
+        if val not in _group_value_types or not isinstance(src, types.Integer):
+            return None
+        return signature(val, val, types.intp)
+
+
+@intrinsic_attr
+class OclGroupTemplate(AttributeTemplate):
+    key = types.Module(dpex.group)
+
+    def resolve_reduce(self, mod):
+        return types.Function(Ocl_group_reduce)
+
+    def resolve_inclusive_scan(self, mod):
+        return types.Function(Ocl_group_inclusive_scan)
+
+    def resolve_exclusive_scan(self, mod):
+        return types.Function(Ocl_group_exclusive_scan)
+
+    def resolve_broadcast(self, mod):
+        return types.Function(Ocl_group_broadcast)
+
+
+intrinsic_global(dpex.group.reduce, types.Function(Ocl_group_reduce))
+intrinsic_global(
+    dpex.group.inclusive_scan, types.Function(Ocl_group_inclusive_scan)
+)
+intrinsic_global(
+    dpex.group.exclusive_scan, types.Function(Ocl_group_exclusive_scan)
+)
+intrinsic_global(dpex.group.broadcast, types.Function(Ocl_group_broadcast))
+
+# dpex.sub_group submodule ---------------------------------------------------
+
+
+@intrinsic
+class Ocl_sub_group_get_local_id(ConcreteTemplate):
+    key = dpex.sub_group.get_local_id
+    cases = [signature(types.intp)]
+
+
+@intrinsic
+class Ocl_sub_group_get_local_size(ConcreteTemplate):
+    key = dpex.sub_group.get_local_size
+    cases = [signature(types.intp)]
+
+
+@intrinsic
+class Ocl_sub_group_get_group_id(ConcreteTemplate):
+    key = dpex.sub_group.get_group_id
+    cases = [signature(types.intp)]
+
+
+@intrinsic
+class Ocl_sub_group_get_num_groups(ConcreteTemplate):
+    key = dpex.sub_group.get_num_groups
+    cases = [signature(types.intp)]
+
+
+class _Ocl_sub_group_shuffle(AbstractTemplate):
+    def generic(self, args, kws):
+        assert not kws
+        val, idx = args
+        if val not in _group_value_types or not isinstance(idx, types.Integer):
+            return None
+        return signature(val, val, types.intp)
+
+
+@intrinsic
+class Ocl_sub_group_shuffle(_Ocl_sub_group_shuffle):
+    key = dpex.sub_group.shuffle
+
+
+@intrinsic
+class Ocl_sub_group_shuffle_xor(_Ocl_sub_group_shuffle):
+    key = dpex.sub_group.shuffle_xor
+
+
+@intrinsic
+class Ocl_sub_group_shuffle_down(_Ocl_sub_group_shuffle):
+    key = dpex.sub_group.shuffle_down
+
+
+@intrinsic
+class Ocl_sub_group_shuffle_up(_Ocl_sub_group_shuffle):
+    key = dpex.sub_group.shuffle_up
+
+
+@intrinsic
+class Ocl_sub_group_broadcast(_Ocl_sub_group_shuffle):
+    key = dpex.sub_group.broadcast
+
+
+@intrinsic
+class Ocl_sub_group_reduce(_Ocl_group_scan_or_reduce):
+    key = dpex.sub_group.reduce
+
+
+@intrinsic
+class Ocl_sub_group_inclusive_scan(_Ocl_group_scan_or_reduce):
+    key = dpex.sub_group.inclusive_scan
+
+
+@intrinsic
+class Ocl_sub_group_exclusive_scan(_Ocl_group_scan_or_reduce):
+    key = dpex.sub_group.exclusive_scan
+
+
+@intrinsic_attr
+class OclSubGroupTemplate(AttributeTemplate):
+    key = types.Module(dpex.sub_group)
+
+    def resolve_get_local_id(self, mod):
+        return types.Function(Ocl_sub_group_get_local_id)
+
+    def resolve_get_local_size(self, mod):
+        return types.Function(Ocl_sub_group_get_local_size)
+
+    def resolve_get_group_id(self, mod):
+        return types.Function(Ocl_sub_group_get_group_id)
+
+    def resolve_get_num_groups(self, mod):
+        return types.Function(Ocl_sub_group_get_num_groups)
+
+    def resolve_shuffle(self, mod):
+        return types.Function(Ocl_sub_group_shuffle)
+
+    def resolve_shuffle_xor(self, mod):
+        return types.Function(Ocl_sub_group_shuffle_xor)
+
+    def resolve_shuffle_down(self, mod):
+        return types.Function(Ocl_sub_group_shuffle_down)
+
+    def resolve_shuffle_up(self, mod):
+        return types.Function(Ocl_sub_group_shuffle_up)
+
+    def resolve_broadcast(self, mod):
+        return types.Function(Ocl_sub_group_broadcast)
+
+    def resolve_reduce(self, mod):
+        return types.Function(Ocl_sub_group_reduce)
+
+    def resolve_inclusive_scan(self, mod):
+        return types.Function(Ocl_sub_group_inclusive_scan)
+
+    def resolve_exclusive_scan(self, mod):
+        return types.Function(Ocl_sub_group_exclusive_scan)
+
+
+intrinsic_global(
+    dpex.sub_group.get_local_id, types.Function(Ocl_sub_group_get_local_id)
+)
+intrinsic_global(
+    dpex.sub_group.get_local_size, types.Function(Ocl_sub_group_get_local_size)
+)
+intrinsic_global(
+    dpex.sub_group.get_group_id, types.Function(Ocl_sub_group_get_group_id)
+)
+intrinsic_global(
+    dpex.sub_group.get_num_groups, types.Function(Ocl_sub_group_get_num_groups)
+)
+intrinsic_global(dpex.sub_group.shuffle, types.Function(Ocl_sub_group_shuffle))
+intrinsic_global(
+    dpex.sub_group.shuffle_xor, types.Function(Ocl_sub_group_shuffle_xor)
+)
+intrinsic_global(
+    dpex.sub_group.shuffle_down, types.Function(Ocl_sub_group_shuffle_down)
+)
+intrinsic_global(
+    dpex.sub_group.shuffle_up, types.Function(Ocl_sub_group_shuffle_up)
+)
+intrinsic_global(
+    dpex.sub_group.broadcast, types.Function(Ocl_sub_group_broadcast)
+)
+intrinsic_global(dpex.sub_group.reduce, types.Function(Ocl_sub_group_reduce))
+intrinsic_global(
+    dpex.sub_group.inclusive_scan, types.Function(Ocl_sub_group_inclusive_scan)
+)
+intrinsic_global(
+    dpex.sub_group.exclusive_scan, types.Function(Ocl_sub_group_exclusive_scan)
+)
 
 # dpex.local submodule -------------------------------------------------------
 
@@ -252,12 +760,33 @@ class OclModuleTemplate(AttributeTemplate):
     def resolve_sub_group_barrier(self, mod):
         return types.Function(Ocl_sub_group_barrier)
 
+    def resolve_unroll(self, mod):
+        return types.Function(Ocl_unroll)
+
+    def resolve_vload(self, mod):
+        return types.Function(Ocl_vload)
+
+    def resolve_vstore(self, mod):
+        return types.Function(Ocl_vstore)
+
     def resolve_atomic(self, mod):
         return types.Module(dpex.atomic)
 
+    def resolve_group(self, mod):
+        return types.Module(dpex.group)
+
     def resolve_local(self, mod):
         return types.Module(dpex.local)
 
+    def resolve_memory_order(self, mod):
+        return types.Module(dpex.memory_order)
+
+    def resolve_memory_scope(self, mod):
+        return types.Module(dpex.memory_scope)
+
+    def resolve_sub_group(self, mod):
+        return types.Module(dpex.sub_group)
+
     def resolve_private(self, mod):
         return types.Module(dpex.private)
 
@@ -9,7 +9,7 @@ import dpctl
 from llvmlite import binding as ll
 from llvmlite import ir as llvmir
 from numba.core import cgutils, types
-from numba.core.imputils import Registry
+from numba.core.imputils import Registry, impl_ret_borrowed
 from numba.core.typing.npydecl import parse_dtype
 
 from numba_dpex import config, kernel_target
@@ -143,11 +143,116 @@ def sub_group_barrier_impl(context, builder, sig, args):
     return _void_value
 
 
-def native_atomic_add(context, builder, sig, args):
-    aryty, indty, valty = sig.args
-    ary, inds, val = args
-    dtype = aryty.dtype
+@lower(stubs.unroll, types.IterableType, types.Any)
+def unroll_impl(context, builder, sig, args):
+    """The iterable is returned as it is. The unroll hint is attached to the
+    loop over it by the KernelLower lowering class.
+    """
+    # Lets llvm-spirv translate the loop metadata to loop controls even if
+    # the loop is not in a structured form.
+    _add_llvm_spirv_ext(context, "SPV_INTEL_unstructured_loop_controls")
+    return impl_ret_borrowed(context, builder, sig.return_type, args[0])
+
+
+def _get_vector_pointer(context, builder, aryty, ary, idxty, idx, width):
+    """Returns a pointer to the first of the ``width`` elements of an array
+    that are selected by the vector index ``idx``.
+    """
+    if aryty.ndim == 1:
+        indices = [idx]
+    else:
+        indices = [
+            context.cast(builder, i, t, types.intp)
+            for t, i in zip(
+                idxty, cgutils.unpack_tuple(builder, idx, count=len(idxty))
+            )
+        ]
+    # The last index selects a vector of consecutive elements.
+    indices[-1] = builder.mul(
+        indices[-1], context.get_constant(types.intp, width)
+    )
+
+    lary = context.make_array(aryty)(context, builder, ary)
+    return cgutils.get_item_pointer(context, builder, aryty, lary, indices)
+
+
+def _get_element_pointers(context, builder, ptr, width):
+    """Returns pointers to the ``width`` consecutive elements starting at
+    ``ptr``.
+    """
+    return [
+        builder.gep(ptr, [context.get_constant(types.intp, i)])
+        for i in range(width)
+    ]
+
+
+def _is_vector_width_packed(width):
+    """Returns True if a vector of ``width`` elements has the size of its
+    elements. In OpenCL and SPIR-V a 3-component vector has the size and
+    alignment of a 4-component one, so it cannot be accessed in place.
+    """
+    return width & (width - 1) == 0
+
+
+@lower(stubs.vload, types.Array, types.Any, types.IntegerLiteral)
+def vload_impl(context, builder, sig, args):
+    aryty, idxty, widthty = sig.args
+    ary, idx, _ = args
+    width = widthty.literal_value
+
+    ptr = _get_vector_pointer(context, builder, aryty, ary, idxty, idx, width)
+    if not _is_vector_width_packed(width):
+        values = [
+            builder.load(elem_ptr)
+            for elem_ptr in _get_element_pointers(context, builder, ptr, width)
+        ]
+        return context.make_tuple(builder, sig.return_type, values)
+
+    vecty = llvmir.VectorType(context.get_data_type(aryty.dtype), width)
+    vptr = builder.bitcast(ptr, vecty.as_pointer(ptr.type.addrspace))
+    # The vector is only guaranteed to be aligned to its elements.
+    align = context.get_abi_sizeof(context.get_data_type(aryty.dtype))
+    vec = builder.load(vptr, align=align)
+
+    values = [
+        builder.extract_element(vec, context.get_constant(types.int32, i))
+        for i in range(width)
+    ]
+    return context.make_tuple(builder, sig.return_type, values)
+
+
+@lower(stubs.vstore, types.Array, types.Any, types.BaseTuple)
+def vstore_impl(context, builder, sig, args):
+    aryty, idxty, valty = sig.args
+    ary, idx, value = args
+    width = len(valty)
+
+    ptr = _get_vector_pointer(context, builder, aryty, ary, idxty, idx, width)
+    values = cgutils.unpack_tuple(builder, value, count=width)
+    if not _is_vector_width_packed(width):
+        for val, elem_ptr in zip(
+            values, _get_element_pointers(context, builder, ptr, width)
+        ):
+            builder.store(val, elem_ptr)
+        return _void_value
+
+    vecty = llvmir.VectorType(context.get_data_type(aryty.dtype), width)
+    vptr = builder.bitcast(ptr, vecty.as_pointer(ptr.type.addrspace))
+    vec = llvmir.Constant(vecty, llvmir.Undefined)
+    for i, val in enumerate(values):
+        vec = builder.insert_element(
+            vec, val, context.get_constant(types.int32, i)
+        )
+    align = context.get_abi_sizeof(context.get_data_type(aryty.dtype))
+    builder.store(vec, vptr, align=align)
+
+    return _void_value
+
 
+def _get_atomic_pointer(context, builder, aryty, ary, indty, inds):
+    """Returns the pointer to the array element an atomic operation is
+    performed on.
+    """
     if indty == types.intp:
         indices = [inds]  # just a single integer
         indty = [indty]
@@ -158,71 +263,164 @@ def native_atomic_add(context, builder, sig, args):
             for t, i in zip(indty, indices)
         ]
 
-    if dtype != valty:
-        raise TypeError("expecting %s but got %s" % (dtype, valty))
-
     if aryty.ndim != len(indty):
         raise TypeError(
             "indexing %d-D array with %d-D index" % (aryty.ndim, len(indty))
         )
 
     lary = context.make_array(aryty)(context, builder, ary)
-    ptr = cgutils.get_item_pointer(context, builder, aryty, lary, indices)
+    return cgutils.get_item_pointer(context, builder, aryty, lary, indices)
 
-    if dtype == types.float32 or dtype == types.float64:
-        context.extra_compile_options[kernel_target.LLVM_SPIRV_ARGS] = [
-            "--spirv-ext=+SPV_EXT_shader_atomic_float_add"
-        ]
-        name = "__spirv_AtomicFAddEXT"
-    elif dtype == types.int32 or dtype == types.int64:
-        name = "__spirv_AtomicIAdd"
-    else:
-        raise TypeError("Unsupported type")
 
-    assert name != ""
-
-    ptr_type = context.get_value_type(dtype).as_pointer()
-    ptr_type.addrspace = aryty.addrspace
+def _get_atomic_memory_order_and_scope(sig):
+    """Returns the SYCL memory order and memory scope given by the last two
+    arguments of an atomic function, which are typed as integer literals.
+    """
+    memory_order, memory_scope = sig.args[-2:]
+    return (
+        atomic_helper.sycl_memory_order(memory_order.literal_value),
+        atomic_helper.sycl_memory_scope(memory_scope.literal_value),
+    )
 
-    retty = context.get_value_type(sig.return_type)
-    spirv_fn_arg_types = [
-        ptr_type,
-        llvmir.IntType(32),
-        llvmir.IntType(32),
-        context.get_value_type(sig.args[2]),
-    ]
 
+def _call_spirv_atomic(
+    context,
+    builder,
+    name,
+    dtype,
+    ptr,
+    addrspace,
+    memory_orders,
+    memory_scope,
+    vals,
+):
+    """Inserts a call to a SPIR-V atomic builtin function.
+
+    Args:
+        name (str): The name of the SPIR-V builtin function.
+        dtype: The Numba type of the array element and of the values.
+        ptr: The pointer to the array element.
+        addrspace (int): The address space of the pointer.
+        memory_orders (list): The SYCL memory order of every memory
+            semantics argument of the builtin function.
+        memory_scope: The SYCL memory scope of the operation.
+        vals (list): The value arguments of the builtin function.
+    """
     from numba_dpex.core import itanium_mangler as ext_itanium_mangler
 
-    numba_ptr_ty = types.CPointer(dtype, addrspace=ptr_type.addrspace)
+    numba_ptr_ty = types.CPointer(dtype, addrspace=addrspace)
     mangled_fn_name = ext_itanium_mangler.mangle_ext(
         name,
-        [
-            numba_ptr_ty,
-            "__spv.Scope.Flag",
-            "__spv.MemorySemanticsMask.Flag",
-            valty,
-        ],
+        [numba_ptr_ty, "__spv.Scope.Flag"]
+        + ["__spv.MemorySemanticsMask.Flag"] * len(memory_orders)
+        + [dtype] * len(vals),
     )
 
-    fnty = llvmir.FunctionType(retty, spirv_fn_arg_types)
+    llvalty = context.get_value_type(dtype)
+    spirv_fn_arg_types = (
+        [llvalty.as_pointer(addrspace)]
+        + [llvmir.IntType(32)] * (len(memory_orders) + 1)
+        + [llvalty] * len(vals)
+    )
+    fnty = llvmir.FunctionType(llvalty, spirv_fn_arg_types)
     fn = cgutils.get_or_insert_function(builder.module, fnty, mangled_fn_name)
     fn.calling_convention = kernel_target.CC_SPIR_FUNC
 
-    sycl_memory_order = atomic_helper.sycl_memory_order.relaxed
-    sycl_memory_scope = atomic_helper.sycl_memory_scope.device
-    spirv_scope = atomic_helper.get_scope(sycl_memory_scope)
-    spirv_memory_semantics_mask = atomic_helper.get_memory_semantics_mask(
-        sycl_memory_order
-    )
-    fn_args = [
+    spirv_scope = atomic_helper.get_scope(memory_scope)
+    fn_args = [ptr, context.get_constant(types.int32, spirv_scope)]
+    for memory_order in memory_orders:
+        spirv_memory_semantics_mask = atomic_helper.get_memory_semantics_mask(
+            memory_order
+        )
+        fn_args.append(
+            context.get_constant(types.int32, spirv_memory_semantics_mask)
+        )
+
+    return builder.call(fn, fn_args + list(vals))
+
+
+# Maps an atomic read-modify-write function to the SPIR-V builtin functions
+# implementing it for signed integers, unsigned integers and floats, and to
+# the SPIR-V extension needed by the floating-point builtin.
+_atomic_op_to_spirv_fn = {
+    "add": (
+        "__spirv_AtomicIAdd",
+        "__spirv_AtomicIAdd",
+        "__spirv_AtomicFAddEXT",
+        "SPV_EXT_shader_atomic_float_add",
+    ),
+    "sub": (
+        "__spirv_AtomicISub",
+        "__spirv_AtomicISub",
+        None,
+        None,
+    ),
+    "min": (
+        "__spirv_AtomicSMin",
+        "__spirv_AtomicUMin",
+        "__spirv_AtomicFMinEXT",
+        "SPV_EXT_shader_atomic_float_min_max",
+    ),
+    "max": (
+        "__spirv_AtomicSMax",
+        "__spirv_AtomicUMax",
+        "__spirv_AtomicFMaxEXT",
+        "SPV_EXT_shader_atomic_float_min_max",
+    ),
+    "and_": ("__spirv_AtomicAnd", "__spirv_AtomicAnd", None, None),
+    "or_": ("__spirv_AtomicOr", "__spirv_AtomicOr", None, None),
+    "xor": ("__spirv_AtomicXor", "__spirv_AtomicXor", None, None),
+    "exchange": (
+        "__spirv_AtomicExchange",
+        "__spirv_AtomicExchange",
+        "__spirv_AtomicExchange",
+        None,
+    ),
+}
+
+
+def native_atomic_op(context, builder, sig, args, op):
+    """Lowers the atomic read-modify-write function ``op`` to the SPIR-V
+    atomic builtin function implementing it.
+    """
+    aryty, indty, valty = sig.args[:3]
+    ary, inds, val = args[:3]
+    dtype = aryty.dtype
+
+    if dtype != valty:
+        raise TypeError("expecting %s but got %s" % (dtype, valty))
+
+    signed_fn, unsigned_fn, float_fn, float_ext = _atomic_op_to_spirv_fn[op]
+    if isinstance(dtype, types.Float):
+        name = float_fn
+        if float_ext is not None:
+            _add_llvm_spirv_ext(context, float_ext)
+    elif isinstance(dtype, types.Integer):
+        name = signed_fn if dtype.signed else unsigned_fn
+    else:
+        name = None
+
+    if name is None:
+        raise TypeError("Unsupported type")
+
+    ptr = _get_atomic_pointer(context, builder, aryty, ary, indty, inds)
+    memory_order, memory_scope = _get_atomic_memory_order_and_scope(sig)
+
+    return _call_spirv_atomic(
+        context,
+        builder,
+        name,
+        dtype,
         ptr,
-        context.get_constant(types.int32, spirv_scope),
-        context.get_constant(types.int32, spirv_memory_semantics_mask),
-        val,
-    ]
+        aryty.addrspace,
+        [memory_order],
+        memory_scope,
+        [val],
+    )
 
-    return builder.call(fn, fn_args)
+
+def native_atomic_add(context, builder, sig, args):
+    return native_atomic_op(context, builder, sig, args, "add")
 
 
 def support_atomic(dtype: types.Type) -> bool:
@@ -239,9 +437,14 @@ def support_atomic(dtype: types.Type) -> bool:
     )
 
 
-@lower(stubs.atomic.add, types.Array, types.intp, types.Any)
-@lower(stubs.atomic.add, types.Array, types.UniTuple, types.Any)
-@lower(stubs.atomic.add, types.Array, types.Tuple, types.Any)
+@lower(
+    stubs.atomic.add,
+    types.Array,
+    types.Any,
+    types.Any,
+    types.IntegerLiteral,
+    types.IntegerLiteral,
+)
 def atomic_add_tuple(context, builder, sig, args):
     dtype = sig.args[0].dtype
     if support_atomic(dtype):
@@ -255,32 +458,23 @@ def atomic_sub_wrapper(context, builder, sig, args):
     # reuse atomic.add and negate the value. For example, atomic.add(A, index, -val) is
     # equivalent to atomic.sub(A, index, val).
     val = args[2]
-    new_val = cgutils.alloca_once(
-        builder,
-        context.get_value_type(sig.args[2]),
-        size=context.get_constant(types.uintp, 1),
-        name="new_val_0",
-    )
     val_dtype = sig.args[2]
     if val_dtype == types.float32 or val_dtype == types.float64:
-        builder.store(
-            builder.fmul(val, context.get_constant(sig.args[2], -1)), new_val
-        )
-    elif val_dtype == types.int32 or val_dtype == types.int64:
-        builder.store(
-            builder.mul(val, context.get_constant(sig.args[2], -1)), new_val
-        )
+        args = list(args)
+        args[2] = builder.fmul(val, context.get_constant(val_dtype, -1))
+        return native_atomic_add(context, builder, sig, args)
     else:
-        raise TypeError("Unsupported type %s" % val_dtype)
+        return native_atomic_op(context, builder, sig, args, "sub")
 
-    args[2] = builder.load(new_val)
 
-    return native_atomic_add(context, builder, sig, args)
-
-
-@lower(stubs.atomic.sub, types.Array, types.intp, types.Any)
-@lower(stubs.atomic.sub, types.Array, types.UniTuple, types.Any)
-@lower(stubs.atomic.sub, types.Array, types.Tuple, types.Any)
+@lower(
+    stubs.atomic.sub,
+    types.Array,
+    types.Any,
+    types.Any,
+    types.IntegerLiteral,
+    types.IntegerLiteral,
+)
 def atomic_sub_tuple(context, builder, sig, args):
     dtype = sig.args[0].dtype
     if support_atomic(dtype):
@@ -289,6 +483,401 @@ def atomic_sub_tuple(context, builder, sig, args):
         raise TypeError(f"Atomic operation on unsupported type {dtype}")
 
 
+def _lower_atomic_op(op):
+    """Registers the lowering of the atomic read-modify-write function
+    ``stubs.atomic.<op>``.
+    """
+
+    @lower(
+        getattr(stubs.atomic, op),
+        types.Array,
+        types.Any,
+        types.Any,
+        types.IntegerLiteral,
+        types.IntegerLiteral,
+    )
+    def atomic_op_impl(context, builder, sig, args):
+        dtype = sig.args[0].dtype
+        if support_atomic(dtype):
+            return native_atomic_op(context, builder, sig, args, op)
+        else:
+            raise TypeError(f"Atomic operation on unsupported type {dtype}")
+
+
+for _op in ("min", "max", "and_", "or_", "xor", "exchange"):
+    _lower_atomic_op(_op)
+
+
+@lower(
+    stubs.atomic.compare_exchange,
+    types.Array,
+    types.Any,
+    types.Any,
+    types.Any,
+    types.IntegerLiteral,
+    types.IntegerLiteral,
+)
+def atomic_compare_exchange(context, builder, sig, args):
+    aryty, indty, expectedty, desiredty = sig.args[:4]
+    ary, inds, expected, desired = args[:4]
+    dtype = aryty.dtype
+
+    if not support_atomic(dtype):
+        raise TypeError(f"Atomic operation on unsupported type {dtype}")
+    if dtype != expectedty or dtype != desiredty:
+        raise TypeError(
+            "expecting %s but got %s and %s" % (dtype, expectedty, desiredty)
+        )
+
+    ptr = _get_atomic_pointer(context, builder, aryty, ary, indty, inds)
+    memory_order, memory_scope = _get_atomic_memory_order_and_scope(sig)
+    failure_memory_order = (
+        atomic_helper.get_compare_exchange_failure_memory_order(memory_order)
+    )
+
+    # OpAtomicCompareExchange only supports integers, floats are compared
+    # and exchanged by their bit patterns, as in DPC++.
+    if isinstance(dtype, types.Float):
+        cmpty = types.int32 if dtype == types.float32 else types.int64
+        llcmpty = context.get_value_type(cmpty)
+        ptr = builder.bitcast(ptr, llcmpty.as_pointer(aryty.addrspace))
+        expected = builder.bitcast(expected, llcmpty)
+        desired = builder.bitcast(desired, llcmpty)
+    else:
+        cmpty = dtype
+
+    old = _call_spirv_atomic(
+        context,
+        builder,
+        "__spirv_AtomicCompareExchange",
+        cmpty,
+        ptr,
+        aryty.addrspace,
+        [memory_order, failure_memory_order],
+        memory_scope,
+        [desired, expected],
+    )
+
+    if cmpty != dtype:
+        old = builder.bitcast(old, context.get_value_type(dtype))
+
+    return old
+
+
+def _add_llvm_spirv_ext(context, ext):
+    """Enables a SPIR-V extension for the translation of the kernel that is
+    being compiled with the target context.
+    """
+    llvm_spirv_args = context.extra_compile_options.setdefault(
+        kernel_target.LLVM_SPIRV_ARGS, []
+    )
+    arg = "--spirv-ext=+" + ext
+    if arg not in llvm_spirv_args:
+        llvm_spirv_args.append(arg)
+
+
+# The SPIR-V group operations, see section 3.28 of the SPIR-V specification
+_SPV_GROUP_OPERATION_REDUCE = 0
+_SPV_GROUP_OPERATION_INCLUSIVE_SCAN = 1
+_SPV_GROUP_OPERATION_EXCLUSIVE_SCAN = 2
+
+# Maps a work-group collective operation to the SPIR-V group instructions
+# implementing it for signed integers, unsigned integers and floats.
+_group_op_to_spirv_fn = {
+    operator.add: (
+        "__spirv_GroupIAdd",
+        "__spirv_GroupIAdd",
+        "__spirv_GroupFAdd",
+    ),
+    min: ("__spirv_GroupSMin", "__spirv_GroupUMin", "__spirv_GroupFMin"),
+    max: ("__spirv_GroupSMax", "__spirv_GroupUMax", "__spirv_GroupFMax"),
+}
+
+# Maps a sub-group collective operation to the SPIR-V non-uniform group
+# instructions implementing it for signed integers, unsigned integers and
+# floats.
+_sub_group_op_to_spirv_fn = {
+    operator.add: (
+        "__spirv_GroupNonUniformIAdd",
+        "__spirv_GroupNonUniformIAdd",
+        "__spirv_GroupNonUniformFAdd",
+    ),
+    min: (
+        "__spirv_GroupNonUniformSMin",
+        "__spirv_GroupNonUniformUMin",
+        "__spirv_GroupNonUniformFMin",
+    ),
+    max: (
+        "__spirv_GroupNonUniformSMax",
+        "__spirv_GroupNonUniformUMax",
+        "__spirv_GroupNonUniformFMax",
+    ),
+}
+
+# The mangled type of the execution scope argument of SPIR-V builtins
+_SPV_SCOPE = "__spv.Scope.Flag"
+
+
+def _declare_spirv_function(context, builder, name, argtys, retty):
+    """Inserts the declaration of a SPIR-V builtin function that has to be
+    executed by all the work-items of a group.
+
+    The execution scope argument of a builtin is given as ``_SPV_SCOPE`` in
+    ``argtys`` and is passed as an int32.
+    """
+    from numba_dpex.core import itanium_mangler as ext_itanium_mangler
+
+    mangled_fn_name = ext_itanium_mangler.mangle_ext(name, argtys)
+    fnty = llvmir.FunctionType(
+        context.get_value_type(retty),
+        [
+            llvmir.IntType(32) if t == _SPV_SCOPE else context.get_value_type(t)
+            for t in argtys
+        ],
+    )
+    fn = cgutils.get_or_insert_function(builder.module, fnty, mangled_fn_name)
+    fn.calling_convention = kernel_target.CC_SPIR_FUNC
+    # The group instructions have to be executed by all the work-items of a
+    # group, so they must not be moved across control flow.
+    fn.attributes.add("convergent")
+
+    return fn
+
+
+def _lower_group_scan_or_reduce(
+    context, builder, sig, args, group_operation, memory_scope
+):
+    valty, opty = sig.args
+    val = args[0]
+
+    if memory_scope == atomic_helper.sycl_memory_scope.work_group:
+        spirv_fns = _group_op_to_spirv_fn[opty.typing_key]
+    else:
+        spirv_fns = _sub_group_op_to_spirv_fn[opty.typing_key]
+
+    signed_fn, unsigned_fn, float_fn = spirv_fns
+    if isinstance(valty, types.Float):
+        name = float_fn
+    elif valty.signed:
+        name = signed_fn
+    else:
+        name = unsigned_fn
+
+    fn = _declare_spirv_function(
+        context,
+        builder,
+        name,
+        [_SPV_SCOPE, types.uint32, valty],
+        sig.return_type,
+    )
+    spirv_scope = atomic_helper.get_scope(memory_scope)
+
+    return builder.call(
+        fn,
+        [
+            context.get_constant(types.int32, spirv_scope),
+            context.get_constant(types.uint32, group_operation),
+            val,
+        ],
+    )
+
+
+def _lower_group_broadcast(context, builder, sig, args, memory_scope, idty):
+    valty, srcty = sig.args
+    val, src = args
+
+    fn = _declare_spirv_function(
+        context,
+        builder,
+        "__spirv_GroupBroadcast",
+        [_SPV_SCOPE, valty, idty],
+        sig.return_type,
+    )
+    spirv_scope = atomic_helper.get_scope(memory_scope)
+
+    return builder.call(
+        fn,
+        [
+            context.get_constant(types.int32, spirv_scope),
+            val,
+            context.cast(builder, src, srcty, idty),
+        ],
+    )
+
+
+@lower(stubs.group.reduce, types.Any, types.Function)
+def dpex_group_reduce(context, builder, sig, args):
+    return _lower_group_scan_or_reduce(
+        context,
+        builder,
+        sig,
+        args,
+        _SPV_GROUP_OPERATION_REDUCE,
+        atomic_helper.sycl_memory_scope.work_group,
+    )
+
+
+@lower(stubs.group.inclusive_scan, types.Any, types.Function)
+def dpex_group_inclusive_scan(context, builder, sig, args):
+    return _lower_group_scan_or_reduce(
+        context,
+        builder,
+        sig,
+        args,
+        _SPV_GROUP_OPERATION_INCLUSIVE_SCAN,
+        atomic_helper.sycl_memory_scope.work_group,
+    )
+
+
+@lower(stubs.group.exclusive_scan, types.Any, types.Function)
+def dpex_group_exclusive_scan(context, builder, sig, args):
+    return _lower_group_scan_or_reduce(
+        context,
+        builder,
+        sig,
+        args,
+        _SPV_GROUP_OPERATION_EXCLUSIVE_SCAN,
+        atomic_helper.sycl_memory_scope.work_group,
+    )
+
+
+@lower(stubs.group.broadcast, types.Any, types.intp)
+def dpex_group_broadcast(context, builder, sig, args):
+    return _lower_group_broadcast(
+        context,
+        builder,
+        sig,
+        args,
+        atomic_helper.sycl_memory_scope.work_group,
+        types.uintp,
+    )
+
+
+def _lower_sub_group_id(context, builder, sig, name):
+    fn = _declare_function(context, builder, name, types.uint32(), ["void"])
+    res = builder.call(fn, [])
+    return context.cast(builder, res, types.uint32, types.intp)
+
+
+@lower(stubs.sub_group.get_local_id)
+def dpex_sub_group_get_local_id(context, builder, sig, args):
+    return _lower_sub_group_id(context, builder, sig, "get_sub_group_local_id")
+
+
+@lower(stubs.sub_group.get_local_size)
+def dpex_sub_group_get_local_size(context, builder, sig, args):
+    return _lower_sub_group_id(context, builder, sig, "get_sub_group_size")
+
+
+@lower(stubs.sub_group.get_group_id)
+def dpex_sub_group_get_group_id(context, builder, sig, args):
+    return _lower_sub_group_id(context, builder, sig, "get_sub_group_id")
+
+
+@lower(stubs.sub_group.get_num_groups)
+def dpex_sub_group_get_num_groups(context, builder, sig, args):
+    return _lower_sub_group_id(context, builder, sig, "get_num_sub_groups")
+
+
+def _lower_sub_group_shuffle(context, builder, sig, args, name, two_values):
+    """Lowers a sub-group shuffle to a SPV_INTEL_subgroups instruction.
+
+    The shuffle up and down instructions take two values and shuffle within
+    their concatenation. Passing the value of the work-item as both of them
+    gives the semantics of SYCL's shift_group_left and shift_group_right.
+    """
+    valty, idty = sig.args
+    val, idx = args
+
+    _add_llvm_spirv_ext(context, "SPV_INTEL_subgroups")
+
+    valtys = [valty, valty] if two_values else [valty]
+    fn = _declare_spirv_function(
+        context, builder, name, valtys + [types.uint32], sig.return_type
+    )
+    vals = [val, val] if two_values else [val]
+
+    return builder.call(
+        fn, vals + [context.cast(builder, idx, idty, types.uint32)]
+    )
+
+
+@lower(stubs.sub_group.shuffle, types.Any, types.intp)
+def dpex_sub_group_shuffle(context, builder, sig, args):
+    return _lower_sub_group_shuffle(
+        context, builder, sig, args, "__spirv_SubgroupShuffleINTEL", False
+    )
+
+
+@lower(stubs.sub_group.shuffle_xor, types.Any, types.intp)
+def dpex_sub_group_shuffle_xor(context, builder, sig, args):
+    return _lower_sub_group_shuffle(
+        context, builder, sig, args, "__spirv_SubgroupShuffleXorINTEL", False
+    )
+
+
+@lower(stubs.sub_group.shuffle_down, types.Any, types.intp)
+def dpex_sub_group_shuffle_down(context, builder, sig, args):
+    return _lower_sub_group_shuffle(
+        context, builder, sig, args, "__spirv_SubgroupShuffleDownINTEL", True
+    )
+
+
+@lower(stubs.sub_group.shuffle_up, types.Any, types.intp)
+def dpex_sub_group_shuffle_up(context, builder, sig, args):
+    return _lower_sub_group_shuffle(
+        context, builder, sig, args, "__spirv_SubgroupShuffleUpINTEL", True
+    )
+
+
+@lower(stubs.sub_group.reduce, types.Any, types.Function)
+def dpex_sub_group_reduce(context, builder, sig, args):
+    return _lower_group_scan_or_reduce(
+        context,
+        builder,
+        sig,
+        args,
+        _SPV_GROUP_OPERATION_REDUCE,
+        atomic_helper.sycl_memory_scope.sub_group,
+    )
+
+
+@lower(stubs.sub_group.inclusive_scan, types.Any, types.Function)
+def dpex_sub_group_inclusive_scan(context, builder, sig, args):
+    return _lower_group_scan_or_reduce(
+        context,
+        builder,
+        sig,
+        args,
+        _SPV_GROUP_OPERATION_INCLUSIVE_SCAN,
+        atomic_helper.sycl_memory_scope.sub_group,
+    )
+
+
+@lower(stubs.sub_group.exclusive_scan, types.Any, types.Function)
+def dpex_sub_group_exclusive_scan(context, builder, sig, args):
+    return _lower_group_scan_or_reduce(
+        context,
+        builder,
+        sig,
+        args,
+        _SPV_GROUP_OPERATION_EXCLUSIVE_SCAN,
+        atomic_helper.sycl_memory_scope.sub_group,
+    )
+
+
+@lower(stubs.sub_group.broadcast, types.Any, types.intp)
+def dpex_sub_group_broadcast(context, builder, sig, args):
+    return _lower_group_broadcast(
+        context,
+        builder,
+        sig,
+        args,
+        atomic_helper.sycl_memory_scope.sub_group,
+        types.uint32,
+    )
+
+
 @lower(stubs.private.array, types.IntegerLiteral, types.Any)
 def dpex_private_array_integer(context, builder, sig, args):
     length = sig.args[0].literal_value
@@ -2,6 +2,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from numba_dpex.ocl.atomics import atomic_helper
+
 _stub_error = NotImplementedError("This is a stub.")
 
 # mem fence
@@ -79,6 +81,58 @@ def sub_group_barrier():
     raise _stub_error
 
 
+def unroll(iterable, factor=None):
+    """Marks a ``for`` loop over ``iterable`` for unrolling.
+
+    ``for i in unroll(range(n), 4)`` unrolls the loop by a factor of 4 and
+    ``for i in unroll(range(n))`` unrolls it fully. A factor of 1 disables
+    unrolling. The hint is passed to the device compiler as SPIR-V loop
+    control.
+
+    Args:
+        iterable: The iterable of the loop, e.g., a range object.
+        factor (int, optional): A compile-time constant unroll factor.
+
+    Returns: The iterable.
+    """
+    raise _stub_error
+
+
+def vload(ary, idx, width):
+    """Loads a vector of ``width`` consecutive elements of a C-contiguous array
+    with a single vector load.
+
+    The vector ``idx`` of a 1-D array consists of the elements
+    ``ary[idx * width : (idx + 1) * width]``. For an N-D array ``idx`` is a
+    tuple and its last index selects the vector along the last dimension.
+
+    Args:
+        ary: A C-contiguous array of 32- or 64-bit integers or floats.
+        idx: The index of the vector.
+        width (int): A compile-time constant vector width of 2, 3, 4, 8
+            or 16. A width of 3 is loaded element by element.
+
+    Returns: A tuple of the ``width`` loaded elements.
+    """
+    raise _stub_error
+
+
+def vstore(ary, idx, value):
+    """Stores a tuple of values to consecutive elements of a C-contiguous
+    array with a single vector store.
+
+    The vector width is the length of ``value``, and ``idx`` is the index of
+    the vector as for ``vload``.
+
+    Args:
+        ary: A C-contiguous array of 32- or 64-bit integers or floats.
+        idx: The index of the vector.
+        value (tuple): The 2, 3, 4, 8 or 16 values to store. Three values
+            are stored element by element.
+    """
+    raise _stub_error
+
+
 class Stub(object):
     """A stub object to represent special objects that are meaningless
     outside the context of kernel compilation.
@@ -131,25 +185,41 @@ class local(Stub):
 
 
 class atomic(Stub):
+    """Atomic functions supported by Data Parallel Extension for Numba.
+
+    Every function takes the optional ``memory_order`` and ``memory_scope``
+    arguments that have to be compile-time constants, e.g.,
+    ``dpex.memory_order.acq_rel`` and ``dpex.memory_scope.work_group``. The
+    default memory order is ``relaxed`` and the default memory scope is
+    ``device``. The narrowest memory scope containing all the work-items that
+    access the array element concurrently is the cheapest correct one.
+    """
+
     _description_ = (
         "Atomic functions supported by Data Parallel Extension for Numba"
     )
 
     def add():
         """
-        add(ary, idx, val)
+        add(ary, idx, val, memory_order=relaxed, memory_scope=device)
 
         Performs atomic addition ary[idx] += val.
 
         Parameters:
            ary: An array on which the atomic operation is performed.
-                Allowed types: int32, int64, float32, or float64
+                Allowed types: int32, int64, uint32, uint64, float32, or float64
 
            idx (int): Index of the array element, on which atomic operation is performed
 
            val: The value of an increment.
                 Its type must match the type of array elements, ary[]
 
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
         Returns:
                The old value at the index location ary[idx] as if it is loaded atomically.
 
@@ -160,23 +230,545 @@ class atomic(Stub):
 
     def sub():
         """
-        sub(ary, idx, val)
+        sub(ary, idx, val, memory_order=relaxed, memory_scope=device)
 
         Performs atomic subtraction ary[idx] -= val.
 
         Parameters:
            ary: An array on which the atomic operation is performed.
-                Allowed types: int32, int64, float32, or float64
+                Allowed types: int32, int64, uint32, uint64, float32, or float64
 
            idx (int): Index of the array element, on which atomic operation is performed
 
            val: The value of a decrement.
                 Its type must match the type of array elements, ary[]
 
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
+        Returns:
+               The old value at the index location ary[idx] as if it is loaded atomically.
+
+        Raises:
+            None
+
+        """
+
+    def min():
+        """
+        min(ary, idx, val, memory_order=relaxed, memory_scope=device)
+
+        Performs atomic minimum ary[idx] = min(ary[idx], val).
+
+        Parameters:
+           ary: An array on which the atomic operation is performed.
+                Allowed types: int32, int64, uint32, uint64, float32, or float64
+
+           idx (int): Index of the array element, on which atomic operation is performed
+
+           val: The value compared with ary[idx].
+                Its type must match the type of array elements, ary[]
+
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
+        Returns:
+               The old value at the index location ary[idx] as if it is loaded atomically.
+
+        Raises:
+            None
+
+        """
+
+    def max():
+        """
+        max(ary, idx, val, memory_order=relaxed, memory_scope=device)
+
+        Performs atomic maximum ary[idx] = max(ary[idx], val).
+
+        Parameters:
+           ary: An array on which the atomic operation is performed.
+                Allowed types: int32, int64, uint32, uint64, float32, or float64
+
+           idx (int): Index of the array element, on which atomic operation is performed
+
+           val: The value compared with ary[idx].
+                Its type must match the type of array elements, ary[]
+
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
+        Returns:
+               The old value at the index location ary[idx] as if it is loaded atomically.
+
+        Raises:
+            None
+
+        """
+
+    def and_():
+        """
+        and_(ary, idx, val, memory_order=relaxed, memory_scope=device)
+
+        Performs atomic bitwise and ary[idx] &= val.
+
+        Parameters:
+           ary: An array on which the atomic operation is performed.
+                Allowed types: int32, int64, uint32, or uint64
+
+           idx (int): Index of the array element, on which atomic operation is performed
+
+           val: The operand of the bitwise and.
+                Its type must match the type of array elements, ary[]
+
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
+        Returns:
+               The old value at the index location ary[idx] as if it is loaded atomically.
+
+        Raises:
+            None
+
+        """
+
+    def or_():
+        """
+        or_(ary, idx, val, memory_order=relaxed, memory_scope=device)
+
+        Performs atomic bitwise or ary[idx] |= val.
+
+        Parameters:
+           ary: An array on which the atomic operation is performed.
+                Allowed types: int32, int64, uint32, or uint64
+
+           idx (int): Index of the array element, on which atomic operation is performed
+
+           val: The operand of the bitwise or.
+                Its type must match the type of array elements, ary[]
+
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
+        Returns:
+               The old value at the index location ary[idx] as if it is loaded atomically.
+
+        Raises:
+            None
+
+        """
+
+    def xor():
+        """
+        xor(ary, idx, val, memory_order=relaxed, memory_scope=device)
+
+        Performs atomic bitwise xor ary[idx] ^= val.
+
+        Parameters:
+           ary: An array on which the atomic operation is performed.
+                Allowed types: int32, int64, uint32, or uint64
+
+           idx (int): Index of the array element, on which atomic operation is performed
+
+           val: The operand of the bitwise xor.
+                Its type must match the type of array elements, ary[]
+
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
+        Returns:
+               The old value at the index location ary[idx] as if it is loaded atomically.
+
+        Raises:
+            None
+
+        """
+
+    def exchange():
+        """
+        exchange(ary, idx, val, memory_order=relaxed, memory_scope=device)
+
+        Performs atomic exchange ary[idx] = val.
+
+        Parameters:
+           ary: An array on which the atomic operation is performed.
+                Allowed types: int32, int64, uint32, uint64, float32, or float64
+
+           idx (int): Index of the array element, on which atomic operation is performed
+
+           val: The new value of ary[idx].
+                Its type must match the type of array elements, ary[]
+
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
+        Returns:
+               The old value at the index location ary[idx] as if it is loaded atomically.
+
+        Raises:
+            None
+
+        """
+
+    def compare_exchange():
+        """
+        compare_exchange(ary, idx, expected, desired, memory_order=relaxed, memory_scope=device)
+
+        Performs atomic compare and exchange, i.e., sets ary[idx] = desired
+        if ary[idx] == expected.
+
+        Parameters:
+           ary: An array on which the atomic operation is performed.
+                Allowed types: int32, int64, uint32, uint64, float32, or float64
+
+           idx (int): Index of the array element, on which atomic operation is performed
+
+           expected: The value ary[idx] is compared with.
+                Its type must match the type of array elements, ary[]
+
+           desired: The new value of ary[idx] if the comparison succeeds.
+                Its type must match the type of array elements, ary[]
+
+           memory_order (optional): The memory order of the operation, a
+                memory_order constant.
+
+           memory_scope (optional): The set of work-items that may access
+                ary[idx] concurrently, a memory_scope constant.
+
         Returns:
                The old value at the index location ary[idx] as if it is loaded atomically.
+               The exchange succeeded if it is equal to expected.
 
         Raises:
             None
 
         """
+
+
+class memory_order(Stub):
+    """The memory orders of the atomic functions. They have the same meaning
+    as the values of ``sycl::memory_order``.
+    """
+
+    _description_ = "<memory_order>"
+
+    relaxed = atomic_helper.sycl_memory_order.relaxed.value
+    acquire = atomic_helper.sycl_memory_order.acquire.value
+    release = atomic_helper.sycl_memory_order.release.value
+    acq_rel = atomic_helper.sycl_memory_order.acq_rel.value
+    seq_cst = atomic_helper.sycl_memory_order.seq_cst.value
+
+
+class memory_scope(Stub):
+    """The memory scopes of the atomic functions. They have the same meaning
+    as the values of ``sycl::memory_scope``.
+    """
+
+    _description_ = "<memory_scope>"
+
+    work_item = atomic_helper.sycl_memory_scope.work_item.value
+    sub_group = atomic_helper.sycl_memory_scope.sub_group.value
+    work_group = atomic_helper.sycl_memory_scope.work_group.value
+    device = atomic_helper.sycl_memory_scope.device.value
+    system = atomic_helper.sycl_memory_scope.system.value
+
+
+# -------------------------------------------------------------------------------
+# work-group collectives
+
+
+class group(Stub):
+    """Work-group collective functions supported by Data Parallel Extension
+    for Numba.
+
+    The functions have to be called by all the work-items of a work-group
+    and are lowered to the SPIR-V group instructions. The supported
+    operations are ``operator.add``, ``min`` and ``max``, and the supported
+    value types are int32, int64, uint32, uint64, float32 and float64.
+    """
+
+    _description_ = "<group>"
+
+    def reduce():
+        """
+        reduce(x, op)
+
+        Combines the values of x of all the work-items of a work-group.
+
+        Parameters:
+           x: The value of the work-item.
+
+           op: The operation used to combine the values, one of
+               ``operator.add``, ``min`` or ``max``.
+
+        Returns:
+               The combined value, which is the same for every work-item.
+        """
+
+    def inclusive_scan():
+        """
+        inclusive_scan(x, op)
+
+        Computes the inclusive prefix scan of the values of x of the
+        work-items of a work-group in the order of their local ids.
+
+        Parameters:
+           x: The value of the work-item.
+
+           op: The operation used to combine the values, one of
+               ``operator.add``, ``min`` or ``max``.
+
+        Returns:
+               The combination of the values of the work-items with a local
+               id lower than or equal to the one of the work-item.
+        """
+
+    def exclusive_scan():
+        """
+        exclusive_scan(x, op)
+
+        Computes the exclusive prefix scan of the values of x of the
+        work-items of a work-group in the order of their local ids.
+
+        Parameters:
+           x: The value of the work-item.
+
+           op: The operation used to combine the values, one of
+               ``operator.add``, ``min`` or ``max``.
+
+        Returns:
+               The combination of the values of the work-items with a local
+               id lower than the one of the work-item. The first work-item
+               gets the identity of the operation.
+        """
+
+    def broadcast():
+        """
+        broadcast(x, src)
+
+        Broadcasts the value of x of one work-item to all the work-items of
+        a one-dimensional work-group.
+
+        Parameters:
+           x: The value of the work-item.
+
+           src (int): The local id of the work-item whose value is
+                      broadcast. It has to be the same for all the
+                      work-items.
+
+        Returns:
+               The value of x of the work-item with the local id src.
+        """
+
+
+class sub_group(Stub):
+    """Sub-group functions supported by Data Parallel Extension for Numba.
+
+    A sub-group is a subset of the work-items of a work-group that execute
+    together on a SIMD unit of a device. The functions have to be called by
+    all the work-items of a sub-group. The shuffles are lowered to the
+    SPV_INTEL_subgroups instructions and the collective functions to the
+    SPIR-V non-uniform group instructions. The supported value types are
+    int32, int64, uint32, uint64, float32 and float64.
+    """
+
+    _description_ = "<sub_group>"
+
+    def get_local_id():
+        """
+        get_local_id()
+
+        Returns:
+               The id of the work-item inside its sub-group.
+        """
+
+    def get_local_size():
+        """
+        get_local_size()
+
+        Returns:
+               The number of work-items in the sub-group of the work-item.
+        """
+
+    def get_group_id():
+        """
+        get_group_id()
+
+        Returns:
+               The id of the sub-group of the work-item inside the
+               work-group.
+        """
+
+    def get_num_groups():
+        """
+        get_num_groups()
+
+        Returns:
+               The number of sub-groups in the work-group of the work-item.
+        """
+
+    def shuffle():
+        """
+        shuffle(x, id)
+
+        Exchanges values of x between the work-items of a sub-group.
+
+        Parameters:
+           x: The value of the work-item.
+
+           id (int): The sub-group local id of the work-item whose value is
+                     read.
+
+        Returns:
+               The value of x of the work-item with the sub-group local id
+               id.
+        """
+
+    def shuffle_xor():
+        """
+        shuffle_xor(x, mask)
+
+        Exchanges values of x between the work-items of a sub-group in a
+        butterfly pattern.
+
+        Parameters:
+           x: The value of the work-item.
+
+           mask (int): The mask xor-ed with the sub-group local id of the
+                       work-item to get the id of the work-item whose value
+                       is read.
+
+        Returns:
+               The value of x of the work-item with the sub-group local id
+               ``get_local_id() ^ mask``.
+        """
+
+    def shuffle_down():
+        """
+        shuffle_down(x, delta)
+
+        Reads the value of x of a work-item with a higher sub-group local
+        id.
+
+        Parameters:
+           x: The value of the work-item.
+
+           delta (int): The distance to the work-item whose value is read.
+
+        Returns:
+               The value of x of the work-item with the sub-group local id
+               ``get_local_id() + delta``. The result is undefined if the id
+               is not lower than the size of the sub-group.
+        """
+
+    def shuffle_up():
+        """
+        shuffle_up(x, delta)
+
+        Reads the value of x of a work-item with a lower sub-group local id.
+
+        Parameters:
+           x: The value of the work-item.
+
+           delta (int): The distance to the work-item whose value is read.
+
+        Returns:
+               The value of x of the work-item with the sub-group local id
+               ``get_local_id() - delta``. The result is undefined if the id
+               is lower than zero.
+        """
+
+    def reduce():
+        """
+        reduce(x, op)
+
+        Combines the values of x of all the work-items of a sub-group.
+
+        Parameters:
+           x: The value of the work-item.
+
+           op: The operation used to combine the values, one of
+               ``operator.add``, ``min`` or ``max``.
+
+        Returns:
+               The combined value, which is the same for every work-item of
+               the sub-group.
+        """
+
+    def inclusive_scan():
+        """
+        inclusive_scan(x, op)
+
+        Computes the inclusive prefix scan of the values of x of the
+        work-items of a sub-group in the order of their sub-group local ids.
+
+        Parameters:
+           x: The value of the work-item.
+
+           op: The operation used to combine the values, one of
+               ``operator.add``, ``min`` or ``max``.
+
+        Returns:
+               The combination of the values of the work-items with a
+               sub-group local id lower than or equal to the one of the
+               work-item.
+        """
+
+    def exclusive_scan():
+        """
+        exclusive_scan(x, op)
+
+        Computes the exclusive prefix scan of the values of x of the
+        work-items of a sub-group in the order of their sub-group local ids.
+
+        Parameters:
+           x: The value of the work-item.
+
+           op: The operation used to combine the values, one of
+               ``operator.add``, ``min`` or ``max``.
+
+        Returns:
+               The combination of the values of the work-items with a
+               sub-group local id lower than the one of the work-item. The
+               first work-item gets the identity of the operation.
+        """
+
+    def broadcast():
+        """
+        broadcast(x, src)
+
+        Broadcasts the value of x of one work-item to all the work-items of
+        a sub-group.
+
+        Parameters:
+           x: The value of the work-item.
+
+           src (int): The sub-group local id of the work-item whose value is
+                      broadcast. It has to be the same for all the
+                      work-items of the sub-group.
+
+        Returns:
+               The value of x of the work-item with the sub-group local id
+               src.
+        """
@@ -9,6 +9,12 @@ class ExtendedParforDiagnostics(ParforDiagnostics):
     def __init__(self):
         ParforDiagnostics.__init__(self)
         self.extra_info = {}
+        # Tuples of (parfor id, array name, original usm_type) for every
+        # temporary array that was promoted to device USM.
+        self.device_resident_arrays = []
+        # Tuples of (dead array name, array name) for every allocation that
+        # was replaced by the buffer of a dead temporary array.
+        self.reused_buffers = []
 
     def dump(self, level=1):
         if level == 0:
@@ -24,6 +30,30 @@ class ExtendedParforDiagnostics(ParforDiagnostics):
                 print_wrapped("Device - '%s'" % self.extra_info["kernel"])
             print(_termwidth * "-")
 
+        if self.device_resident_arrays:
+            print(" Device residency ".center(_termwidth, "-"))
+            self.print_device_resident_arrays()
+            print(_termwidth * "-")
+
+        if self.reused_buffers:
+            print(" Buffer reuse ".center(_termwidth, "-"))
+            self.print_reused_buffers()
+            print(_termwidth * "-")
+
+    def print_device_resident_arrays(self):
+        for parfor_id, arr, usm_type in self.device_resident_arrays:
+            print_wrapped(
+                "Array '%s' computed by loop #%s kept in device USM memory "
+                "instead of '%s' USM memory." % (arr, parfor_id, usm_type)
+            )
+
+    def print_reused_buffers(self):
+        for dead_arr, arr in self.reused_buffers:
+            print_wrapped(
+                "Array '%s' reuses the buffer of the dead array '%s'."
+                % (arr, dead_arr)
+            )
+
     def print_auto_offloading(self, lines):
         # Code partially borrowed from https://github.com/IntelPython/numba/blob/97fe221b3704bd17567b57ea47f4fc6604476cf9/numba/parfors/parfor.py#L982
         sword = "+--"
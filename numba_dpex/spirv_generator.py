@@ -94,8 +94,29 @@ class CmdLine:
         return result
 
 
+def consume_llvm_spirv_args(context):
+    """Returns the extra llvm-spirv arguments set on a target context.
+
+    The extra compile options of the context only apply to the next kernel
+    that gets translated to SPIR-V and are cleared.
+
+    Args:
+        context: Numba target context.
+
+    Returns:
+        list: The extra arguments to be passed to the llvm-spirv tool.
+    """
+    llvm_spirv_args = []
+    for key in list(context.extra_compile_options.keys()):
+        if key == LLVM_SPIRV_ARGS:
+            llvm_spirv_args = context.extra_compile_options[key]
+        del context.extra_compile_options[key]
+
+    return llvm_spirv_args
+
+
 class Module(object):
-    def __init__(self, context, llvmir, llvmbc):
+    def __init__(self, context, llvmir, llvmbc, llvm_spirv_args=None):
         """
         Setup
         """
@@ -107,6 +128,7 @@ class Module(object):
 
         self._llvmir = llvmir
         self._llvmbc = llvmbc
+        self._llvm_spirv_args = llvm_spirv_args
 
     def __del__(self):
         # Remove all temporary files
@@ -142,11 +164,9 @@ class Module(object):
         # Generate SPIR-V from "friendly" LLVM-based SPIR 2.0
         spirv_path = self._track_temp_file("generated-spirv")
 
-        llvm_spirv_args = []
-        for key in list(self.context.extra_compile_options.keys()):
-            if key == LLVM_SPIRV_ARGS:
-                llvm_spirv_args = self.context.extra_compile_options[key]
-            del self.context.extra_compile_options[key]
+        llvm_spirv_args = self._llvm_spirv_args
+        if llvm_spirv_args is None:
+            llvm_spirv_args = consume_llvm_spirv_args(self.context)
 
         if config.SAVE_IR_FILES != 0:
             # Dump the llvmir and llvmbc in file
@@ -209,7 +229,7 @@ class Module(object):
         return spirv
 
 
-def llvm_to_spirv(context, llvmir, llvmbc):
+def llvm_to_spirv(context, llvmir, llvmbc, llvm_spirv_args=None):
     """
     Generate SPIR-V from LLVM Bitcode.
 
@@ -217,10 +237,13 @@ def llvm_to_spirv(context, llvmir, llvmbc):
         context: Numba target context.
         llvmir: LLVM IR.
         llvmbc: LLVM Bitcode.
+        llvm_spirv_args: Extra arguments for the llvm-spirv tool. If None,
+            the arguments are taken from the extra compile options of the
+            context.
 
     Returns:
         spirv: SPIR-V binary.
     """
-    mod = Module(context, llvmir, llvmbc)
+    mod = Module(context, llvmir, llvmbc, llvm_spirv_args)
     mod.load_llvm()
     return mod.finalize()
@@ -51,7 +51,22 @@ def test_llvm_symbol_registered():
         == runtime._dpexrt_python.DPEXRT_MemInfo_alloc
     )
 
+    assert (
+        llb.address_of_symbol("DPEXRT_MemInfo_alloc_scratch")
+        == runtime._dpexrt_python.DPEXRT_MemInfo_alloc_scratch
+    )
+
     assert (
         llb.address_of_symbol("DPEXRT_MemInfo_fill")
         == runtime._dpexrt_python.DPEXRT_MemInfo_fill
     )
+
+    assert (
+        llb.address_of_symbol("DPEXRT_MemInfo_wait_pending_event")
+        == runtime._dpexrt_python.DPEXRT_MemInfo_wait_pending_event
+    )
+
+    assert (
+        llb.address_of_symbol("DPEXRT_MemInfo_append_pending_event")
+        == runtime._dpexrt_python.DPEXRT_MemInfo_append_pending_event
+    )
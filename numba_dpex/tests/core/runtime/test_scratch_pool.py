@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the scratch pool that DPEXRT_MemInfo_alloc_scratch draws its
+allocations from.
+"""
+
+import ctypes
+import subprocess
+import sys
+
+import dpctl
+import pytest
+from numba.core.registry import cpu_target
+from numba.core.runtime import nrt, rtsys
+
+from numba_dpex.core.runtime import _dpexrt_python
+
+# The usm_type codes understood by NRT_ExternalAllocator_new_for_usm
+USM_DEVICE = 1
+USM_SHARED = 2
+USM_HOST = 3
+
+# A size class that is not used by any other test, so that no allocation
+# released elsewhere can be drawn from the pool.
+SIZE = 3 * 1024 * 1024
+
+_create_queue = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_char_p)(
+    _dpexrt_python.c_helpers["DPEXRTQueue_CreateFromFilterString"]
+)
+_alloc_scratch = ctypes.CFUNCTYPE(
+    ctypes.c_void_p, ctypes.c_int64, ctypes.c_size_t, ctypes.c_void_p
+)(_dpexrt_python.c_helpers["DPEXRT_MemInfo_alloc_scratch"])
+
+
+def _get_filter_strings():
+    filter_strings = []
+    for device in dpctl.get_devices():
+        if device.filter_string not in filter_strings:
+            filter_strings.append(device.filter_string)
+    return filter_strings
+
+
+def _alloc(usm_type, filter_string):
+    """Allocates from the scratch pool and returns the allocation as a MemInfo
+    object. The queue created for the allocation is owned by the MemInfo.
+    """
+    qref = _create_queue(filter_string.encode())
+    assert qref
+    mi = _alloc_scratch(SIZE, usm_type, qref)
+    assert mi
+    return nrt.MemInfo(mi)
+
+
+@pytest.fixture(autouse=True)
+def init_nrt():
+    rtsys.initialize(cpu_target.target_context)
+
+
+@pytest.mark.parametrize("usm_type", [USM_DEVICE, USM_SHARED, USM_HOST])
+def test_released_allocation_is_reused(usm_type):
+    filter_string = dpctl.SyclDevice().filter_string
+
+    mi = _alloc(usm_type, filter_string)
+    data = mi.data
+    # Returns the allocation to the pool
+    del mi
+
+    mi = _alloc(usm_type, filter_string)
+    assert mi.data == data
+    del mi
+
+
+def test_released_allocation_of_other_usm_type_is_not_reused():
+    filter_string = dpctl.SyclDevice().filter_string
+
+    mi = _alloc(USM_SHARED, filter_string)
+    data = mi.data
+    del mi
+
+    other_mis = [
+        _alloc(usm_type, filter_string) for usm_type in (USM_DEVICE, USM_HOST)
+    ]
+    assert all(other_mi.data != data for other_mi in other_mis)
+
+    # The shared allocation is still in the pool
+    mi = _alloc(USM_SHARED, filter_string)
+    assert mi.data == data
+    del mi, other_mis
+
+
+def test_released_allocation_of_other_queue_is_not_reused():
+    filter_strings = _get_filter_strings()
+    if len(filter_strings) < 2:
+        pytest.skip("Needs at least two SYCL devices")
+
+    mi = _alloc(USM_SHARED, filter_strings[0])
+    data = mi.data
+    del mi
+
+    other_mi = _alloc(USM_SHARED, filter_strings[1])
+    assert other_mi.data != data
+
+    mi = _alloc(USM_SHARED, filter_strings[0])
+    assert mi.data == data
+    del mi, other_mi
+
+
+def test_scratch_pool_is_freed_at_exit():
+    """Tests that the interpreter exits cleanly when the scratch pool still
+    holds allocations, i.e., that the pool is freed while dpctl is alive.
+    """
+    code = (
+        "from numba.core.registry import cpu_target\n"
+        "from numba.core.runtime import rtsys\n"
+        "from numba_dpex.tests.core.runtime import test_scratch_pool as t\n"
+        "rtsys.initialize(cpu_target.target_context)\n"
+        "mi = t._alloc(t.USM_SHARED, t.dpctl.SyclDevice().filter_string)\n"
+        "del mi\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
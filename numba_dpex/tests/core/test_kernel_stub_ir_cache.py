@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the cache of the Numba IR of parfor kernel stubs."""
+
+from collections import OrderedDict
+
+from numba_dpex import config
+from numba_dpex.core.utils.kernel_templates import stub_ir_cache
+from numba_dpex.core.utils.kernel_templates.range_kernel_template import (
+    RangeKernelTemplate,
+)
+
+
+def _make_range_kernel(suffix):
+    return RangeKernelTemplate(
+        kernel_name=f"__numba_parfor_gufunc_{suffix}",
+        kernel_params=[f"a_{suffix}", f"b_{suffix}"],
+        kernel_rank=1,
+        ivar_names=[f"i_{suffix}"],
+        sentinel_name=f"__sentinel_{suffix}",
+        loop_ranges=[(0, f"n_{suffix}", 1)],
+        param_dict={f"n_{suffix}": f"b_{suffix}"},
+    )
+
+
+def test_stub_ir_is_shared_by_kernels_with_same_structure(monkeypatch):
+    # Start from an empty cache so that the first kernel compiles its stub
+    monkeypatch.setattr(stub_ir_cache, "_stub_ir_cache", OrderedDict())
+
+    num_compiles = 0
+    compile_stub = stub_ir_cache._compile_stub
+
+    def _compile_stub(kernel_txt, kernel_name):
+        nonlocal num_compiles
+        num_compiles += 1
+        return compile_stub(kernel_txt, kernel_name)
+
+    monkeypatch.setattr(stub_ir_cache, "_compile_stub", _compile_stub)
+
+    kernel1 = _make_range_kernel("x")
+    kernel2 = _make_range_kernel("y")
+
+    assert num_compiles == 1
+    assert len(stub_ir_cache._stub_ir_cache) == 1
+    assert kernel1.kernel_ir is not kernel2.kernel_ir
+    assert kernel1.kernel_ir.arg_names == ("a_x", "b_x")
+    assert kernel2.kernel_ir.arg_names == ("a_y", "b_y")
+
+
+def test_stub_ir_clone_is_renamed():
+    kernel = _make_range_kernel("z")
+    var_names = {
+        var.name
+        for block in kernel.kernel_ir.blocks.values()
+        for stmt in block.body
+        for var in stmt.list_vars()
+    }
+
+    assert not any(name.startswith("__dpex_stub_") for name in var_names)
+    assert "i_z" in var_names
+
+
+def test_stub_ir_clone_has_kernel_identity():
+    kernel1 = _make_range_kernel("u")
+    kernel2 = _make_range_kernel("v")
+
+    func_id1 = kernel1.kernel_ir.func_id
+    func_id2 = kernel2.kernel_ir.func_id
+    assert func_id1.func_qualname == "__numba_parfor_gufunc_u"
+    assert func_id2.func_qualname == "__numba_parfor_gufunc_v"
+    assert func_id1.unique_name != func_id2.unique_name
+    assert func_id1.arg_names == ["a_u", "b_u"]
+    assert list(func_id1.pysig.parameters) == ["a_u", "b_u"]
+
+    kernel_ir = kernel1.kernel_ir
+    scope = kernel_ir.blocks[min(kernel_ir.blocks)].scope
+    assert "i_u" in scope.localvars
+    assert not any(
+        name.startswith("__dpex_stub_") for name in scope.localvars._con
+    )
+
+
+def test_stub_ir_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(config, "CACHE_SIZE", 1)
+
+    _make_range_kernel("w")
+    kernel = RangeKernelTemplate(
+        kernel_name="__numba_parfor_gufunc_2d",
+        kernel_params=["a_2d", "b_2d"],
+        kernel_rank=2,
+        ivar_names=["i_2d", "j_2d"],
+        sentinel_name="__sentinel_2d",
+        loop_ranges=[(0, "n_2d", 1), (0, "m_2d", 1)],
+        param_dict={"n_2d": "b_2d", "m_2d": "b_2d"},
+    )
+
+    assert len(stub_ir_cache._stub_ir_cache) == 1
+    assert kernel.kernel_ir.arg_names == ("a_2d", "b_2d")
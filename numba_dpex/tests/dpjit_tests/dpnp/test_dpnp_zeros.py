@@ -6,6 +6,7 @@
 
 import dpctl
 import dpnp
+import numba as nb
 import pytest
 from numba import errors
 
@@ -121,6 +122,59 @@ def test_dpnp_zeros_from_queue(shape, dtype, usm_type):
         )
 
 
+@pytest.mark.parametrize("usm_type", usm_types)
+def test_dpnp_zeros_consumed_by_kernel(usm_type):
+    """Test that a kernel consuming a dpnp.zeros array sees the filled values
+    as the fill is asynchronous.
+    """
+
+    @dpjit
+    def func(a):
+        c = dpnp.zeros(a.shape, dtype=a.dtype, usm_type=usm_type)
+        for i in nb.prange(a.shape[0]):
+            c[i] += a[i]
+        return c
+
+    a = dpnp.arange(1024, dtype=dpnp.float32, usm_type=usm_type)
+    c = func(a)
+
+    assert (c.asnumpy() == a.asnumpy()).all()
+
+
+def test_dpnp_zeros_host_access():
+    """Test that a host side access of a dpnp.zeros array waits on the
+    asynchronous fill.
+    """
+
+    @dpjit
+    def func(n):
+        c = dpnp.zeros(n, dtype=dpnp.int64, usm_type="shared")
+        c[1] = 2
+        return c[0] + c[1]
+
+    assert func(1024) == 2
+
+
+def test_dpnp_zeros_host_loop_waits_once():
+    """Test that a host side loop over a dpnp.zeros array waits on the
+    asynchronous fill once, before the loop, and not on every element.
+    """
+
+    @dpjit
+    def func(n):
+        c = dpnp.zeros(n, dtype=dpnp.int64, usm_type="shared")
+        s = 0
+        for i in range(n):
+            c[i] = i
+            s += c[i]
+        return s
+
+    assert func(1024) == 1023 * 1024 // 2
+
+    llvm_ir = func.inspect_llvm(func.signatures[0])
+    assert llvm_ir.count("call void @DPEXRT_MemInfo_wait_pending_event") == 1
+
+
 def test_dpnp_zeros_exceptions():
     """Test if exception is raised when both queue and device are specified."""
     device = dpctl.SyclDevice().filter_string
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy
+
+from numba_dpex import dpjit, prange
+
+
+@dpjit
+def stencil_pipeline(a, b):
+    c = a + b
+    d = dpnp.zeros_like(a)
+    for i in prange(1, a.shape[0] - 1):
+        d[i] = c[i - 1] + c[i + 1]
+    e = d * b
+    f = e + a
+    return f
+
+
+@dpjit
+def stencil_pipeline_reads_temporary(a, b):
+    c = a + b
+    d = dpnp.zeros_like(a)
+    for i in prange(1, a.shape[0] - 1):
+        d[i] = c[i - 1] + c[i + 1]
+    e = d * b
+    f = e + c
+    return f
+
+
+def _get_reused_buffers(dispatcher, *args):
+    """Returns the names of the dead arrays whose buffers were reused when the
+    dispatcher was compiled for the arguments.
+    """
+    argtypes = tuple(dispatcher.typeof_pyval(arg) for arg in args)
+    diagnostics = dispatcher.overloads[argtypes].metadata["parfor_diagnostics"]
+    return [
+        dead_arr.split(".")[0] for dead_arr, _ in diagnostics.reused_buffers
+    ]
+
+
+def _expected(na, nb, reads_temporary):
+    nc = na + nb
+    nd = numpy.zeros_like(na)
+    nd[1:-1] = nc[:-2] + nc[2:]
+    return nd * nb + (nc if reads_temporary else na)
+
+
+def test_parfor_buffer_reuse():
+    """Tests a chain of parfors that cannot all be fused, so that the output
+    of a later parfor reuses the buffer of a dead temporary array.
+    """
+    a = dpnp.arange(100, dtype=dpnp.float32)
+    b = dpnp.full(100, 2, dtype=dpnp.float32)
+
+    result = stencil_pipeline(a, b)
+
+    # The temporary c is dead once the prange loop consumed it.
+    assert "c" in _get_reused_buffers(stencil_pipeline, a, b)
+
+    expected = _expected(dpnp.asnumpy(a), dpnp.asnumpy(b), False)
+    assert numpy.allclose(dpnp.asnumpy(result), expected)
+    # The input arrays must not be overwritten by a reused buffer.
+    assert numpy.allclose(dpnp.asnumpy(a), numpy.arange(100))
+    assert numpy.allclose(dpnp.asnumpy(b), 2)
+
+
+def test_parfor_buffer_reuse_live_temporary():
+    """Tests that the buffer of a temporary array that is still read by a
+    later parfor is not reused.
+    """
+    a = dpnp.arange(100, dtype=dpnp.float32)
+    b = dpnp.full(100, 2, dtype=dpnp.float32)
+
+    result = stencil_pipeline_reads_temporary(a, b)
+
+    assert "c" not in _get_reused_buffers(
+        stencil_pipeline_reads_temporary, a, b
+    )
+
+    expected = _expected(dpnp.asnumpy(a), dpnp.asnumpy(b), True)
+    assert numpy.allclose(dpnp.asnumpy(result), expected)
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy
+import pytest
+
+from numba_dpex import dpjit, prange
+
+
+@dpjit
+def stencil_pipeline(a, b):
+    c = a + b
+    d = dpnp.zeros_like(a)
+    for i in prange(1, a.shape[0] - 1):
+        d[i] = c[i - 1] + c[i + 1]
+    return d
+
+
+@dpjit
+def scale_sum(a, b):
+    c = a + b
+    e = c * 2
+    return e
+
+
+def _get_device_resident_arrays(dispatcher, *args):
+    argtypes = tuple(dispatcher.typeof_pyval(arg) for arg in args)
+    cres = dispatcher.overloads[argtypes]
+    return cres.metadata["parfor_diagnostics"].device_resident_arrays
+
+
+@pytest.mark.parametrize("usm_type", ["host", "shared", "device"])
+def test_parfor_device_resident_temporary(usm_type):
+    """Tests that a temporary array that never escapes the function does not
+    change the usm_type of the arrays that are returned from it.
+
+    Args:
+        usm_type (str): The usm_type of the input arrays.
+    """
+    a = dpnp.arange(100, dtype=dpnp.float32, usm_type=usm_type)
+    b = dpnp.full(100, 2, dtype=dpnp.float32, usm_type=usm_type)
+
+    result = stencil_pipeline(a, b)
+
+    nc = numpy.arange(100, dtype=numpy.float32) + 2
+    expected = numpy.zeros(100, dtype=numpy.float32)
+    expected[1:-1] = nc[:-2] + nc[2:]
+
+    assert result.usm_type == usm_type
+    assert numpy.allclose(dpnp.asnumpy(result), expected)
+
+    # The temporary c is promoted to device USM unless it already is.
+    promoted = _get_device_resident_arrays(stencil_pipeline, a, b)
+    if usm_type == "device":
+        assert not promoted
+    else:
+        assert promoted
+        assert all(ty == usm_type for _, _, ty in promoted)
+
+
+@pytest.mark.parametrize("usm_type", ["host", "shared", "device"])
+def test_parfor_device_resident_temporary_chain(usm_type):
+    """Tests that an array computed from a promoted temporary keeps the
+    usm_type of the inputs.
+
+    Args:
+        usm_type (str): The usm_type of the input arrays.
+    """
+    a = dpnp.arange(100, dtype=dpnp.float32, usm_type=usm_type)
+    b = dpnp.ones(100, dtype=dpnp.float32, usm_type=usm_type)
+
+    result = scale_sum(a, b)
+
+    assert result.usm_type == usm_type
+    assert numpy.allclose(
+        dpnp.asnumpy(result), (numpy.arange(100, dtype=numpy.float32) + 1) * 2
+    )
+    if usm_type != "device":
+        assert _get_device_resident_arrays(scale_sum, a, b)
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy
+import pytest
+
+from numba_dpex import dpjit, prange
+
+
+def chained_array_exprs(a, b):
+    c = a + b
+    d = c * b
+    e = d - a
+    return e
+
+
+def consecutive_pranges(a, b):
+    c = dpnp.empty_like(a)
+    for i in prange(a.shape[0]):
+        c[i] = a[i] + b[i]
+    d = dpnp.empty_like(a)
+    for i in prange(a.shape[0]):
+        d[i] = c[i] * 2
+    return d
+
+
+def _get_fused_parfors(dispatcher, *args):
+    """Returns the ids of the parfors that were fused into another parfor
+    when the dispatcher was compiled for the arguments.
+    """
+    argtypes = tuple(dispatcher.typeof_pyval(arg) for arg in args)
+    diagnostics = dispatcher.overloads[argtypes].metadata["parfor_diagnostics"]
+    return [i for fused in diagnostics.fusion_info.values() for i in fused]
+
+
+@pytest.mark.parametrize(
+    "func, expected_func",
+    [
+        (chained_array_exprs, lambda a, b: (a + b) * b - a),
+        (consecutive_pranges, lambda a, b: (a + b) * 2),
+    ],
+)
+def test_parfor_fusion(func, expected_func):
+    """Tests that consecutive parfors over the same iteration space are fused
+    into a single kernel.
+
+    Args:
+        func: The function with the consecutive parfors.
+        expected_func: A NumPy function computing the expected result.
+    """
+    a = dpnp.arange(100, dtype=dpnp.float32)
+    b = dpnp.ones(100, dtype=dpnp.float32)
+
+    dispatcher = dpjit(func)
+    result = dispatcher(a, b)
+
+    # All the parfors of the function are fused into the first one.
+    num_parfors = 3 if func is chained_array_exprs else 2
+    assert len(_get_fused_parfors(dispatcher, a, b)) == num_parfors - 1
+
+    expected = expected_func(dpnp.asnumpy(a), dpnp.asnumpy(b))
+    assert numpy.allclose(dpnp.asnumpy(result), expected)
+
+
+def test_parfor_fusion_different_iteration_spaces():
+    """Tests that parfors with different iteration spaces are not fused."""
+
+    @dpjit
+    def func(a, b):
+        c = a + a
+        d = b + b
+        return c, d
+
+    a = dpnp.ones(100, dtype=dpnp.float32)
+    b = dpnp.ones(50, dtype=dpnp.float32)
+
+    c, d = func(a, b)
+
+    assert not _get_fused_parfors(func, a, b)
+    assert numpy.all(dpnp.asnumpy(c) == 2)
+    assert numpy.all(dpnp.asnumpy(d) == 2)
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import ctypes
+
+import dpnp
+import numpy
+import pytest
+from numba.parfors import parfor_lowering
+
+from numba_dpex import config, dpjit, prange
+from numba_dpex.core.parfors import parfor_lowerer
+from numba_dpex.tests._helper import skip_windows
+
+HOST_MSG = "DPEX-DEBUG: Execute parfor on the host."
+DEVICE_MSG = "DPEX-DEBUG: Offload parfor to the device."
+
+
+def scale_and_sum(a, b):
+    c = dpnp.empty_like(a)
+    s = 0
+    for i in prange(a.shape[0]):
+        c[i] = a[i] * 2 + b[i]
+        s += a[i]
+    return c, s
+
+
+@skip_windows
+@pytest.mark.parametrize("usm_type", ["shared", "host", "device"])
+@pytest.mark.parametrize("size", [10, 1000])
+def test_parfor_host_offload(monkeypatch, capfd, usm_type, size):
+    """Tests that a parfor is executed on the host if its trip count is below
+    the threshold and its arrays are host-accessible, and offloaded otherwise,
+    and that both produce the same result.
+
+    Args:
+        usm_type (str): The usm_type of the arrays.
+        size (int): The trip count of the parfor.
+    """
+    monkeypatch.setattr(config, "PARFOR_HOST_THRESHOLD", 100)
+    monkeypatch.setattr(config, "DEBUG_KERNEL_LAUNCHER", 1)
+
+    a = dpnp.arange(size, dtype=dpnp.float32, usm_type=usm_type)
+    b = dpnp.ones(size, dtype=dpnp.float32, usm_type=usm_type)
+
+    c, s = dpjit(scale_and_sum)(a, b)
+
+    # The debug messages are printed with the C printf from the compiled code
+    ctypes.CDLL(None).fflush(None)
+    out = capfd.readouterr().out
+    if size < config.PARFOR_HOST_THRESHOLD and usm_type != "device":
+        assert HOST_MSG in out
+        assert DEVICE_MSG not in out
+    else:
+        assert DEVICE_MSG in out
+        assert HOST_MSG not in out
+
+    a_np = dpnp.asnumpy(a)
+    assert numpy.allclose(dpnp.asnumpy(c), a_np * 2 + 1)
+    assert numpy.isclose(s, a_np.sum())
+
+
+def test_parfor_host_offload_numba_internals(monkeypatch):
+    """Tests that the private parts of Numba used to execute a parfor on the
+    host exist in the installed Numba version. Without them the host execution
+    threshold is silently ignored, so the test fails loudly instead.
+    """
+    monkeypatch.setattr(config, "PARFOR_HOST_THRESHOLD", 100)
+
+    assert hasattr(
+        parfor_lowering, parfor_lowerer._HOST_LOWERING_FUNCTION
+    ), "numba.parfors.parfor_lowering has no _lower_parfor_parallel_std"
+
+    lowerers = []
+    is_supported = parfor_lowerer._is_host_lowering_supported
+
+    def _is_host_lowering_supported(lowerer):
+        lowerers.append(lowerer)
+        return is_supported(lowerer)
+
+    monkeypatch.setattr(
+        parfor_lowerer,
+        "_is_host_lowering_supported",
+        _is_host_lowering_supported,
+    )
+
+    a = dpnp.arange(10, dtype=dpnp.float32, usm_type="shared")
+    b = dpnp.ones(10, dtype=dpnp.float32, usm_type="shared")
+    dpjit(scale_and_sum)(a, b)
+
+    assert lowerers
+    for lowerer in lowerers:
+        for attr in parfor_lowerer._HOST_LOWERING_LOWERER_ATTRS:
+            assert hasattr(lowerer, attr), f"numba's Lower has no {attr}"
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+
+import dpnp
+import numpy
+import pytest
+
+from numba_dpex import config, dpjit, prange
+from numba_dpex.core.parfors import kernel_builder
+
+
+def many_parfors(a, b):
+    c = dpnp.empty_like(a)
+    for i in prange(1, a.shape[0]):
+        c[i] = a[i - 1] + b[i]
+    d = dpnp.empty_like(a)
+    for i in prange(2, a.shape[0]):
+        d[i] = c[i - 1] * b[i]
+    s = 0
+    for i in prange(2, a.shape[0]):
+        s += d[i]
+    return s
+
+
+@pytest.mark.parametrize("num_threads", [0, 1, 4])
+def test_parfor_kernel_build_threads(monkeypatch, num_threads):
+    """Tests that the kernels of a function with several parfors are built
+    correctly both synchronously and on worker threads.
+
+    Args:
+        num_threads (int): The number of kernel build threads.
+    """
+    monkeypatch.setattr(config, "NUM_KERNEL_BUILD_THREADS", num_threads)
+
+    build_threads = []
+    build_sycl_kernel = kernel_builder._build_sycl_kernel
+
+    def _build_sycl_kernel(*args):
+        build_threads.append(threading.current_thread().name)
+        return build_sycl_kernel(*args)
+
+    monkeypatch.setattr(
+        kernel_builder, "_build_sycl_kernel", _build_sycl_kernel
+    )
+
+    a = dpnp.arange(10, dtype=dpnp.int64)
+    b = dpnp.ones(10, dtype=dpnp.int64)
+
+    # d[i] = c[i - 1] = a[i - 2] + 1 for i in [2, 10)
+    expected = (numpy.arange(8, dtype=numpy.int64) + 1).sum()
+
+    assert dpjit(many_parfors)(a, b) == expected
+
+    assert build_threads
+    on_build_thread = [
+        name.startswith("dpex_kernel_build") for name in build_threads
+    ]
+    if num_threads == 0:
+        assert not any(on_build_thread)
+    else:
+        assert all(on_build_thread)
+        pool = kernel_builder._get_kernel_build_pool()
+        assert pool._max_workers == num_threads
@@ -40,6 +40,30 @@ def vecmul_prange(a, b):
     return t
 
 
+@dpex.dpjit
+def vecmax_prange(a, b):
+    t = a[0] + b[0]
+    for i in nb.prange(a.shape[0]):
+        t = max(t, a[i] + b[i])
+    return t
+
+
+@dpex.dpjit
+def vecmin_prange(a, b):
+    t = a[0] + b[0]
+    for i in nb.prange(a.shape[0]):
+        t = min(t, a[i] + b[i])
+    return t
+
+
+@dpex.dpjit
+def vecsub_prange(a, b):
+    t = a.dtype.type(0)
+    for i in nb.prange(a.shape[0]):
+        t -= a[i] + b[i]
+    return t
+
+
 @dpex.dpjit
 def vecadd_prange_float(a, b):
     s = numpy.float32(0)
@@ -105,3 +129,169 @@ def test_dpjit_array_arg_types_mul(input_arrays):
     c = vecmul_prange(a, b)
 
     assert s == c
+
+
+@pytest.mark.parametrize("size", [1, 7, 255, 1000, 100003])
+def test_dpjit_reduction_sizes(size):
+    """Tests a prange reduction for sizes that are smaller than, not a
+    multiple of, and much larger than the work-group size of the reduction
+    kernels.
+
+    Args:
+        size (int): The number of elements to be reduced.
+    """
+    a = dpnp.ones(size, dtype=dpnp.int64)
+    b = dpnp.zeros(size, dtype=dpnp.int64)
+
+    c = vecadd_prange2(a, a)
+    d = vecadd_prange2(a, b)
+
+    assert c == size
+    assert d == 0
+
+
+def test_dpjit_array_arg_types_max(input_arrays):
+    """Tests a max reduction over float and int type dpnp arrays inside a
+    dpjit prange function.
+
+    Args:
+        input_arrays (dpnp.ndarray): Array arguments to be passed to a kernel.
+    """
+    a, b = input_arrays
+    c = vecmax_prange(a, b)
+
+    assert c == N
+
+
+def test_dpjit_array_arg_types_min(input_arrays):
+    """Tests a min reduction over float and int type dpnp arrays inside a
+    dpjit prange function.
+
+    Args:
+        input_arrays (dpnp.ndarray): Array arguments to be passed to a kernel.
+    """
+    a, b = input_arrays
+    c = vecmin_prange(a, b)
+
+    assert c == 1
+
+
+def test_dpjit_array_arg_types_sub(input_arrays):
+    """Tests a subtraction reduction over float and int type dpnp arrays
+    inside a dpjit prange function.
+
+    Args:
+        input_arrays (dpnp.ndarray): Array arguments to be passed to a kernel.
+    """
+    a, b = input_arrays
+    c = vecsub_prange(a, b)
+
+    assert c == -55
+
+
+@dpex.dpjit
+def sum_prange_2d(a):
+    s = a.dtype.type(0)
+    for i in nb.prange(a.shape[0]):
+        for j in nb.prange(a.shape[1]):
+            s += a[i, j]
+    return s
+
+
+@dpex.dpjit
+def max_prange_2d(a):
+    m = a[0, 0]
+    for i in nb.prange(a.shape[0]):
+        for j in nb.prange(a.shape[1]):
+            m = max(m, a[i, j])
+    return m
+
+
+@pytest.mark.parametrize("shape", [(3, 5), (17, 1), (100, 300)])
+def test_dpjit_reduction_nested_prange(shape):
+    """Tests a reduction over a nested prange loop that is reduced over its
+    linearized iteration space.
+
+    Args:
+        shape (tuple): The shape of the array to be reduced.
+    """
+    a = dpnp.arange(shape[0] * shape[1], dtype=dpnp.int64).reshape(shape)
+    expected = numpy.arange(shape[0] * shape[1], dtype=numpy.int64)
+
+    assert sum_prange_2d(a) == expected.sum()
+    assert max_prange_2d(a) == expected.max()
+
+
+@dpex.dpjit
+def multi_reduction_prange(a):
+    s = a.dtype.type(5)
+    p = a.dtype.type(2)
+    m = a.dtype.type(100)
+    t = a.dtype.type(-1)
+    for i in nb.prange(a.shape[0]):
+        s += a[i]
+        p *= a[i]
+        m = max(m, a[i])
+        t = min(t, a[i])
+    return s, p, m, t
+
+
+def test_dpjit_reduction_initial_values():
+    """Tests that the results of several reductions in the same prange loop
+    are combined with the values of the reduction variables before the loop.
+    """
+    a = dpnp.arange(1, 6, dtype=dpnp.int64)
+
+    s, p, m, t = multi_reduction_prange(a)
+
+    assert s == 20
+    assert p == 240
+    assert m == 100
+    assert t == -1
+
+
+@dpex.dpjit
+def sum_prange_from(a, start):
+    s = 0
+    for i in nb.prange(start, a.shape[0]):
+        s += a[i]
+    return s
+
+
+@pytest.mark.parametrize("start", [0, 1, 100, 1000])
+def test_dpjit_reduction_non_zero_start(start):
+    """Tests a reduction over a prange loop that does not start at zero.
+
+    Args:
+        start (int): The start of the prange loop.
+    """
+    a = dpnp.arange(1000, dtype=dpnp.int64)
+
+    assert sum_prange_from(a, start) == numpy.arange(start, 1000).sum()
+
+
+@dpex.dpjit
+def sum_prange_2d_from(a, start0, start1):
+    s = 0
+    for i in nb.prange(start0, a.shape[0]):
+        for j in nb.prange(start1, a.shape[1]):
+            s += a[i, j]
+    return s
+
+
+@pytest.mark.parametrize("starts", [(0, 0), (2, 3), (12, 0), (12, 9)])
+def test_dpjit_reduction_nested_prange_empty(starts):
+    """Tests a reduction over a nested prange loop where some of the loop
+    nests are empty. Two empty loop nests must not result in a positive number
+    of iterations.
+
+    Args:
+        starts (tuple): The starts of the two prange loops.
+    """
+    a = dpnp.arange(40, dtype=dpnp.int64).reshape((10, 4))
+    expected = numpy.arange(40, dtype=numpy.int64).reshape((10, 4))
+
+    assert (
+        sum_prange_2d_from(a, *starts)
+        == expected[starts[0] :, starts[1] :].sum()
+    )
@@ -4,9 +4,16 @@
 
 import dpnp as np
 import pytest
+from numba.core.errors import TypingError
 
 import numba_dpex as dpex
 from numba_dpex.core.descriptor import dpex_kernel_target
+from numba_dpex.ocl.atomics.atomic_helper import (
+    get_compare_exchange_failure_memory_order,
+    get_memory_semantics_mask,
+    supported_sycl_memory_orders,
+    sycl_memory_order,
+)
 from numba_dpex.tests._helper import get_all_dtypes
 
 global_size = 100
@@ -184,3 +191,173 @@ def test_atomic_fp_native(
 
     # TODO: this may fail if code is generated for platform that emulates atomic support?
     assert expected_spirv_function in kernel._llvm_module
+
+
+@pytest.mark.parametrize(
+    "op_type, expected",
+    [("min", 0), ("max", global_size - 1), ("exchange", None)],
+)
+def test_kernel_atomic_min_max_exchange(op_type, expected, return_dtype):
+    op = getattr(dpex.atomic, op_type)
+
+    @dpex.kernel
+    def f(a, old):
+        i = dpex.get_global_id(0)
+        old[i] = op(a, 0, i)
+
+    a = np.array([global_size // 2], dtype=return_dtype)
+    old = np.zeros(global_size, dtype=return_dtype)
+    f[dpex.Range(global_size)](a, old)
+
+    if expected is None:
+        # Every work-item got the value stored by another one exactly once
+        values = np.asnumpy(old).tolist() + [np.asnumpy(a)[0]]
+        assert sorted(values) == sorted(
+            list(range(global_size)) + [global_size // 2]
+        )
+    else:
+        assert a[0] == expected
+
+
+@pytest.mark.parametrize(
+    "op_type, expected",
+    [("and_", 0b0001), ("or_", 0b1111), ("xor", 0b1110)],
+)
+@pytest.mark.parametrize("dtype", [np.int32, np.int64])
+def test_kernel_atomic_bitwise(op_type, expected, dtype):
+    op = getattr(dpex.atomic, op_type)
+
+    @dpex.kernel
+    def f(a, vals):
+        i = dpex.get_global_id(0)
+        op(a, 0, vals[i])
+
+    a = np.array([0b0001], dtype=dtype)
+    vals = np.array([0b0011, 0b0101, 0b1001], dtype=dtype)
+    f[dpex.Range(3)](a, vals)
+
+    assert a[0] == expected
+
+
+def test_kernel_atomic_compare_exchange(return_dtype):
+    @dpex.kernel
+    def f(a, winner):
+        i = dpex.get_global_id(0)
+        if dpex.atomic.compare_exchange(a, 0, 0, 1) == 0:
+            winner[0] = i
+
+    a = np.zeros(1, dtype=return_dtype)
+    winner = np.array([-1], dtype=np.int64)
+    f[dpex.Range(global_size)](a, winner)
+
+    assert a[0] == 1
+    assert 0 <= winner[0] < global_size
+
+
+def test_kernel_atomic_memory_order_and_scope(return_dtype):
+    @dpex.kernel
+    def f(a, b):
+        dpex.atomic.add(
+            a, 0, 1, dpex.memory_order.acq_rel, dpex.memory_scope.device
+        )
+        dpex.atomic.add(b, 0, 1, memory_scope=dpex.memory_scope.system)
+
+    a = np.zeros(1, dtype=return_dtype)
+    b = np.zeros(1, dtype=return_dtype)
+    f[dpex.Range(global_size)](a, b)
+
+    assert a[0] == global_size
+    assert b[0] == global_size
+
+
+def test_kernel_atomic_consume_memory_order():
+    """Tests that the unsupported consume memory order is rejected when the
+    kernel is compiled on every Python version.
+    """
+
+    @dpex.kernel
+    def f(a):
+        dpex.atomic.add(a, 0, 1, 2)
+
+    a = np.zeros(1, dtype=np.int32)
+    with pytest.raises(TypingError):
+        f[dpex.Range(global_size)](a)
+
+
+def test_kernel_atomic_work_group_scope(return_dtype):
+    @dpex.kernel
+    def f(a):
+        lm = dpex.local.array(1, return_dtype)
+        if dpex.get_local_id(0) == 0:
+            lm[0] = 0
+        dpex.barrier(dpex.LOCAL_MEM_FENCE)
+        dpex.atomic.add(
+            lm,
+            0,
+            1,
+            memory_order=dpex.memory_order.relaxed,
+            memory_scope=dpex.memory_scope.work_group,
+        )
+        dpex.barrier(dpex.LOCAL_MEM_FENCE)
+        if dpex.get_local_id(0) == 0:
+            dpex.atomic.add(a, 0, lm[0])
+
+    a = np.zeros(1, dtype=return_dtype)
+    f[dpex.NdRange(dpex.Range(global_size), dpex.Range(global_size // 4))](a)
+
+    assert a[0] == global_size
+
+
+def test_kernel_atomic_local_histogram():
+    """Tests a histogram that is privatized per work-group in local memory
+    using the default work-group scope of atomics on local arrays.
+    """
+    num_bins = 16
+
+    @dpex.kernel
+    def f(data, hist):
+        i = dpex.get_global_id(0)
+        lid = dpex.get_local_id(0)
+        local_hist = dpex.local.array(num_bins, np.int32)
+        if lid < num_bins:
+            local_hist[lid] = 0
+        dpex.barrier(dpex.LOCAL_MEM_FENCE)
+        dpex.atomic.add(local_hist, data[i], 1)
+        dpex.barrier(dpex.LOCAL_MEM_FENCE)
+        if lid < num_bins:
+            dpex.atomic.add(hist, lid, local_hist[lid])
+
+    data = np.arange(256, dtype=np.int32) % num_bins
+    hist = np.zeros(num_bins, dtype=np.int32)
+    f[dpex.NdRange(dpex.Range(256), dpex.Range(64))](data, hist)
+
+    assert np.all(hist == 256 // num_bins)
+
+
+@pytest.mark.parametrize(
+    "memory_order, semantics, failure_memory_order",
+    [
+        (sycl_memory_order.relaxed, 0x0, sycl_memory_order.relaxed),
+        (sycl_memory_order.acquire, 0x2, sycl_memory_order.acquire),
+        (sycl_memory_order.release, 0x4, sycl_memory_order.relaxed),
+        (sycl_memory_order.acq_rel, 0x8, sycl_memory_order.acquire),
+        (sycl_memory_order.seq_cst, 0x10, sycl_memory_order.seq_cst),
+    ],
+)
+def test_memory_order_translation(
+    memory_order, semantics, failure_memory_order
+):
+    # Every mask covers the sub-group, work-group and cross work-group memory.
+    assert get_memory_semantics_mask(memory_order) == semantics | 0x380
+    assert (
+        get_compare_exchange_failure_memory_order(memory_order)
+        == failure_memory_order
+    )
+
+
+def test_memory_order_translation_covers_all_orders():
+    for memory_order in supported_sycl_memory_orders:
+        get_memory_semantics_mask(memory_order)
+        get_memory_semantics_mask(
+            get_compare_exchange_failure_memory_order(memory_order)
+        )
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import operator
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+
+N = 256
+WORK_GROUP_SIZE = 64
+
+list_of_dtypes = [dpnp.int32, dpnp.int64, dpnp.float32, dpnp.float64]
+list_of_ops = [
+    (operator.add, np.add),
+    (min, np.minimum),
+    (max, np.maximum),
+]
+
+
+@pytest.fixture(params=list_of_dtypes)
+def input_arrays(request):
+    a = dpnp.asarray((np.arange(N) * 7) % 13, dtype=request.param)
+    b = dpnp.zeros(N, dtype=request.param)
+    return a, b
+
+
+def _ndrange():
+    return dpex.NdRange(dpex.Range(N), dpex.Range(WORK_GROUP_SIZE))
+
+
+def _expected_per_group(a, np_op, scan):
+    groups = dpnp.asnumpy(a).reshape(-1, WORK_GROUP_SIZE)
+    if scan:
+        return np_op.accumulate(groups, axis=1).reshape(-1)
+    return np.repeat(np_op.reduce(groups, axis=1), WORK_GROUP_SIZE)
+
+
+@pytest.mark.parametrize("op, np_op", list_of_ops)
+def test_group_reduce(input_arrays, op, np_op):
+    @dpex.kernel
+    def group_reduce(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.group.reduce(a[i], op)
+
+    a, b = input_arrays
+    group_reduce[_ndrange()](a, b)
+
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b), _expected_per_group(a, np_op, scan=False)
+    )
+
+
+@pytest.mark.parametrize("op, np_op", list_of_ops)
+def test_group_inclusive_scan(input_arrays, op, np_op):
+    @dpex.kernel
+    def group_inclusive_scan(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.group.inclusive_scan(a[i], op)
+
+    a, b = input_arrays
+    group_inclusive_scan[_ndrange()](a, b)
+
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b), _expected_per_group(a, np_op, scan=True)
+    )
+
+
+def test_group_exclusive_scan(input_arrays):
+    @dpex.kernel
+    def group_exclusive_scan(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.group.exclusive_scan(a[i], operator.add)
+
+    a, b = input_arrays
+    group_exclusive_scan[_ndrange()](a, b)
+
+    inclusive = _expected_per_group(a, np.add, scan=True)
+    np.testing.assert_allclose(dpnp.asnumpy(b), inclusive - dpnp.asnumpy(a))
+
+
+def test_group_broadcast(input_arrays):
+    @dpex.kernel
+    def group_broadcast(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.group.broadcast(a[i], 3)
+
+    a, b = input_arrays
+    group_broadcast[_ndrange()](a, b)
+
+    groups = dpnp.asnumpy(a).reshape(-1, WORK_GROUP_SIZE)
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b), np.repeat(groups[:, 3], WORK_GROUP_SIZE)
+    )
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core.compiler import make_kernel_attributes
+from numba_dpex.core.descriptor import dpex_kernel_target
+from numba_dpex.core.exceptions import (
+    UnmatchedRequiredWorkGroupSizeError,
+    UnsupportedSubGroupSizeError,
+)
+from numba_dpex.core.kernel_interface.spirv_kernel import SpirvKernel
+
+N = 1024
+
+
+def _scale(a):
+    i = dpex.get_global_id(0)
+    a[i] = 2 * a[i]
+
+
+def _compile_to_llvm(kernel_attributes):
+    kernel = SpirvKernel(_scale, _scale.__name__)
+    argtypes = [
+        dpex_kernel_target.typing_context.resolve_argument_type(
+            dpnp.zeros(N, dtype=dpnp.float32)
+        )
+    ]
+    kernel.compile(
+        args=argtypes,
+        debug=False,
+        compile_flags=None,
+        target_ctx=dpex_kernel_target.target_context,
+        typing_ctx=dpex_kernel_target.typing_context,
+        kernel_attributes=kernel_attributes,
+    )
+    return kernel.llvm_module.replace(" ", "")
+
+
+def test_kernel_attributes_metadata():
+    llvm_module = _compile_to_llvm(
+        make_kernel_attributes(
+            reqd_work_group_size=64,
+            work_group_size_hint=(16, 4),
+            reqd_sub_group_size=16,
+        )
+    )
+
+    assert "!reqd_work_group_size" in llvm_module
+    assert "!{i3264,i321,i321}" in llvm_module
+    assert "!work_group_size_hint" in llvm_module
+    assert "!{i3216,i324,i321}" in llvm_module
+    assert "!intel_reqd_sub_group_size" in llvm_module
+    assert "!{i3216}" in llvm_module
+
+
+def test_no_kernel_attributes_metadata():
+    llvm_module = _compile_to_llvm(None)
+
+    assert "reqd_work_group_size" not in llvm_module
+    assert "intel_reqd_sub_group_size" not in llvm_module
+
+
+@pytest.mark.parametrize(
+    "attributes",
+    [
+        {"reqd_work_group_size": 0},
+        {"reqd_work_group_size": (1, 2, 3, 4)},
+        {"work_group_size_hint": (8, 8.0)},
+        {"reqd_sub_group_size": -8},
+    ],
+)
+def test_invalid_kernel_attributes(attributes):
+    with pytest.raises(ValueError):
+        make_kernel_attributes(**attributes)
+
+
+def test_reqd_work_group_size():
+    kernel = dpex.kernel(reqd_work_group_size=64)(_scale)
+    a = dpnp.ones(N, dtype=dpnp.float32)
+
+    kernel[dpex.NdRange(dpex.Range(N), dpex.Range(64))](a)
+    assert np.all(dpnp.asnumpy(a) == 2)
+
+    # Without a local range the global range has to be divisible by the
+    # required work-group size.
+    kernel[dpex.Range(N)](a)
+    assert np.all(dpnp.asnumpy(a) == 4)
+
+
+def test_unmatched_reqd_work_group_size():
+    kernel = dpex.kernel(reqd_work_group_size=64)(_scale)
+    a = dpnp.ones(N, dtype=dpnp.float32)
+
+    with pytest.raises(UnmatchedRequiredWorkGroupSizeError):
+        kernel[dpex.NdRange(dpex.Range(N), dpex.Range(32))](a)
+
+
+def test_reqd_sub_group_size():
+    a = dpnp.ones(N, dtype=dpnp.float32)
+    sub_group_sizes = a.sycl_device.sub_group_sizes
+
+    kernel = dpex.kernel(reqd_sub_group_size=max(sub_group_sizes))(_scale)
+    kernel[dpex.NdRange(dpex.Range(N), dpex.Range(64))](a)
+    assert np.all(dpnp.asnumpy(a) == 2)
+
+    unsupported = max(sub_group_sizes) * 2
+    kernel = dpex.kernel(reqd_sub_group_size=unsupported)(_scale)
+    with pytest.raises(UnsupportedSubGroupSizeError):
+        kernel[dpex.NdRange(dpex.Range(N), dpex.Range(64))](a)
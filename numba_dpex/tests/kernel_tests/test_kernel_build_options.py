@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core.compiler import make_compile_flags
+from numba_dpex.core.descriptor import dpex_kernel_target
+from numba_dpex.core.kernel_interface.spirv_kernel import SpirvKernel
+
+N = 1024
+
+
+def _kernel(a, b):
+    i = dpex.get_global_id(0)
+    b[i] = math.exp(a[i]) * a[i] + a[i]
+
+
+def _compile_to_llvm(compile_flags):
+    kernel = SpirvKernel(_kernel, _kernel.__name__)
+    args = [dpnp.zeros(N, dtype=dpnp.float32) for _ in range(2)]
+    argtypes = [
+        dpex_kernel_target.typing_context.resolve_argument_type(arg)
+        for arg in args
+    ]
+    kernel.compile(
+        args=argtypes,
+        debug=False,
+        compile_flags=compile_flags,
+        target_ctx=dpex_kernel_target.target_context,
+        typing_ctx=dpex_kernel_target.typing_context,
+    )
+    return kernel.llvm_module
+
+
+def test_default_is_strict():
+    llvm_module = _compile_to_llvm(None)
+
+    assert "fmul fast" not in llvm_module
+    assert "native_exp" not in llvm_module
+
+
+def test_fastmath():
+    llvm_module = _compile_to_llvm(make_compile_flags(fastmath=True))
+    assert "fmul fast" in llvm_module
+
+    llvm_module = _compile_to_llvm(make_compile_flags(fastmath={"contract"}))
+    assert "fmul contract" in llvm_module
+
+
+@pytest.mark.parametrize("math_builtins", ["native", "half"])
+def test_math_builtins(math_builtins):
+    llvm_module = _compile_to_llvm(
+        make_compile_flags(math_builtins=math_builtins)
+    )
+    assert f"{math_builtins}_exp" in llvm_module
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"fastmath": {"unknown"}}, {"math_builtins": "fast"}, {"opt_level": 4}],
+)
+def test_invalid_compile_flags(options):
+    with pytest.raises(ValueError):
+        make_compile_flags(**options)
+
+
+def test_kernel_build_options():
+    strict = dpex.kernel(_kernel)
+    relaxed = dpex.kernel(
+        fastmath=True,
+        math_builtins="native",
+        build_options="-cl-fast-relaxed-math -cl-mad-enable",
+    )(_kernel)
+
+    a = dpnp.asarray(np.random.rand(N).astype(np.float32))
+    b_strict = dpnp.zeros(N, dtype=dpnp.float32)
+    b_relaxed = dpnp.zeros(N, dtype=dpnp.float32)
+    strict[dpex.Range(N)](a, b_strict)
+    relaxed[dpex.Range(N)](a, b_relaxed)
+
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b_relaxed), dpnp.asnumpy(b_strict), rtol=1e-3
+    )
+    assert strict.compile_flags != relaxed.compile_flags
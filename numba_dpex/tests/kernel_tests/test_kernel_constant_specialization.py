@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Literal
+
+import dpnp
+import numpy as np
+import pytest
+from numba.core.errors import NumbaPerformanceWarning
+
+import numba_dpex as dpex
+from numba_dpex.core.exceptions import InvalidKernelConstantError
+
+N = 64
+
+
+def _convolve(a, w):
+    """Reference valid-mode 2D convolution (correlation) of a with w."""
+    k = w.shape[0]
+    m = a.shape[0] - k + 1
+    b = np.zeros((m, m), dtype=a.dtype)
+    for di in range(k):
+        for dj in range(k):
+            b += w[di, dj] * a[di : di + m, dj : dj + m]
+    return b
+
+
+@dpex.kernel(constants=("k",))
+def convolve(a, w, b, k):
+    i = dpex.get_global_id(0)
+    j = dpex.get_global_id(1)
+    acc = 0.0
+    for di in range(k):
+        for dj in range(k):
+            acc += w[di, dj] * a[i + di, j + dj]
+    b[i, j] = acc
+
+
+@pytest.mark.parametrize("k", [3, 5])
+def test_constant_argument(k):
+    a = np.random.rand(N, N).astype(np.float32)
+    w = np.random.rand(k, k).astype(np.float32)
+    m = N - k + 1
+    b = dpnp.zeros((m, m), dtype=dpnp.float32)
+
+    convolve[dpex.Range(m, m)](dpnp.asarray(a), dpnp.asarray(w), b, k)
+
+    np.testing.assert_allclose(dpnp.asnumpy(b), _convolve(a, w), rtol=1e-5)
+
+
+def test_constant_argument_cached_per_value():
+    a = dpnp.ones((N, N), dtype=dpnp.float32)
+    w = dpnp.ones((5, 5), dtype=dpnp.float32)
+    b = dpnp.zeros((N - 2, N - 2), dtype=dpnp.float32)
+
+    convolve[dpex.Range(N - 2, N - 2)](a, w, b, 3)
+    cache_hits = convolve.cache_hits
+    convolve[dpex.Range(N - 2, N - 2)](a, w, b, 3)
+    assert convolve.cache_hits == cache_hits + 1
+    assert np.all(dpnp.asnumpy(b) == 9)
+
+    # A new value launches another variant of the kernel.
+    convolve[dpex.Range(N - 4, N - 4)](a, w, b, 5)
+    assert np.all(dpnp.asnumpy(b)[: N - 4, : N - 4] == 25)
+
+
+def test_literal_annotation():
+    @dpex.kernel
+    def scale(a, factor: Literal[2, 4]):
+        i = dpex.get_global_id(0)
+        a[i] = a[i] * factor
+
+    a = dpnp.ones(N, dtype=dpnp.int64)
+    scale[dpex.Range(N)](a, 4)
+    assert np.all(dpnp.asnumpy(a) == 4)
+
+    with pytest.raises(InvalidKernelConstantError):
+        scale[dpex.Range(N)](a, 3)
+
+
+def test_specialize_shapes():
+    @dpex.kernel(specialize_shapes=True)
+    def row_sum(a, b):
+        i = dpex.get_global_id(0)
+        acc = 0
+        for j in range(a.shape[1]):
+            acc += a[i, j]
+        b[i] = acc
+
+    for cols in (4, 8):
+        a = dpnp.ones((N, cols), dtype=dpnp.int64)
+        b = dpnp.zeros(N, dtype=dpnp.int64)
+        row_sum[dpex.Range(N)](a, b)
+        assert np.all(dpnp.asnumpy(b) == cols)
+
+
+def test_max_specializations():
+    @dpex.kernel(constants=("c",), max_specializations=2)
+    def fill(a, c):
+        i = dpex.get_global_id(0)
+        a[i] = c
+
+    a = dpnp.zeros(N, dtype=dpnp.int64)
+    for c in (1, 2):
+        fill[dpex.Range(N)](a, c)
+        assert np.all(dpnp.asnumpy(a) == c)
+
+    # A third value is launched with the generic kernel.
+    with pytest.warns(NumbaPerformanceWarning):
+        fill[dpex.Range(N)](a, 3)
+    assert np.all(dpnp.asnumpy(a) == 3)
+
+
+def test_unknown_constant():
+    with pytest.raises(ValueError):
+
+        @dpex.kernel(constants=("n",))
+        def kernel(a):
+            a[0] = 0
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpctl
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core.descriptor import dpex_kernel_target
+from numba_dpex.core.types import LocalAccessorType
+
+N = 1024
+
+skip_no_local_accessor = pytest.mark.skipif(
+    not hasattr(dpctl, "LocalAccessor"),
+    reason="dpctl does not support local accessor kernel arguments",
+)
+
+
+@dpex.kernel
+def reverse_work_groups(a, b, slm):
+    """Reverses the elements of every work-group through local memory."""
+    i = dpex.get_global_id(0)
+    lid = dpex.get_local_id(0)
+    lsize = dpex.get_local_size(0)
+
+    slm[lid] = a[i]
+    dpex.barrier(dpex.LOCAL_MEM_FENCE)
+    b[i] = slm[lsize - 1 - lid]
+
+
+@skip_no_local_accessor
+@pytest.mark.parametrize("dtype", [dpnp.int32, dpnp.float64])
+def test_local_accessor_reused_across_work_group_sizes(dtype):
+    a = dpnp.arange(N, dtype=dtype)
+    b = dpnp.zeros(N, dtype=dtype)
+
+    cache_hits = reverse_work_groups.cache_hits
+    work_group_sizes = [16, 32, 64]
+    for lsize in work_group_sizes:
+        reverse_work_groups[dpex.NdRange(dpex.Range(N), dpex.Range(lsize))](
+            a, b, dpex.LocalAccessor(lsize, dtype)
+        )
+        expected = dpnp.asnumpy(a).reshape(-1, lsize)[:, ::-1].reshape(-1)
+        assert np.array_equal(dpnp.asnumpy(b), expected)
+
+    # The kernel is only compiled for the first work-group size
+    assert (
+        reverse_work_groups.cache_hits >= cache_hits + len(work_group_sizes) - 1
+    )
+
+
+@skip_no_local_accessor
+def test_local_accessor_2d():
+    @dpex.kernel
+    def transpose_tiles(a, b, tile):
+        i = dpex.get_global_id(0)
+        j = dpex.get_global_id(1)
+        li = dpex.get_local_id(0)
+        lj = dpex.get_local_id(1)
+
+        tile[li, lj] = a[i, j]
+        dpex.barrier(dpex.LOCAL_MEM_FENCE)
+        b[i, j] = tile[lj, li]
+
+    a = dpnp.arange(64 * 64, dtype=dpnp.float32).reshape(64, 64)
+    b = dpnp.zeros_like(a)
+    transpose_tiles[dpex.NdRange(dpex.Range(64, 64), dpex.Range(8, 8))](
+        a, b, dpex.LocalAccessor((8, 8), dpnp.float32)
+    )
+
+    tiles = dpnp.asnumpy(a).reshape(8, 8, 8, 8)
+    expected = tiles.swapaxes(1, 3).reshape(64, 64)
+    assert np.array_equal(dpnp.asnumpy(b), expected)
+
+
+def test_local_accessor_type():
+    acc = dpex.LocalAccessor((4, 8), np.float32)
+    ty = dpex_kernel_target.typing_context.resolve_argument_type(acc)
+
+    assert isinstance(ty, LocalAccessorType)
+    assert ty.ndim == 2
+    assert ty.layout == "C"
+    assert ty == LocalAccessorType(2, dpex.float32)
+    assert acc.size == 32
+
+
+@pytest.mark.parametrize(
+    "shape, dtype",
+    [((), np.int32), ((1, 2, 3, 4), np.int32), ((0,), np.int32), (4, bool)],
+)
+def test_local_accessor_invalid(shape, dtype):
+    with pytest.raises(TypeError):
+        dpex.LocalAccessor(shape, dtype)
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.core.descriptor import dpex_kernel_target
+from numba_dpex.core.kernel_interface.spirv_kernel import SpirvKernel
+
+N = 64
+K = 16
+
+
+def row_sum_unroll_4(a, b):
+    i = dpex.get_global_id(0)
+    acc = 0
+    for j in dpex.unroll(range(K), 4):
+        acc += a[i, j]
+    b[i] = acc
+
+
+def row_sum_unroll_full(a, b):
+    i = dpex.get_global_id(0)
+    acc = 0
+    for j in dpex.unroll(range(K)):
+        acc += a[i, j]
+    b[i] = acc
+
+
+def row_sum_no_unroll(a, b):
+    i = dpex.get_global_id(0)
+    acc = 0
+    for j in dpex.unroll(range(a.shape[1]), factor=1):
+        acc += a[i, j]
+    b[i] = acc
+
+
+def _get_llvm_module(pyfunc):
+    kernel = SpirvKernel(pyfunc, pyfunc.__name__)
+    args = [
+        dpnp.zeros((N, K), dtype=dpnp.int64),
+        dpnp.zeros(N, dtype=dpnp.int64),
+    ]
+    argtypes = [
+        dpex_kernel_target.typing_context.resolve_argument_type(arg)
+        for arg in args
+    ]
+    kernel.compile(
+        args=argtypes,
+        debug=False,
+        compile_flags=None,
+        target_ctx=dpex_kernel_target.target_context,
+        typing_ctx=dpex_kernel_target.typing_context,
+    )
+    return kernel.llvm_module
+
+
+@pytest.mark.parametrize(
+    "pyfunc, expected_metadata",
+    [
+        (row_sum_unroll_4, '!{ !"llvm.loop.unroll.count", i32 4 }'),
+        (row_sum_unroll_full, '!{ !"llvm.loop.unroll.full" }'),
+        (row_sum_no_unroll, '!{ !"llvm.loop.unroll.disable" }'),
+    ],
+)
+def test_unroll_metadata(pyfunc, expected_metadata):
+    llvm_module = _get_llvm_module(pyfunc)
+
+    assert "!llvm.loop" in llvm_module
+    assert expected_metadata.replace(" ", "") in llvm_module.replace(" ", "")
+
+
+@pytest.mark.parametrize(
+    "pyfunc", [row_sum_unroll_4, row_sum_unroll_full, row_sum_no_unroll]
+)
+def test_unroll(pyfunc):
+    a = dpnp.arange(N * K, dtype=dpnp.int64).reshape(N, K)
+    b = dpnp.zeros(N, dtype=dpnp.int64)
+
+    dpex.kernel(pyfunc)[dpex.Range(N)](a, b)
+
+    assert np.array_equal(dpnp.asnumpy(b), dpnp.asnumpy(a).sum(axis=1))
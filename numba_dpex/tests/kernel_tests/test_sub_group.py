@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import operator
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+
+N = 256
+WORK_GROUP_SIZE = 64
+
+list_of_dtypes = [dpnp.int32, dpnp.int64, dpnp.float32, dpnp.float64]
+
+
+@pytest.fixture(params=list_of_dtypes)
+def input_arrays(request):
+    a = dpnp.asarray((np.arange(N) * 7) % 13, dtype=request.param)
+    b = dpnp.zeros(N, dtype=request.param)
+    return a, b
+
+
+def _ndrange():
+    return dpex.NdRange(dpex.Range(N), dpex.Range(WORK_GROUP_SIZE))
+
+
+def _get_sub_group_ids():
+    """Returns the sub-group local id, the sub-group size and the sub-group id
+    of every work-item.
+    """
+
+    @dpex.kernel
+    def sub_group_ids(sg_local_id, sg_size, sg_id, num_sgs):
+        i = dpex.get_global_id(0)
+        sg_local_id[i] = dpex.sub_group.get_local_id()
+        sg_size[i] = dpex.sub_group.get_local_size()
+        sg_id[i] = dpex.sub_group.get_group_id()
+        num_sgs[i] = dpex.sub_group.get_num_groups()
+
+    ids = [dpnp.zeros(N, dtype=dpnp.int64) for _ in range(4)]
+    sub_group_ids[_ndrange()](*ids)
+
+    return [dpnp.asnumpy(x) for x in ids]
+
+
+def test_sub_group_ids():
+    sg_local_id, sg_size, sg_id, num_sgs = _get_sub_group_ids()
+    size = sg_size[0]
+
+    assert WORK_GROUP_SIZE % size == 0
+    assert np.all(sg_size == size)
+    assert np.all(num_sgs == WORK_GROUP_SIZE // size)
+    local_id = np.arange(N) % WORK_GROUP_SIZE
+    assert np.all(sg_id * size + sg_local_id == local_id)
+
+
+def test_sub_group_shuffle_xor(input_arrays):
+    @dpex.kernel
+    def shuffle_xor(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.sub_group.shuffle_xor(a[i], 1)
+
+    a, b = input_arrays
+    shuffle_xor[_ndrange()](a, b)
+
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b), dpnp.asnumpy(a)[np.arange(N) ^ 1]
+    )
+
+
+def test_sub_group_shuffle(input_arrays):
+    @dpex.kernel
+    def shuffle(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.sub_group.shuffle(a[i], 0)
+
+    a, b = input_arrays
+    shuffle[_ndrange()](a, b)
+
+    sg_local_id = _get_sub_group_ids()[0]
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b), dpnp.asnumpy(a)[np.arange(N) - sg_local_id]
+    )
+
+
+@pytest.mark.parametrize("direction", ["down", "up"])
+def test_sub_group_shuffle_down_up(input_arrays, direction):
+    @dpex.kernel
+    def shuffle_down(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.sub_group.shuffle_down(a[i], 1)
+
+    @dpex.kernel
+    def shuffle_up(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.sub_group.shuffle_up(a[i], 1)
+
+    a, b = input_arrays
+    if direction == "down":
+        shuffle_down[_ndrange()](a, b)
+    else:
+        shuffle_up[_ndrange()](a, b)
+
+    sg_local_id, sg_size, _, _ = _get_sub_group_ids()
+    idx = np.arange(N)
+    # Only compare the work-items that read a value inside their sub-group.
+    if direction == "down":
+        defined = sg_local_id + 1 < sg_size
+        src = idx + 1
+    else:
+        defined = sg_local_id >= 1
+        src = idx - 1
+
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b)[defined], dpnp.asnumpy(a)[src[defined]]
+    )
+
+
+@pytest.mark.parametrize(
+    "op, np_op",
+    [(operator.add, np.add), (min, np.minimum), (max, np.maximum)],
+)
+def test_sub_group_reduce(input_arrays, op, np_op):
+    @dpex.kernel
+    def sub_group_reduce(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.sub_group.reduce(a[i], op)
+
+    a, b = input_arrays
+    sub_group_reduce[_ndrange()](a, b)
+
+    size = _get_sub_group_ids()[1][0]
+    sub_groups = dpnp.asnumpy(a).reshape(-1, size)
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b), np.repeat(np_op.reduce(sub_groups, axis=1), size)
+    )
+
+
+def test_sub_group_inclusive_scan(input_arrays):
+    @dpex.kernel
+    def sub_group_inclusive_scan(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.sub_group.inclusive_scan(a[i], operator.add)
+
+    a, b = input_arrays
+    sub_group_inclusive_scan[_ndrange()](a, b)
+
+    size = _get_sub_group_ids()[1][0]
+    sub_groups = dpnp.asnumpy(a).reshape(-1, size)
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b), np.cumsum(sub_groups, axis=1).reshape(-1)
+    )
+
+
+def test_sub_group_broadcast(input_arrays):
+    @dpex.kernel
+    def sub_group_broadcast(a, b):
+        i = dpex.get_global_id(0)
+        b[i] = dpex.sub_group.broadcast(a[i], 1)
+
+    a, b = input_arrays
+    sub_group_broadcast[_ndrange()](a, b)
+
+    size = _get_sub_group_ids()[1][0]
+    sub_groups = dpnp.asnumpy(a).reshape(-1, size)
+    np.testing.assert_allclose(
+        dpnp.asnumpy(b), np.repeat(sub_groups[:, 1], size)
+    )
@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2023 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy as np
+import pytest
+from numba.core.errors import TypingError
+
+import numba_dpex as dpex
+from numba_dpex.core.descriptor import dpex_kernel_target
+from numba_dpex.core.kernel_interface.spirv_kernel import SpirvKernel
+
+N = 1024
+
+list_of_dtypes = [dpnp.int32, dpnp.int64, dpnp.float32, dpnp.float64]
+
+
+@pytest.mark.parametrize("dtype", list_of_dtypes)
+@pytest.mark.parametrize("width", [2, 3, 4, 8, 16])
+def test_vector_copy(dtype, width):
+    @dpex.kernel
+    def vcopy(a, b):
+        i = dpex.get_global_id(0)
+        dpex.vstore(b, i, dpex.vload(a, i, width))
+
+    n = N // width * width
+    a = dpnp.arange(n, dtype=dtype)
+    b = dpnp.zeros(n, dtype=dtype)
+    vcopy[dpex.Range(n // width)](a, b)
+
+    assert np.array_equal(dpnp.asnumpy(b), dpnp.asnumpy(a))
+
+
+@pytest.mark.parametrize("dtype", list_of_dtypes)
+def test_vector_store_width_3_keeps_next_element(dtype):
+    @dpex.kernel
+    def vcopy3(a, b):
+        i = dpex.get_global_id(0)
+        dpex.vstore(b, i, dpex.vload(a, i, 3))
+
+    a = dpnp.arange(3, dtype=dtype)
+    b = dpnp.full(4, 7, dtype=dtype)
+    vcopy3[dpex.Range(1)](a, b)
+
+    b_np = dpnp.asnumpy(b)
+    assert np.array_equal(b_np[:3], dpnp.asnumpy(a))
+    assert b_np[3] == 7
+
+
+def test_vector_axpy():
+    @dpex.kernel
+    def axpy(alpha, x, y):
+        i = dpex.get_global_id(0)
+        x0, x1, x2, x3 = dpex.vload(x, i, 4)
+        y0, y1, y2, y3 = dpex.vload(y, i, 4)
+        dpex.vstore(
+            y,
+            i,
+            (
+                alpha * x0 + y0,
+                alpha * x1 + y1,
+                alpha * x2 + y2,
+                alpha * x3 + y3,
+            ),
+        )
+
+    x = dpnp.asarray(np.random.rand(N).astype(np.float32))
+    y = dpnp.asarray(np.random.rand(N).astype(np.float32))
+    expected = 2.0 * dpnp.asnumpy(x) + dpnp.asnumpy(y)
+    axpy[dpex.Range(N // 4)](np.float32(2.0), x, y)
+
+    np.testing.assert_allclose(dpnp.asnumpy(y), expected, rtol=1e-6)
+
+
+def test_vector_2d():
+    @dpex.kernel
+    def scale_rows(a, b):
+        i = dpex.get_global_id(0)
+        j = dpex.get_global_id(1)
+        v0, v1 = dpex.vload(a, (i, j), 2)
+        dpex.vstore(b, (i, j), (v0 * i, v1 * i))
+
+    a = dpnp.ones((16, 32), dtype=dpnp.float64)
+    b = dpnp.zeros_like(a)
+    scale_rows[dpex.Range(16, 16)](a, b)
+
+    expected = np.arange(16, dtype=np.float64)[:, None] * np.ones((16, 32))
+    assert np.array_equal(dpnp.asnumpy(b), expected)
+
+
+def test_vector_load_llvm_ir():
+    def vcopy(a, b):
+        i = dpex.get_global_id(0)
+        dpex.vstore(b, i, dpex.vload(a, i, 4))
+
+    kernel = SpirvKernel(vcopy, vcopy.__name__)
+    args = [dpnp.zeros(N, dtype=dpnp.float32) for _ in range(2)]
+    argtypes = [
+        dpex_kernel_target.typing_context.resolve_argument_type(arg)
+        for arg in args
+    ]
+    kernel.compile(
+        args=argtypes,
+        debug=False,
+        compile_flags=None,
+        target_ctx=dpex_kernel_target.target_context,
+        typing_ctx=dpex_kernel_target.typing_context,
+    )
+
+    assert "load <4 x float>" in kernel.llvm_module
+    assert "store <4 x float>" in kernel.llvm_module
+
+
+def test_vector_width_3_llvm_ir():
+    def vcopy(a, b):
+        i = dpex.get_global_id(0)
+        dpex.vstore(b, i, dpex.vload(a, i, 3))
+
+    kernel = SpirvKernel(vcopy, vcopy.__name__)
+    args = [dpnp.zeros(N, dtype=dpnp.float32) for _ in range(2)]
+    argtypes = [
+        dpex_kernel_target.typing_context.resolve_argument_type(arg)
+        for arg in args
+    ]
+    kernel.compile(
+        args=argtypes,
+        debug=False,
+        compile_flags=None,
+        target_ctx=dpex_kernel_target.target_context,
+        typing_ctx=dpex_kernel_target.typing_context,
+    )
+
+    assert "<3 x float>" not in kernel.llvm_module
+
+
+def test_vector_load_non_contiguous():
+    @dpex.kernel
+    def vcopy(a, b):
+        i = dpex.get_global_id(0)
+        dpex.vstore(b, i, dpex.vload(a, i, 4))
+
+    a = dpnp.arange(2 * N, dtype=dpnp.float32)[::2]
+    b = dpnp.zeros(N, dtype=dpnp.float32)
+    with pytest.raises(TypingError):
+        vcopy[dpex.Range(N // 4)](a, b)
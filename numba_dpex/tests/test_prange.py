@@ -231,3 +231,95 @@ def test_two_consecutive_prange_2d():
 
     np.testing.assert_equal(c.asnumpy(), np.ones((n, n), dtype=np.int32) * 2)
     np.testing.assert_equal(d.asnumpy(), np.zeros((n, n), dtype=np.int32))
+
+
+def test_prange_non_zero_start():
+    @dpjit
+    def f(a, b):
+        n = a.shape[0]
+        for i in prange(1, n - 1):
+            b[i] = a[i - 1] + a[i] + a[i + 1]
+        return
+
+    device = dpctl.select_default_device()
+
+    n = 10
+    a = dpnp.arange(n, dtype=dpnp.int64, device=device)
+    b = dpnp.zeros(n, dtype=dpnp.int64, device=device)
+
+    f(a, b)
+
+    na = np.arange(n, dtype=np.int64)
+    expected = np.zeros(n, dtype=np.int64)
+    expected[1:-1] = na[:-2] + na[1:-1] + na[2:]
+    np.testing.assert_equal(b.asnumpy(), expected)
+
+
+@pytest.mark.parametrize("start", [0, 3, 10, 12])
+def test_prange_variable_start(start):
+    @dpjit
+    def f(a, start):
+        for i in prange(start, a.shape[0]):
+            a[i] = i
+        return
+
+    device = dpctl.select_default_device()
+
+    n = 10
+    a = dpnp.zeros(n, dtype=dpnp.int64, device=device)
+
+    f(a, start)
+
+    expected = np.zeros(n, dtype=np.int64)
+    expected[start:] = np.arange(start, n)
+    np.testing.assert_equal(a.asnumpy(), expected)
+
+
+@pytest.mark.parametrize("shape", [(2, 3, 4, 5), (3, 1, 2, 4), (1, 1, 7, 1)])
+def test_prange_collapsed_4d(shape):
+    @dpjit
+    def f(a, b):
+        for i in prange(a.shape[0]):
+            for j in prange(a.shape[1]):
+                for k in prange(a.shape[2]):
+                    for m in prange(a.shape[3]):
+                        b[i, j, k, m] = a[i, j, k, m] * 10
+        return
+
+    device = dpctl.select_default_device()
+
+    a = dpnp.arange(np.prod(shape), dtype=dpnp.int64, device=device)
+    a = a.reshape(shape)
+    b = dpnp.zeros(shape, dtype=dpnp.int64, device=device)
+
+    f(a, b)
+
+    expected = np.arange(np.prod(shape), dtype=np.int64).reshape(shape) * 10
+    np.testing.assert_equal(b.asnumpy(), expected)
+
+
+def test_prange_collapsed_5d():
+    @dpjit
+    def f(a, b):
+        for i in prange(a.shape[0]):
+            for j in prange(a.shape[1]):
+                for k in prange(a.shape[2]):
+                    for m in prange(a.shape[3]):
+                        for n in prange(1, a.shape[4]):
+                            b[i, j, k, m, n] = a[i, j, k, m, n] + 1
+        return
+
+    device = dpctl.select_default_device()
+
+    shape = (2, 3, 2, 4, 5)
+    a = dpnp.arange(np.prod(shape), dtype=dpnp.int64, device=device)
+    a = a.reshape(shape)
+    b = dpnp.zeros(shape, dtype=dpnp.int64, device=device)
+
+    f(a, b)
+
+    expected = np.zeros(shape, dtype=np.int64)
+    expected[..., 1:] = (
+        np.arange(np.prod(shape), dtype=np.int64).reshape(shape)[..., 1:] + 1
+    )
+    np.testing.assert_equal(b.asnumpy(), expected)